@@ -0,0 +1,197 @@
+"""Counts DOM traversal while extracting a Fighter from an already parsed athlete page.
+
+Compares the per-getter searches the scraper used to make, where every getter walked the tree
+itself, with the single pass that fills an AthletePage.
+
+    $ python benchmarks/bench_athlete_extract.py [athlete_page.html ...]
+
+Without arguments the test fixtures are used.
+"""
+
+import statistics
+import sys
+import time
+
+from pathlib import Path
+
+from bs4 import BeautifulSoup, Tag
+
+from ufc_data_scraper.scraper import FighterScraper, fighter_scraper as scraper_module
+from ufc_data_scraper.utils import create_soup
+
+FIXTURES_DIR = (
+    Path(__file__).resolve().parent.parent / "src/ufc_data_scraper/tests/fixtures"
+)
+
+
+class TraversalCounter:
+    """Counts find/find_all calls and nodes they visit by wrapping Tag.descendants."""
+
+    def __init__(self) -> None:
+        self.searches = 0
+        self.nodes = 0
+        self._descendants = Tag.descendants
+
+    def __enter__(self) -> "TraversalCounter":
+        counter = self
+        descendants = self._descendants
+
+        def counting_descendants(tag):
+            counter.searches += 1
+            for node in descendants.fget(tag):
+                counter.nodes += 1
+                yield node
+
+        Tag.descendants = property(counting_descendants)
+
+        return self
+
+    def __exit__(self, *exc) -> None:
+        Tag.descendants = self._descendants
+
+
+def legacy_bio_field(soup: BeautifulSoup, label: str) -> str | None:
+    for target in soup.find_all("div", class_="c-bio__field"):
+        if target.find("div", class_="c-bio__label").get_text() == label:
+            return target.find("div", class_="c-bio__text").get_text()
+
+    return None
+
+
+def legacy_stat_block(target: Tag) -> tuple:
+    title = target.find("title")
+    values = target.find_all("dd", "c-overlap__stats-value")
+
+    return title and title.get_text(), [value.get_text() for value in values]
+
+
+def legacy_stat_bar(target: Tag) -> list:
+    return [
+        group.find("div", class_="c-stat-3bar__value").get_text()
+        for group in target.find_all("div", class_="c-stat-3bar__group")
+    ]
+
+
+def legacy_result_set(result_set: list[Tag], dict_keys: list[str]) -> dict:
+    stats = {}
+
+    for result in result_set:
+        for target in result.find_all("div", class_="c-stat-compare__group"):
+            label = target.find("div", class_="c-stat-compare__label")
+            if not label:
+                break
+
+            label = label.get_text().strip()
+            if label in dict_keys:
+                value = target.find("div", class_="c-stat-compare__number")
+                stats[label] = value and value.get_text()
+
+    return stats
+
+
+def legacy_extract(soup: BeautifulSoup) -> dict:
+    """Makes the searches the getters made before AthletePage, in the order scrape_fighter called them.
+
+    Returns:
+        dict: Raw text of every field.
+    """
+
+    page = {}
+
+    page["masthead"] = soup.find("div", class_="l-masthead__headline")
+    stats_section = soup.find_all("div", class_="c-stat-3bar c-stat-3bar--no-chart")
+    stats_targets = soup.find_all(
+        "div", class_="stats-records stats-records--two-column"
+    )
+
+    page["ranking"] = soup.find_all("p", class_="hero-profile__tag")
+    page["hometown"] = legacy_bio_field(soup, "Place of Birth")
+    page["name"] = soup.find("h1", class_="hero-profile__name")
+    page["nickname"] = soup.find("p", class_="hero-profile__nickname")
+    page["status"] = legacy_bio_field(soup, "Status")
+    page["weight_class"] = soup.find("p", class_="hero-profile__division-title")
+    page["tags"] = soup.find_all("p", class_="hero-profile__tag")
+    page["gym"] = legacy_bio_field(soup, "Trains at")
+    page["fighting_style"] = legacy_bio_field(soup, "Fighting style")
+    page["record"] = soup.find("p", class_="hero-profile__division-body")
+
+    page["average_fight_time"] = [
+        (
+            target.find("div", class_="c-stat-compare__label").get_text(),
+            target.find("div", class_="c-stat-compare__number").get_text(),
+        )
+        for target in soup.find_all(
+            "div", class_="c-stat-compare__group c-stat-compare__group-2"
+        )
+    ]
+    page["stat_bars"] = [legacy_stat_bar(target) for target in stats_section]
+    page["physical_stats"] = [
+        legacy_bio_field(soup, label)
+        for label in ("Age", "Height", "Weight", "Reach", "Leg reach")
+    ]
+
+    svg = soup.find("svg", class_="c-stat-body__svg")
+    if svg is not None:
+        page["strike_targets"] = [group.find_all("text") for group in svg.find_all("g")]
+
+    page["stat_blocks"] = [legacy_stat_block(target) for target in stats_targets]
+    page["striking"] = legacy_result_set(
+        stats_targets,
+        [
+            "Sig. Str. Landed",
+            "Sig. Str. Absorbed",
+            "Sig. Str. Defense",
+            "Knockdown Avg",
+        ],
+    )
+    page["grappling"] = legacy_result_set(
+        stats_targets, ["Takedown avg", "Takedown Defense", "Submission avg"]
+    )
+
+    return page
+
+
+def measure(extract, runs: int) -> tuple[int, int, float]:
+    """Counts traversal of one extraction and times runs of it.
+
+    Returns:
+        tuple: (searches, nodes, median milliseconds)
+    """
+
+    with TraversalCounter() as counter:
+        extract()
+
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        extract()
+        timings.append(time.perf_counter() - start)
+
+    return counter.searches, counter.nodes, statistics.median(timings) * 1000
+
+
+def main(paths: list[Path], runs: int = 50) -> None:
+    columns = f"{'searches':>9} {'nodes':>7} {'ms':>7}"
+    print(f"{'':<36} {'per-getter':^25}   {'single pass':^25}")
+    print(f"{'page':<36} {columns}   {columns}")
+
+    for path in paths:
+        fighter_scraper = FighterScraper("", {}, {}, parser_backend="html.parser")
+
+        # Parse once up front, only extraction is measured
+        soup = create_soup(
+            path.read_bytes(), "html.parser", scraper_module.ATHLETE_REGIONS
+        )
+        fighter_scraper._soup = soup
+
+        results = [
+            "{:>9} {:>7} {:>7.2f}".format(*measure(extract, runs))
+            for extract in (lambda: legacy_extract(soup), fighter_scraper._read_soup)
+        ]
+        print(f"{path.name:<36} {results[0]}   {results[1]}")
+
+
+if __name__ == "__main__":
+    paths = [Path(path) for path in sys.argv[1:]]
+    paths = paths or sorted(FIXTURES_DIR.glob("athlete_*.html"))
+    main([path for path in paths if "search_results" not in path.name])
@@ -0,0 +1,84 @@
+"""Measures parse time and peak memory of athlete pages, whole page against the scoped regions and the tokenizer.
+
+    $ python benchmarks/bench_athlete_parse.py [athlete_page.html ...]
+
+Without arguments the test fixtures are used.
+"""
+
+import statistics
+import sys
+import time
+import tracemalloc
+
+from pathlib import Path
+
+from ufc_data_scraper.scraper.athlete_page import AthletePageParser
+from ufc_data_scraper.scraper.fighter_scraper import ATHLETE_REGIONS
+from ufc_data_scraper.utils import available_parser_backends, create_soup
+
+FIXTURES_DIR = (
+    Path(__file__).resolve().parent.parent / "src/ufc_data_scraper/tests/fixtures"
+)
+
+
+def tokenize(content: bytes) -> None:
+    parser = AthletePageParser()
+    parser.feed(content)
+    parser.close()
+
+
+def parse(content: bytes, backend: str, regions: tuple) -> None:
+    if backend == "tokenizer":
+        tokenize(content)
+    else:
+        create_soup(content, backend, regions)
+
+
+def measure_parse(content: bytes, backend: str, regions: tuple) -> tuple[float, int]:
+    """Parses content once.
+
+    Returns:
+        tuple: (parse time in seconds, peak traced memory in bytes)
+    """
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    parse(content, backend, regions)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed, peak
+
+
+def main(paths: list[Path], runs: int = 20) -> None:
+    pages = [path.read_bytes() for path in paths]
+    page_kb = statistics.mean(len(page) for page in pages) / 1024
+
+    print(f"pages: {len(pages)}, mean size {page_kb:.0f} KB, {runs} runs each")
+    print(f"{'backend':<12} {'mode':<7} {'median ms':>10} {'peak KB':>9}")
+
+    for backend in available_parser_backends() + ("tokenizer",):
+        for mode, regions in (("page", None), ("scoped", ATHLETE_REGIONS)):
+            if backend in ("selectolax", "tokenizer") and regions is None:
+                continue
+
+            # Time without tracing, tracemalloc slows allocation heavy parsing down
+            timings = []
+            for _ in range(runs):
+                for page in pages:
+                    start = time.perf_counter()
+                    parse(page, backend, regions)
+                    timings.append(time.perf_counter() - start)
+
+            peaks = [measure_parse(page, backend, regions)[1] for page in pages]
+
+            print(
+                f"{backend:<12} {mode:<7} {statistics.median(timings) * 1000:>10.2f}"
+                f" {statistics.mean(peaks) / 1024:>9.0f}"
+            )
+
+
+if __name__ == "__main__":
+    paths = [Path(path) for path in sys.argv[1:]]
+    main(paths or sorted(FIXTURES_DIR.glob("athlete_*.html")))
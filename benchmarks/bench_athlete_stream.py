@@ -0,0 +1,72 @@
+"""Measures bytes read and time to result of streamed athlete pages against full downloads.
+
+    $ python benchmarks/bench_athlete_stream.py [athlete_page.html ...]
+
+Without arguments the test fixtures are used. Pages are served from memory, so time only covers reading
+and parsing, on the network every byte not read is also a byte not transferred.
+"""
+
+import statistics
+import sys
+import time
+
+from pathlib import Path
+
+from ufc_data_scraper.scraper import FighterScraper
+from ufc_data_scraper.transport import Transport
+
+from ufc_data_scraper.tests.fakes import FakeSession
+
+FIXTURES_DIR = (
+    Path(__file__).resolve().parent.parent / "src/ufc_data_scraper/tests/fixtures"
+)
+
+
+def scrape(page: bytes, extractor: str) -> tuple[float, int]:
+    """Scrapes page once.
+
+    Returns:
+        tuple: (time to result in seconds, bytes read)
+    """
+
+    fighter_url = "http://www.ufc.com/athlete/benchmark"
+    session = FakeSession()
+    session.add_page(fighter_url, page)
+
+    fighter_scraper = FighterScraper(
+        fighter_url, {}, {}, transport=Transport(session), parser_backend="html.parser"
+    )
+
+    start = time.perf_counter()
+    fighter_scraper.scrape_fighter(extractor=extractor)
+    elapsed = time.perf_counter() - start
+
+    bytes_read = session.streams[0].bytes_read if session.streams else len(page)
+
+    return elapsed, bytes_read
+
+
+def main(paths: list[Path], runs: int = 20) -> None:
+    print(f"{'page':<32} {'extractor':<10} {'median ms':>10} {'KB read':>8}")
+
+    for path in paths:
+        page = path.read_bytes()
+        for extractor in ("soup", "tokenizer", "stream"):
+            results = [scrape(page, extractor) for _ in range(runs)]
+            timings = [elapsed for elapsed, _ in results]
+
+            print(
+                f"{path.name:<32} {extractor:<10}"
+                f" {statistics.median(timings) * 1000:>10.2f}"
+                f" {results[0][1] / 1024:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    paths = [Path(path) for path in sys.argv[1:]]
+    fixtures = [
+        path
+        for path in sorted(FIXTURES_DIR.glob("athlete_*.html"))
+        if path.name != "athlete_search_results.html"
+    ]
+    main(paths or fixtures)
@@ -0,0 +1,47 @@
+"""Measures correcting a card's worth of fighter urls with the compiled correction index.
+
+$ python benchmarks/bench_corrections.py
+"""
+
+import statistics
+import time
+
+from ufc_data_scraper.scraper.fighter_scraper import set_fighter_url
+from ufc_data_scraper.utils import CorrectionIndex, compile_correction_index
+from ufc_data_scraper.utils.utils import _load_bundled_map
+
+# Roughly the fighters on a full card
+CARD_SIZE = 28
+
+
+def main(runs: int = 200) -> None:
+    incorrect_urls = _load_bundled_map("incorrect_urls.json")
+    fighter_urls = [
+        url.replace("http://", "https://").title()
+        for url in list(incorrect_urls)[: CARD_SIZE // 2]
+    ]
+    fighter_urls += [
+        f"https://www.ufc.com/athlete/Fighter-{i}"
+        for i in range(CARD_SIZE - len(fighter_urls))
+    ]
+
+    start = time.perf_counter()
+    CorrectionIndex.compile(incorrect_urls, "urls")
+    print(
+        f"compile {len(incorrect_urls)} corrections: {(time.perf_counter() - start) * 1000:.2f} ms"
+    )
+
+    compile_correction_index(incorrect_urls, "urls")
+
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        for fighter_url in fighter_urls:
+            set_fighter_url(fighter_url, incorrect_urls)
+        timings.append(time.perf_counter() - start)
+
+    print(f"correct {CARD_SIZE} urls: {statistics.median(timings) * 1e6:.1f} us median")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Measures `import ufc_data_scraper` in a fresh interpreter and counts network calls made while importing.
+
+$ python benchmarks/bench_import.py
+"""
+
+import statistics
+import subprocess
+import sys
+
+IMPORT_PROBE = """
+import sys
+import time
+
+network_events = []
+
+
+def audit(event, args):
+    if event in ("socket.connect", "socket.getaddrinfo", "socket.sendto", "socket.sendmsg"):
+        network_events.append(event)
+
+
+sys.addaudithook(audit)
+
+start = time.perf_counter()
+import ufc_data_scraper
+elapsed = time.perf_counter() - start
+
+print(len(network_events), elapsed)
+"""
+
+
+def measure_import() -> tuple[int, float]:
+    """Imports the package in a fresh interpreter.
+
+    Returns:
+        tuple: (network calls, import time in seconds)
+    """
+
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_PROBE],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+
+    network_calls, elapsed = output.split()
+
+    return int(network_calls), float(elapsed)
+
+
+def main(runs: int = 10) -> None:
+    results = [measure_import() for _ in range(runs)]
+
+    network_calls = max(calls for calls, _ in results)
+    timings = [elapsed * 1000 for _, elapsed in results]
+
+    print(f"runs:           {runs}")
+    print(f"network calls:  {network_calls}")
+    print(f"import median:  {statistics.median(timings):.1f} ms")
+    print(f"import max:     {max(timings):.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
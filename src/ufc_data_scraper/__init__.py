@@ -3,4 +3,10 @@ from ufc_data_scraper.ufc_scraper import (
     scrape_fighter_url,
     scrape_event_url,
     scrape_event_fmid,
+    scrape_events,
+    get_event_fmid_async,
+    scrape_fighter_url_async,
+    scrape_event_url_async,
+    scrape_event_fmid_async,
 )
+from ufc_data_scraper.client import UFCClient, get_client, set_client
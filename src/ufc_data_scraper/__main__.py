@@ -0,0 +1,70 @@
+import argparse
+
+from ufc_data_scraper.cache import (
+    FmidIndex,
+    KnownEvents,
+    get_fmid_index,
+    get_known_events,
+)
+from ufc_data_scraper.scraper import build_fmid_index, sync_event_urls
+
+
+def _build_fmid_index(args: argparse.Namespace) -> None:
+    """Runs build-fmid-index command."""
+
+    fmid_index = FmidIndex(args.path) if args.path else get_fmid_index()
+
+    added = build_fmid_index(
+        fmid_index,
+        start_page=args.start_page,
+        max_pages=args.max_pages,
+        max_workers=args.max_workers,
+    )
+
+    print(f"Added {added} events, {len(fmid_index)} indexed in {fmid_index.path}")
+
+
+def _sync_events(args: argparse.Namespace) -> None:
+    """Runs sync-events command, printing every new event url."""
+
+    known_events = KnownEvents(args.path) if args.path else get_known_events()
+
+    for event_url in sync_event_urls(known_events):
+        print(event_url)
+
+
+def main(argv: list[str] = None) -> None:
+    """Command line entry point.
+
+    >>> python -m ufc_data_scraper build-fmid-index --max-pages 5
+    >>> python -m ufc_data_scraper sync-events
+    """
+
+    parser = argparse.ArgumentParser(prog="ufc_data_scraper")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build_index = commands.add_parser(
+        "build-fmid-index", help="Index event urls with their FMID."
+    )
+    build_index.add_argument(
+        "--path", help="Index file. Defaults to the cache directory."
+    )
+    build_index.add_argument("--start-page", type=int, default=0)
+    build_index.add_argument("--max-pages", type=int, default=None)
+    build_index.add_argument("--max-workers", type=int, default=8)
+    build_index.set_defaults(handler=_build_fmid_index)
+
+    sync_events = commands.add_parser(
+        "sync-events", help="Print event urls added since the last sync."
+    )
+    sync_events.add_argument(
+        "--path", help="Known events file. Defaults to the cache directory."
+    )
+    sync_events.set_defaults(handler=_sync_events)
+
+    args = parser.parse_args(argv)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+from .event_cache import EventCache, get_event_cache, set_event_cache
+from .fighter_cache import FighterCache, get_fighter_cache, set_fighter_cache
+from .fmid_index import FmidIndex, get_fmid_index, set_fmid_index
+from .known_events import KnownEvents, get_known_events, set_known_events
+from .url_map import (
+    UrlMap,
+    get_fighter_url_map,
+    set_fighter_url_map,
+    get_redirect_map,
+    set_redirect_map,
+)
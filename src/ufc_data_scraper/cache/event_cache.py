@@ -0,0 +1,180 @@
+import contextlib
+import os
+import pickle
+import tempfile
+import threading
+import time
+
+from pathlib import Path
+
+from ufc_data_scraper.data_models import Event
+
+# Events with these statuses never change again.
+FINAL_STATUSES = ("Final",)
+
+
+class EventCache:
+    def __init__(self, ttl: int = 5 * 60, directory: str | Path = None) -> None:
+        """Cache of scraped Event objects keyed by FMID.
+
+        Final events are kept for good, upcoming and live events expire after ttl seconds.
+
+        Args:
+            ttl (int, optional): Seconds upcoming and live events are served from cache. Defaults to 5 minutes.
+            directory (str | Path, optional): If supplied final events are also stored on disk and reused between runs.
+
+        >>> event_cache = EventCache(ttl=60, directory="~/.cache/ufc_data_scraper/events")
+        >>> event_scraper = EventScraper(1124, event_cache=event_cache)
+        """
+
+        self.ttl = ttl
+        self.directory = directory and Path(directory).expanduser()
+        if self.directory:
+            with contextlib.suppress(OSError):
+                self.directory.mkdir(parents=True, exist_ok=True)
+
+        self._events = {}
+        self._lock = threading.Lock()
+
+    def _get_path(self, event_fmid: int) -> Path:
+        return self.directory / f"event_{int(event_fmid)}.pickle"
+
+    def _load(self, event_fmid: int) -> Event | None:
+        """Loads final event from disk.
+
+        Args:
+            event_fmid (int): Event FMID.
+
+        Returns:
+            Event: Stored event or None if it is not stored.
+        """
+
+        if not self.directory:
+            return None
+
+        try:
+            with open(self._get_path(event_fmid), "rb") as event_file:
+                return pickle.load(event_file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return None
+
+    def _save(self, event: Event) -> None:
+        """Stores final event on disk.
+
+        A directory that cannot be written is skipped, the event is kept in memory for the rest of the process.
+
+        Args:
+            event (Event): Event to store.
+        """
+
+        try:
+            file_handle, temp_path = tempfile.mkstemp(dir=self.directory)
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(file_handle, "wb") as temp_file:
+                pickle.dump(event, temp_file)
+            os.replace(temp_path, self._get_path(event.fmid))
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_path)
+
+    def is_final(self, event: Event) -> bool:
+        """Checks whether event can no longer change.
+
+        Args:
+            event (Event): Event to check.
+
+        Returns:
+            bool: Whether event is final.
+        """
+
+        return event.status in FINAL_STATUSES
+
+    def get(self, event_fmid: int) -> Event | None:
+        """Returns cached event if it has not expired.
+
+        Args:
+            event_fmid (int): Event FMID.
+
+        Returns:
+            Event: Cached event or None on a miss.
+        """
+
+        with self._lock:
+            cached = self._events.get(event_fmid)
+
+        if cached:
+            event, expires_at = cached
+            if expires_at is None or time.monotonic() < expires_at:
+                return event
+
+            with self._lock:
+                self._events.pop(event_fmid, None)
+
+            return None
+
+        event = self._load(event_fmid)
+        if event:
+            with self._lock:
+                self._events[event_fmid] = (event, None)
+
+        return event
+
+    def set(self, event: Event) -> None:
+        """Caches event, final events never expire.
+
+        Args:
+            event (Event): Scraped event.
+        """
+
+        if self.is_final(event):
+            expires_at = None
+            if self.directory:
+                self._save(event)
+        else:
+            expires_at = time.monotonic() + self.ttl
+
+        with self._lock:
+            self._events[event.fmid] = (event, expires_at)
+
+    def clear(self) -> None:
+        """Removes every cached event from memory."""
+
+        with self._lock:
+            self._events.clear()
+
+
+_default_event_cache = None
+_default_event_cache_lock = threading.Lock()
+
+
+def get_event_cache() -> EventCache:
+    """Returns the process wide event cache, creating it on first use.
+
+    Returns:
+        EventCache: Shared event cache.
+    """
+
+    global _default_event_cache
+
+    if _default_event_cache is None:
+        with _default_event_cache_lock:
+            if _default_event_cache is None:
+                _default_event_cache = EventCache()
+
+    return _default_event_cache
+
+
+def set_event_cache(event_cache: EventCache) -> None:
+    """Replaces the process wide event cache.
+
+    Args:
+        event_cache (EventCache): Event cache used by every EventScraper.
+    """
+
+    global _default_event_cache
+
+    with _default_event_cache_lock:
+        _default_event_cache = event_cache
@@ -0,0 +1,133 @@
+import threading
+import time
+
+from collections import OrderedDict
+
+from ufc_data_scraper.data_models import Fighter
+
+# Seconds a fighter is served from cache, keyed by Fighter.status.
+DEFAULT_TTLS = {
+    "Active": 24 * 60 * 60,
+    "Not Fighting": 7 * 24 * 60 * 60,
+    "Retired": 30 * 24 * 60 * 60,
+}
+DEFAULT_TTL = 24 * 60 * 60
+
+
+class FighterCache:
+    def __init__(
+        self, max_size: int = 2048, ttls: dict = None, default_ttl: int = DEFAULT_TTL
+    ) -> None:
+        """Least recently used cache of scraped Fighter objects keyed by canonical fighter url.
+
+        Args:
+            max_size (int, optional): Maximum number of fighters kept. Defaults to 2048.
+            ttls (dict, optional): Overrides for DEFAULT_TTLS, keyed by fighter status.
+            default_ttl (int, optional): Seconds fighters with any other status are kept. Defaults to 1 day.
+
+        >>> fighter_cache = FighterCache(max_size=512, ttls={"Active": 60 * 60})
+        >>> event_scraper = EventScraper(1124, fighter_cache=fighter_cache)
+        """
+
+        self.max_size = max_size
+        self.ttls = DEFAULT_TTLS | (ttls or {})
+        self.default_ttl = default_ttl
+
+        self._fighters = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._fighters)
+
+    def get_ttl(self, fighter: Fighter) -> int:
+        """Returns seconds fighter is kept, depending on their status.
+
+        Args:
+            fighter (Fighter): Scraped fighter.
+
+        Returns:
+            int: Time to live in seconds.
+        """
+
+        return self.ttls.get(fighter.status, self.default_ttl)
+
+    def get(self, fighter_url: str) -> Fighter | None:
+        """Returns cached fighter if it has not expired.
+
+        Args:
+            fighter_url (str): Canonical fighter url.
+
+        Returns:
+            Fighter: Cached fighter or None on a miss.
+        """
+
+        with self._lock:
+            cached = self._fighters.get(fighter_url)
+            if not cached:
+                return None
+
+            fighter, expires_at = cached
+            if time.monotonic() >= expires_at:
+                del self._fighters[fighter_url]
+                return None
+
+            self._fighters.move_to_end(fighter_url)
+
+            return fighter
+
+    def set(self, fighter_url: str, fighter: Fighter) -> None:
+        """Caches fighter, evicting the least recently used fighters once full.
+
+        Args:
+            fighter_url (str): Canonical fighter url.
+            fighter (Fighter): Scraped fighter.
+        """
+
+        expires_at = time.monotonic() + self.get_ttl(fighter)
+
+        with self._lock:
+            self._fighters[fighter_url] = (fighter, expires_at)
+            self._fighters.move_to_end(fighter_url)
+
+            while len(self._fighters) > self.max_size:
+                self._fighters.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes every cached fighter."""
+
+        with self._lock:
+            self._fighters.clear()
+
+
+_default_fighter_cache = None
+_default_fighter_cache_lock = threading.Lock()
+
+
+def get_fighter_cache() -> FighterCache:
+    """Returns the process wide fighter cache, creating it on first use.
+
+    Returns:
+        FighterCache: Shared fighter cache.
+    """
+
+    global _default_fighter_cache
+
+    if _default_fighter_cache is None:
+        with _default_fighter_cache_lock:
+            if _default_fighter_cache is None:
+                _default_fighter_cache = FighterCache()
+
+    return _default_fighter_cache
+
+
+def set_fighter_cache(fighter_cache: FighterCache) -> None:
+    """Replaces the process wide fighter cache.
+
+    Args:
+        fighter_cache (FighterCache): Fighter cache shared by every EventScraper.
+    """
+
+    global _default_fighter_cache
+
+    with _default_fighter_cache_lock:
+        _default_fighter_cache = fighter_cache
@@ -0,0 +1,117 @@
+import threading
+
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from ufc_data_scraper.transport.json_store import JsonStore
+
+from ufc_data_scraper.utils import get_cache_dir
+
+
+def normalize_event_url(event_url: str) -> str:
+    """Returns index key for an event url, scheme, query and trailing slashes are ignored.
+
+    Args:
+        event_url (str): UFC Event page.
+
+    Returns:
+        str: Normalized event url.
+        >>> "www.ufc.com/event/ufc-282"
+    """
+
+    parts = urlsplit(event_url.strip())
+
+    return f"{parts.netloc.lower()}{parts.path.rstrip('/').lower()}"
+
+
+class FmidIndex(JsonStore):
+    def __init__(self, path: str | Path = None) -> None:
+        """Persistent index of event urls and their FMID.
+
+        Args:
+            path (str | Path, optional): JSON file the index is stored in. Defaults to in memory only.
+
+        >>> fmid_index = FmidIndex("~/.cache/ufc_data_scraper/fmid_index.json")
+        >>> fmid = get_event_fmid("https://www.ufc.com/event/ufc-282", fmid_index=fmid_index)
+        """
+
+        super().__init__(path)
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __contains__(self, event_url: str) -> bool:
+        return normalize_event_url(event_url) in self._load()
+
+    def get(self, event_url: str) -> int | None:
+        """Returns indexed FMID for event url.
+
+        Args:
+            event_url (str): UFC Event page.
+
+        Returns:
+            int: Event FMID or None if the url is not indexed.
+        """
+
+        return self._load().get(normalize_event_url(event_url))
+
+    def set(self, event_url: str, event_fmid: int) -> None:
+        """Adds event url to the index and writes it to disk.
+
+        Args:
+            event_url (str): UFC Event page.
+            event_fmid (int): Event FMID.
+        """
+
+        self.update({event_url: event_fmid})
+
+    def update(self, event_fmids: dict[str, int]) -> None:
+        """Adds several event urls to the index with a single write.
+
+        Args:
+            event_fmids (dict[str, int]): Event urls with their FMID.
+        """
+
+        if not event_fmids:
+            return
+
+        with self._lock:
+            fmids = self._load()
+            for event_url, event_fmid in event_fmids.items():
+                fmids[normalize_event_url(event_url)] = int(event_fmid)
+
+            self._save()
+
+
+_default_fmid_index = None
+_default_fmid_index_lock = threading.Lock()
+
+
+def get_fmid_index() -> FmidIndex:
+    """Returns the process wide FMID index, stored in the cache directory.
+
+    Returns:
+        FmidIndex: Shared FMID index.
+    """
+
+    global _default_fmid_index
+
+    if _default_fmid_index is None:
+        with _default_fmid_index_lock:
+            if _default_fmid_index is None:
+                _default_fmid_index = FmidIndex(get_cache_dir() / "fmid_index.json")
+
+    return _default_fmid_index
+
+
+def set_fmid_index(fmid_index: FmidIndex) -> None:
+    """Replaces the process wide FMID index.
+
+    Args:
+        fmid_index (FmidIndex): FMID index used by get_event_fmid.
+    """
+
+    global _default_fmid_index
+
+    with _default_fmid_index_lock:
+        _default_fmid_index = fmid_index
@@ -0,0 +1,87 @@
+import threading
+
+from pathlib import Path
+
+from ufc_data_scraper.transport.json_store import JsonStore
+
+from ufc_data_scraper.cache.fmid_index import normalize_event_url
+from ufc_data_scraper.utils import get_cache_dir
+
+
+class KnownEvents(JsonStore):
+    def __init__(self, path: str | Path = None) -> None:
+        """Persistent set of event urls already seen on the events listing.
+
+        Args:
+            path (str | Path, optional): JSON file the urls are stored in. Defaults to in memory only.
+
+        >>> known_events = KnownEvents("~/.cache/ufc_data_scraper/known_events.json")
+        >>> new_event_urls = sync_event_urls(known_events)
+        """
+
+        super().__init__(path)
+
+    def _empty(self) -> set:
+        return set()
+
+    def _decode(self, data: list) -> set:
+        return set(data)
+
+    def _encode(self) -> list:
+        return sorted(self._data)
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __contains__(self, event_url: str) -> bool:
+        return normalize_event_url(event_url) in self._load()
+
+    def add(self, event_urls: list[str]) -> None:
+        """Marks event urls as known and writes them to disk.
+
+        Args:
+            event_urls (list[str]): Event urls.
+        """
+
+        if not event_urls:
+            return
+
+        with self._lock:
+            self._load().update(normalize_event_url(url) for url in event_urls)
+            self._save()
+
+
+_default_known_events = None
+_default_known_events_lock = threading.Lock()
+
+
+def get_known_events() -> KnownEvents:
+    """Returns the process wide known events, stored in the cache directory.
+
+    Returns:
+        KnownEvents: Shared known events.
+    """
+
+    global _default_known_events
+
+    if _default_known_events is None:
+        with _default_known_events_lock:
+            if _default_known_events is None:
+                _default_known_events = KnownEvents(
+                    get_cache_dir() / "known_events.json"
+                )
+
+    return _default_known_events
+
+
+def set_known_events(known_events: KnownEvents) -> None:
+    """Replaces the process wide known events.
+
+    Args:
+        known_events (KnownEvents): Known events used by sync_event_urls.
+    """
+
+    global _default_known_events
+
+    with _default_known_events_lock:
+        _default_known_events = known_events
@@ -0,0 +1,72 @@
+import threading
+
+from ufc_data_scraper.transport import UrlMap
+
+from ufc_data_scraper.utils import get_cache_dir
+
+_default_fighter_url_map = None
+_default_fighter_url_map_lock = threading.Lock()
+
+
+def get_fighter_url_map() -> UrlMap:
+    """Returns the process wide map of guessed fighter urls and their canonical url, stored in the cache directory.
+
+    Returns:
+        UrlMap: Shared fighter url map.
+    """
+
+    global _default_fighter_url_map
+
+    if _default_fighter_url_map is None:
+        with _default_fighter_url_map_lock:
+            if _default_fighter_url_map is None:
+                _default_fighter_url_map = UrlMap(get_cache_dir() / "fighter_urls.json")
+
+    return _default_fighter_url_map
+
+
+def set_fighter_url_map(url_map: UrlMap) -> None:
+    """Replaces the process wide fighter url map.
+
+    Args:
+        url_map (UrlMap): Fighter url map used by FighterScraper.
+    """
+
+    global _default_fighter_url_map
+
+    with _default_fighter_url_map_lock:
+        _default_fighter_url_map = url_map
+
+
+_default_redirect_map = None
+_default_redirect_map_lock = threading.Lock()
+
+
+def get_redirect_map() -> UrlMap:
+    """Returns the process wide map of redirected urls and where they lead, stored in the cache directory.
+
+    Returns:
+        UrlMap: Shared redirect map.
+    """
+
+    global _default_redirect_map
+
+    if _default_redirect_map is None:
+        with _default_redirect_map_lock:
+            if _default_redirect_map is None:
+                _default_redirect_map = UrlMap(get_cache_dir() / "redirects.json")
+
+    return _default_redirect_map
+
+
+def set_redirect_map(url_map: UrlMap) -> None:
+    """Replaces the process wide redirect map.
+
+    Args:
+        url_map (UrlMap): Redirect map used by the shared transport.
+    """
+
+    global _default_redirect_map
+
+    with _default_redirect_map_lock:
+        _default_redirect_map = url_map
@@ -0,0 +1,427 @@
+import asyncio
+import concurrent.futures
+import threading
+import requests
+
+from ufc_data_scraper.scraper import (
+    get_event_fmid,
+    get_event_fmid_async,
+    FighterScraper,
+    EventScraper,
+    scrape_event_batch,
+)
+
+from ufc_data_scraper.transport import (
+    Transport,
+    UrlMap,
+    create_transport,
+    get_transport,
+    MAX_WORKERS,
+)
+
+from ufc_data_scraper.cache import (
+    EventCache,
+    FighterCache,
+    FmidIndex,
+    get_event_cache,
+    get_fighter_cache,
+    get_fmid_index,
+    get_fighter_url_map,
+)
+
+from ufc_data_scraper.utils import (
+    ConcurrencyLimiter,
+    CorrectionIndex,
+    Metrics,
+    compile_correction_index,
+    get_fighter_limiter,
+    get_incorrect_names,
+    get_incorrect_urls,
+    get_metrics,
+)
+
+from ufc_data_scraper.data_models import Fighter, Event
+
+
+class UFCClient:
+    def __init__(
+        self,
+        transport: Transport | requests.Session = None,
+        max_workers: int = None,
+        event_cache: EventCache = None,
+        fighter_cache: FighterCache = None,
+        fmid_index: FmidIndex = None,
+        url_map: UrlMap = None,
+        metrics: Metrics = None,
+        limiter: ConcurrencyLimiter = None,
+    ) -> None:
+        """Long lived scraping client, owns connections, a worker pool, correction maps and caches.
+
+        Anything not supplied is shared with the rest of the process and looked up on every use, so
+        set_transport, set_event_cache and friends also apply to the client. A supplied transport is
+        closed with the client. The worker pool is started on first use and reused by every scrape
+        until the client is closed.
+
+        Args:
+            transport (Transport | requests.Session, optional): Transport to request with, a plain session is wrapped with create_transport. Defaults to the shared transport.
+            max_workers (int, optional): Size of the worker pool. Defaults to one worker per fighter the limiter allows, plus one.
+            event_cache (EventCache, optional): Cache of scraped events. Defaults to the shared event cache.
+            fighter_cache (FighterCache, optional): Cache of scraped fighters. Defaults to the shared fighter cache.
+            fmid_index (FmidIndex, optional): Event urls with their FMID. Defaults to the shared index.
+            url_map (UrlMap, optional): Guessed fighter urls with their canonical url. Defaults to the shared map.
+            metrics (Metrics, optional): Metrics stage timings are recorded to. Defaults to the shared metrics.
+            limiter (ConcurrencyLimiter, optional): Adaptive limit of fighters scraped at once. Defaults to the shared limiter.
+
+        >>> with UFCClient(Transport()) as client:
+        ...     event = client.scrape_event_fmid(1124)
+        ...     events = client.scrape_events([1125, 1126])
+        """
+
+        if isinstance(transport, requests.Session):
+            transport = create_transport(transport)
+
+        self._transport = transport
+        self._max_workers = max_workers
+        self._event_cache = event_cache
+        self._fighter_cache = fighter_cache
+        self._fmid_index = fmid_index
+        self._url_map = url_map
+        self._metrics = metrics
+        self._limiter = limiter
+        self._executor = None
+        self._incorrect_urls = None
+        self._incorrect_names = None
+        self._closed = False
+        self._lock = threading.Lock()
+        # Held while correction maps download, so it must not be the lock guarding the executor
+        self._corrections_lock = threading.Lock()
+
+    @property
+    def transport(self) -> Transport:
+        return self._transport or get_transport()
+
+    @property
+    def event_cache(self) -> EventCache:
+        if self._event_cache is not None:
+            return self._event_cache
+
+        return get_event_cache()
+
+    @property
+    def fighter_cache(self) -> FighterCache:
+        if self._fighter_cache is not None:
+            return self._fighter_cache
+
+        return get_fighter_cache()
+
+    @property
+    def fmid_index(self) -> FmidIndex:
+        if self._fmid_index is not None:
+            return self._fmid_index
+
+        return get_fmid_index()
+
+    @property
+    def url_map(self) -> UrlMap:
+        if self._url_map is not None:
+            return self._url_map
+
+        return get_fighter_url_map()
+
+    @property
+    def metrics(self) -> Metrics:
+        return self._metrics or get_metrics()
+
+    @property
+    def limiter(self) -> ConcurrencyLimiter:
+        return self._limiter or get_fighter_limiter()
+
+    @property
+    def executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Worker pool shared by every scrape, started on first use."""
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("UFCClient is closed")
+
+            if self._executor is None:
+                max_workers = self._max_workers or self.limiter.maximum + 1
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="ufc-client"
+                )
+
+            return self._executor
+
+    def load_corrections(self) -> tuple[CorrectionIndex, CorrectionIndex]:
+        """Retrieves and compiles the correction maps, once per client.
+
+        Returns:
+            tuple[CorrectionIndex, CorrectionIndex]: Url corrections and name corrections.
+        """
+
+        with self._corrections_lock:
+            if self._incorrect_urls is None:
+                self._incorrect_urls = compile_correction_index(
+                    get_incorrect_urls(self.transport), "urls"
+                )
+                self._incorrect_names = compile_correction_index(
+                    get_incorrect_names(self.transport), "names"
+                )
+
+            return self._incorrect_urls, self._incorrect_names
+
+    def _create_event_scraper(
+        self, event_fmid: int, event_url: str = None
+    ) -> EventScraper:
+        """Creates event scraper sharing the client's state.
+
+        Correction maps not loaded yet are left to the scraper, which retrieves them alongside the event data.
+
+        Args:
+            event_fmid (int): Event FMID.
+            event_url (str, optional): Event page url. Defaults to None.
+
+        Returns:
+            EventScraper: Event scraper.
+        """
+
+        return EventScraper(
+            event_fmid,
+            event_url,
+            transport=self.transport,
+            event_cache=self.event_cache,
+            fighter_cache=self.fighter_cache,
+            metrics=self.metrics,
+            executor=self.executor,
+            incorrect_urls=self._incorrect_urls,
+            incorrect_names=self._incorrect_names,
+            url_map=self.url_map,
+            limiter=self.limiter,
+        )
+
+    def _create_fighter_scraper(self, fighter_url: str) -> FighterScraper:
+        """Creates fighter scraper sharing the client's state.
+
+        Args:
+            fighter_url (str): UFC fighter page url.
+
+        Returns:
+            FighterScraper: Fighter scraper.
+        """
+
+        incorrect_urls, incorrect_names = self.load_corrections()
+
+        return FighterScraper(
+            fighter_url,
+            incorrect_urls,
+            incorrect_names,
+            transport=self.transport,
+            url_map=self.url_map,
+        )
+
+    def get_event_fmid(self, event_url: str) -> int:
+        """Returns FMID of event page.
+
+        Args:
+            event_url (str): UFC Event page.
+
+        Returns:
+            int: Event FMID.
+        """
+
+        return get_event_fmid(event_url, self.transport, self.fmid_index)
+
+    def scrape_fighter(self, fighter_url: str) -> Fighter:
+        """Scrapes fighter page.
+
+        Args:
+            fighter_url (str): UFC Fighter page.
+
+        Returns:
+            Fighter: Fighter object.
+        """
+
+        return self._create_fighter_scraper(fighter_url).scrape_fighter()
+
+    def scrape_event_fmid(self, event_fmid: int, refresh: bool = False) -> Event:
+        """Scrapes event fmid.
+
+        Args:
+            event_fmid (int): UFC Event FMID.
+            refresh (bool, optional): Skip the event cache and query the api. Defaults to False.
+
+        Returns:
+            Event: Event object.
+        """
+
+        event = self._create_event_scraper(event_fmid).scrape_event(refresh)
+        # The scrape retrieved the correction maps, compile them once for every later scrape
+        self.load_corrections()
+
+        return event
+
+    def scrape_event_url(self, event_url: str, refresh: bool = False) -> Event:
+        """Scrapes event page.
+
+        Args:
+            event_url (str): UFC Event page.
+            refresh (bool, optional): Skip the event cache and query the api. Defaults to False.
+
+        Returns:
+            Event: Event object.
+        """
+
+        event_fmid = self.get_event_fmid(event_url)
+
+        event = self._create_event_scraper(event_fmid, event_url).scrape_event(refresh)
+        self.load_corrections()
+
+        return event
+
+    def scrape_events(
+        self, event_fmids: list[int], max_workers: int = None
+    ) -> list[Event]:
+        """Scrapes several event fmids at once, fighters booked on more than one event are scraped once.
+
+        Args:
+            event_fmids (list[int]): UFC Event FMIDs.
+            max_workers (int, optional): Size of a dedicated worker pool for this batch. Defaults to the client's pool.
+
+        Returns:
+            list[Event]: Event objects in the same order as event_fmids.
+        """
+
+        event_scrapers = [
+            self._create_event_scraper(event_fmid) for event_fmid in event_fmids
+        ]
+
+        if max_workers is not None:
+            events = scrape_event_batch(event_scrapers, max_workers)
+        else:
+            events = scrape_event_batch(event_scrapers, executor=self.executor)
+        self.load_corrections()
+
+        return events
+
+    async def get_event_fmid_async(self, event_url: str) -> int:
+        """Returns FMID of event page as a coroutine.
+
+        Args:
+            event_url (str): UFC Event page.
+
+        Returns:
+            int: Event FMID.
+        """
+
+        return await get_event_fmid_async(event_url, self.transport, self.fmid_index)
+
+    async def scrape_fighter_async(self, fighter_url: str) -> Fighter:
+        """Scrapes fighter page as a coroutine.
+
+        Args:
+            fighter_url (str): UFC Fighter page.
+
+        Returns:
+            Fighter: Fighter object.
+        """
+
+        # Retrieving the correction maps blocks, keep it off the event loop
+        await asyncio.to_thread(self.load_corrections)
+        fighter_scraper = self._create_fighter_scraper(fighter_url)
+
+        return await fighter_scraper.scrape_fighter_async()
+
+    async def scrape_event_fmid_async(
+        self, event_fmid: int, concurrency: int = MAX_WORKERS, refresh: bool = False
+    ) -> Event:
+        """Scrapes event fmid as a coroutine.
+
+        Args:
+            event_fmid (int): UFC Event FMID.
+            concurrency (int, optional): Maximum number of fighters scraped at once. Defaults to MAX_WORKERS.
+            refresh (bool, optional): Skip the event cache and query the api. Defaults to False.
+
+        Returns:
+            Event: Event object.
+        """
+
+        event_scraper = self._create_event_scraper(event_fmid)
+
+        event = await event_scraper.scrape_event_async(concurrency, refresh)
+        await asyncio.to_thread(self.load_corrections)
+
+        return event
+
+    async def scrape_event_url_async(
+        self, event_url: str, concurrency: int = MAX_WORKERS, refresh: bool = False
+    ) -> Event:
+        """Scrapes event page as a coroutine.
+
+        Args:
+            event_url (str): UFC Event page.
+            concurrency (int, optional): Maximum number of fighters scraped at once. Defaults to MAX_WORKERS.
+            refresh (bool, optional): Skip the event cache and query the api. Defaults to False.
+
+        Returns:
+            Event: Event object.
+        """
+
+        event_fmid = await self.get_event_fmid_async(event_url)
+        event_scraper = self._create_event_scraper(event_fmid, event_url)
+
+        event = await event_scraper.scrape_event_async(concurrency, refresh)
+        await asyncio.to_thread(self.load_corrections)
+
+        return event
+
+    def close(self) -> None:
+        """Stops the worker pool and closes a supplied transport."""
+
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if self._transport is not None:
+            self._transport.close()
+
+    def __enter__(self) -> "UFCClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def get_client() -> UFCClient:
+    """Returns the process wide client used by the ufc_scraper functions, creating it on first use.
+
+    Returns:
+        UFCClient: Shared client.
+    """
+
+    global _default_client
+
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = UFCClient()
+
+    return _default_client
+
+
+def set_client(client: UFCClient) -> None:
+    """Replaces the process wide client used by the ufc_scraper functions.
+
+    Args:
+        client (UFCClient): Client to scrape with.
+    """
+
+    global _default_client
+
+    with _default_client_lock:
+        _default_client = client
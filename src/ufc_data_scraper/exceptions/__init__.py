@@ -1 +1,7 @@
-from .exceptions import MissingEventData, InvalidEventUrl, MissingEventFMID
+from .exceptions import (
+    MissingEventData,
+    InvalidEventUrl,
+    MissingEventFMID,
+    FighterNotFound,
+    CircuitOpen,
+)
@@ -1,3 +1,6 @@
+import requests
+
+
 class MissingEventData(Exception):
     def __init__(self, message="Could not retrieve event data."):
         self.message = message
@@ -14,3 +17,15 @@ class MissingEventFMID(Exception):
     def __init__(self, message=f"FMID could not be found."):
         self.message = message
         super().__init__(self.message)
+
+
+class FighterNotFound(Exception):
+    def __init__(self, message="Fighter page could not be found."):
+        self.message = message
+        super().__init__(self.message)
+
+
+class CircuitOpen(requests.exceptions.RequestException):
+    def __init__(self, message="Host is failing, request was not sent."):
+        self.message = message
+        super().__init__(self.message)
@@ -1,3 +1,9 @@
-from ufc_data_scraper.scraper.fmid_finder import get_event_fmid
-from ufc_data_scraper.scraper.event_scraper import EventScraper
+from ufc_data_scraper.scraper.fmid_finder import (
+    get_event_fmid,
+    get_event_fmid_async,
+    build_fmid_index,
+    iter_event_urls,
+    sync_event_urls,
+)
+from ufc_data_scraper.scraper.event_scraper import EventScraper, scrape_event_batch
 from ufc_data_scraper.scraper.fighter_scraper import FighterScraper
@@ -0,0 +1,348 @@
+import codecs
+
+from html.parser import HTMLParser
+
+# Elements BeautifulSoup treats as empty, html.parser never reports them closed
+VOID_ELEMENTS = {
+    "area",
+    "base",
+    "basefont",
+    "bgsound",
+    "br",
+    "col",
+    "command",
+    "embed",
+    "frame",
+    "hr",
+    "image",
+    "img",
+    "input",
+    "isindex",
+    "keygen",
+    "link",
+    "menuitem",
+    "meta",
+    "nextid",
+    "param",
+    "source",
+    "spacer",
+    "track",
+    "wbr",
+}
+
+# Sections following the ones FighterScraper reads, nothing after them is needed
+END_CLASSES = ("athlete-record",)
+
+
+class AthletePage:
+    def __init__(self) -> None:
+        """Raw text of every athlete page element FighterScraper reads, however the page was parsed.
+
+        Attributes:
+            masthead (str): Masthead headline, "Search results" when the athlete does not exist.
+            name (str): hero-profile__name text.
+            nickname (str): hero-profile__nickname text.
+            division_title (str): hero-profile__division-title text.
+            division_body (str): hero-profile__division-body text.
+            tags (list[str]): Text of every hero-profile__tag.
+            bio_fields (dict): c-bio__field labels with their text, first occurrence wins.
+            stat_compare (dict): c-stat-compare__group labels with their value text, empty values are left out.
+            stat_blocks (list[dict]): Striking and grappling blocks, accuracy "title" and overlap "values".
+            stat_bars (list[list[str]]): Strike position and win method bars, value text of every group.
+            strike_targets (list[list[str]]): Text of every c-stat-body__svg group or None without the svg.
+        """
+
+        self.masthead = None
+        self.name = None
+        self.nickname = None
+        self.division_title = None
+        self.division_body = None
+        self.tags = []
+        self.bio_fields = {}
+        self.stat_compare = {}
+        self.stat_blocks = []
+        self.stat_bars = []
+        self.strike_targets = None
+
+
+class AthletePageParser(HTMLParser):
+    def __init__(self) -> None:
+        """Tokenizer filling an AthletePage straight from parser callbacks, no tree is built.
+
+        Content can be fed in chunks, bytes are decoded as UTF-8. complete is set once every section
+        FighterScraper reads has been passed, anything fed after that is ignored.
+
+        >>> parser = AthletePageParser()
+        >>> parser.feed(url_response.content)
+        >>> parser.close()
+        >>> parser.page.bio_fields
+        {"Status": "Active", ...}
+        """
+
+        super().__init__(convert_charrefs=True)
+        self.page = AthletePage()
+        self.complete = False
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._depth = 0
+        self._stack = []
+        self._captures = []
+        self._containers = []
+        self._seen = set()
+        self._in_script = False
+
+    def feed(self, data: bytes | str) -> None:
+        if self.complete:
+            return
+
+        if isinstance(data, bytes):
+            data = self._decoder.decode(data)
+
+        super().feed(data)
+
+    def close(self) -> None:
+        if not self.complete:
+            super().feed(self._decoder.decode(b"", final=True))
+            super().close()
+
+        while self._stack:
+            self._pop()
+
+    # Containers and captures
+    def _container(self, name: str) -> dict | None:
+        """Returns innermost open container called name."""
+
+        for container_name, _, container in reversed(self._containers):
+            if container_name == name:
+                return container
+
+        return None
+
+    def _open_container(self, name: str, container, on_close=None) -> None:
+        self._containers.append((name, self._depth, container))
+        if on_close:
+            self._capture(lambda text: on_close(container), collect=False)
+
+    def _capture(self, on_close, collect: bool = True) -> None:
+        """Calls on_close with the element's text once the element just opened is closed."""
+
+        self._captures.append((self._depth, [] if collect else None, on_close))
+
+    def _first(self, key: str) -> bool:
+        """Checks if key is seen for the first time, mirrors BeautifulSoup find."""
+
+        if key in self._seen:
+            return False
+
+        self._seen.add(key)
+
+        return True
+
+    def _pop(self) -> None:
+        """Closes the innermost open element."""
+
+        self._stack.pop()
+
+        while self._captures and self._captures[-1][0] == self._depth:
+            _, text, on_close = self._captures.pop()
+            on_close("".join(text) if text is not None else None)
+
+        while self._containers and self._containers[-1][1] == self._depth:
+            self._containers.pop()
+
+        self._depth -= 1
+
+    # HTMLParser callbacks
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        if self.complete or tag in VOID_ELEMENTS:
+            return
+
+        self._depth += 1
+        self._stack.append(tag)
+        self._in_script = tag in ("script", "style")
+
+        class_attr = dict(attrs).get("class") or ""
+        classes = class_attr.split()
+        class_str = " ".join(classes)
+
+        if tag == "footer" or any(class_name in classes for class_name in END_CLASSES):
+            self.complete = True
+            return
+
+        self._handle_hero(tag, classes)
+        self._handle_bio(tag, classes)
+        self._handle_stats(tag, classes, class_str)
+        self._handle_strike_targets(tag, classes)
+
+    def handle_endtag(self, tag: str) -> None:
+        self._in_script = False
+
+        if self.complete or tag not in self._stack:
+            return
+
+        while self._stack[-1] != tag:
+            self._pop()
+        self._pop()
+
+    def handle_data(self, data: str) -> None:
+        if self.complete or self._in_script:
+            return
+
+        for _, text, _ in self._captures:
+            if text is not None:
+                text.append(data)
+
+    # Sections
+    def _handle_hero(self, tag: str, classes: list[str]) -> None:
+        page = self.page
+
+        if tag == "div" and "l-masthead__headline" in classes:
+            if self._first("masthead"):
+                self._capture(lambda text: setattr(page, "masthead", text))
+        elif tag == "h1" and "hero-profile__name" in classes:
+            if self._first("name"):
+                self._capture(lambda text: setattr(page, "name", text))
+        elif tag == "p" and "hero-profile__nickname" in classes:
+            if self._first("nickname"):
+                self._capture(lambda text: setattr(page, "nickname", text))
+        elif tag == "p" and "hero-profile__division-title" in classes:
+            if self._first("division_title"):
+                self._capture(lambda text: setattr(page, "division_title", text))
+        elif tag == "p" and "hero-profile__division-body" in classes:
+            if self._first("division_body"):
+                self._capture(lambda text: setattr(page, "division_body", text))
+        elif tag == "p" and "hero-profile__tag" in classes:
+            index = len(page.tags)
+            page.tags.append("")
+            self._capture(lambda text: page.tags.__setitem__(index, text))
+
+    def _handle_bio(self, tag: str, classes: list[str]) -> None:
+        if tag != "div":
+            return
+
+        # Bio is the last section FighterScraper reads
+        if "c-bio" in classes:
+            self._capture(lambda text: setattr(self, "complete", True), collect=False)
+            return
+
+        if "c-bio__field" in classes:
+            self._open_container("bio", {}, self._close_bio_field)
+            return
+
+        field = self._container("bio")
+        if field is None:
+            return
+
+        for key in ("label", "text"):
+            if f"c-bio__{key}" in classes and key not in field:
+                field[key] = None
+                self._capture(lambda text, key=key: field.__setitem__(key, text))
+
+    def _close_bio_field(self, field: dict) -> None:
+        if field.get("label") is None or field.get("text") is None:
+            return
+
+        self.page.bio_fields.setdefault(field["label"].strip(), field["text"])
+
+    def _handle_stats(self, tag: str, classes: list[str], class_str: str) -> None:
+        page = self.page
+
+        if tag == "div" and class_str == "stats-records stats-records--two-column":
+            block = {"title": None, "values": []}
+            page.stat_blocks.append(block)
+            self._open_container("block", {"block": block})
+        elif tag == "div" and class_str == "c-stat-3bar c-stat-3bar--no-chart":
+            bar = []
+            page.stat_bars.append(bar)
+            self._open_container("bar", bar)
+        elif tag == "div" and "c-stat-compare__group" in classes:
+            self._open_container("compare", {}, self._close_compare_group)
+
+        self._handle_stat_block(tag, classes)
+        self._handle_stat_bar(tag, classes)
+        self._handle_compare_group(tag, classes)
+
+    def _handle_stat_block(self, tag: str, classes: list[str]) -> None:
+        state = self._container("block")
+        if state is None:
+            return
+
+        block = state["block"]
+        if tag == "title" and "title_seen" not in state:
+            state["title_seen"] = True
+            self._capture(lambda text: block.__setitem__("title", text))
+        elif tag == "dd" and "c-overlap__stats-value" in classes:
+            index = len(block["values"])
+            block["values"].append("")
+            self._capture(lambda text: block["values"].__setitem__(index, text))
+
+    def _handle_stat_bar(self, tag: str, classes: list[str]) -> None:
+        bar = self._container("bar")
+        if bar is None or tag != "div":
+            return
+
+        if "c-stat-3bar__group" in classes:
+            group = {"index": len(bar)}
+            bar.append(None)
+            self._open_container("bar_group", group)
+            return
+
+        group = self._container("bar_group")
+        if (
+            group is not None
+            and "c-stat-3bar__value" in classes
+            and "seen" not in group
+        ):
+            group["seen"] = True
+            self._capture(lambda text: bar.__setitem__(group["index"], text))
+
+    def _handle_compare_group(self, tag: str, classes: list[str]) -> None:
+        group = self._container("compare")
+        if group is None or tag != "div":
+            return
+
+        for key, class_name in (
+            ("label", "c-stat-compare__label"),
+            ("value", "c-stat-compare__number"),
+        ):
+            if class_name in classes and key not in group:
+                group[key] = None
+                self._capture(lambda text, key=key: group.__setitem__(key, text))
+
+    def _close_compare_group(self, group: dict) -> None:
+        if group.get("label") is None or group.get("value") is None:
+            return
+
+        value_text = group["value"].replace("%", "").strip()
+        if value_text:
+            self.page.stat_compare[group["label"].strip()] = value_text
+
+    def _handle_strike_targets(self, tag: str, classes: list[str]) -> None:
+        page = self.page
+
+        if tag == "svg" and "c-stat-body__svg" in classes:
+            if self._first("strike_targets"):
+                page.strike_targets = []
+                self._open_container("svg", page.strike_targets)
+            return
+
+        targets = self._container("svg")
+        if targets is None:
+            return
+
+        if tag == "g":
+            texts = []
+            targets.append(texts)
+            self._open_container("g", texts)
+        elif tag == "text":
+            open_groups = [
+                container for name, _, container in self._containers if name == "g"
+            ]
+            if open_groups:
+                self._capture(lambda text: _append_to_all(open_groups, text))
+
+
+def _append_to_all(lists: list[list], item) -> None:
+    """Appends item to every list, a text belongs to each svg group around it."""
+
+    for items in lists:
+        items.append(item)
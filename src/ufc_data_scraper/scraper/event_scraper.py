@@ -1,34 +1,198 @@
+import asyncio
+import contextlib
+import dataclasses
 import requests
+import time
 import concurrent.futures
 
 from ufc_data_scraper.scraper.fighter_scraper import FighterScraper, set_fighter_url
 
-from ufc_data_scraper.exceptions import MissingEventData
+from ufc_data_scraper.transport import (
+    Transport,
+    UrlMap,
+    get_transport,
+    MAX_WORKERS,
+    API_URL,
+    UFC_URL,
+)
+
+from ufc_data_scraper.cache import (
+    EventCache,
+    FighterCache,
+    get_event_cache,
+    get_fighter_cache,
+)
+
+from ufc_data_scraper.exceptions import MissingEventData, FighterNotFound
 
 from ufc_data_scraper.data_models.event import *
 from ufc_data_scraper.data_models.fighter import Fighter
 
-from ufc_data_scraper.utils import convert_date, get_incorrect_urls
+from ufc_data_scraper.utils import (
+    ConcurrencyLimiter,
+    Metrics,
+    convert_date,
+    get_fighter_limiter,
+    get_incorrect_urls,
+    get_metrics,
+    is_overloaded,
+)
 
 
 class EventScraper:
-    def __init__(self, event_fmid: int, event_url=None) -> None:
+    def __init__(
+        self,
+        event_fmid: int,
+        event_url=None,
+        transport: Transport = None,
+        event_cache: EventCache = None,
+        fighter_cache: FighterCache = None,
+        metrics: Metrics = None,
+        executor: concurrent.futures.Executor = None,
+        incorrect_urls: dict = None,
+        incorrect_names: dict = None,
+        url_map: UrlMap = None,
+        limiter: ConcurrencyLimiter = None,
+    ) -> None:
         """Queries private UFC api and returns query as an Event object.
 
         Args:
             event_fmid (int): Event FMID, to query.
             event_url (str, optional): If supplied will add event page url to Event data class. Defaults to None.
+            transport (Transport, optional): Transport to request with. Defaults to the shared transport.
+            event_cache (EventCache, optional): Cache of scraped events. Defaults to the shared event cache.
+            fighter_cache (FighterCache, optional): Cache of scraped fighters. Defaults to the shared fighter cache.
+            metrics (Metrics, optional): Metrics stage timings are recorded to. Defaults to the shared metrics.
+            executor (concurrent.futures.Executor, optional): Worker pool to scrape on. Defaults to a pool per scrape.
+            incorrect_urls (dict, optional): Incorrect fighter urls and their correct counterpart. Retrieved if omitted.
+            incorrect_names (dict, optional): Incorrect fighter names and their correct counterpart. Retrieved if omitted.
+            url_map (UrlMap, optional): Guessed fighter urls with their canonical url. Defaults to the shared map.
+            limiter (ConcurrencyLimiter, optional): Adaptive limit of fighters scraped at once. Defaults to the shared limiter.
 
         >>> event_scraper = EventScraper(event_fmid, event_url)
         >>> event = event_scraper.scrape_event()
+        >>> event_scraper.timings
+        {"corrections": 0.21, "event_data": 0.34, "fighters": 1.84, "build": 0.01, "total": 2.19}
         """
 
         self._event_fmid = event_fmid
         self._event_url = event_url
+        self._transport = transport or get_transport()
+        self._event_cache = (
+            event_cache if event_cache is not None else get_event_cache()
+        )
+        self._fighter_cache = (
+            fighter_cache if fighter_cache is not None else get_fighter_cache()
+        )
+        self._metrics = metrics or get_metrics()
+        self._executor = executor
+        self._incorrect_names = incorrect_names
+        self._url_map = url_map
+        self._limiter = limiter or get_fighter_limiter()
         self._event_data = None
-        self._incorrect_fighter_urls = None
+        self._incorrect_fighter_urls = incorrect_urls
         self._fighter_urls = None
         self._scraped_fighters = None
+        # Cache keys of fighters left out because their host was failing
+        self._failed_fighters = set()
+        self.timings = {}
+
+    def _record_stage(self, stage: str, start: float) -> None:
+        """Records duration of stage, started at start, in timings and metrics.
+
+        Args:
+            stage (str): Stage name.
+            start (float): time.perf_counter() value the stage started at.
+        """
+
+        seconds = time.perf_counter() - start
+
+        self.timings[stage] = seconds
+        self._metrics.record(f"scrape_event.{stage}", seconds)
+
+    def _get_executor(self):
+        """Returns context manager yielding the worker pool to scrape on.
+
+        Returns:
+            ContextManager[concurrent.futures.Executor]: Supplied pool, left running on exit, or a new pool.
+        """
+
+        if self._executor is not None:
+            return contextlib.nullcontext(self._executor)
+
+        # One worker per fighter the limiter may allow, plus the corrections fetch
+        return concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._limiter.maximum + 1
+        )
+
+    def _get_incorrect_urls(self) -> dict:
+        """Returns supplied incorrect fighter urls or retrieves them.
+
+        Returns:
+            dict: Dictionary of incorrect fighter urls with their correct counterpart.
+        """
+
+        if self._incorrect_fighter_urls is not None:
+            return self._incorrect_fighter_urls
+
+        return get_incorrect_urls(self._transport)
+
+    def _run_stage(self, stage: str, func, *args):
+        """Runs func with args as a timed stage.
+
+        Args:
+            stage (str): Stage name.
+            func (callable): Stage work.
+
+        Returns:
+            Any: Return value of func.
+        """
+
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self._record_stage(stage, start)
+
+    async def _run_stage_async(self, stage: str, awaitable):
+        """Awaits awaitable as a timed stage.
+
+        Args:
+            stage (str): Stage name.
+            awaitable (Awaitable): Stage work.
+
+        Returns:
+            Any: Result of awaitable.
+        """
+
+        start = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            self._record_stage(stage, start)
+
+    def _get_events_endpoint(self) -> str:
+        """Returns private UFC api endpoint for the event.
+
+        Returns:
+            str: Event API url.
+        """
+
+        return f"{API_URL}/api/v3/event/live/{self._event_fmid}.json"
+
+    def _parse_event_response(self, event_response: requests.models.Response) -> dict:
+        """Returns event data from private UFC api response.
+
+        Args:
+            event_response (requests.models.Response): API response.
+
+        Returns:
+            dict: API response in dictionary format.
+        """
+
+        event_response.raise_for_status()
+
+        return event_response.json().get("LiveEventDetail")
 
     def _get_event_data(self) -> dict:
         """Queries private UFC api and returns response dictionary.
@@ -37,12 +201,20 @@ class EventScraper:
             dict: API response in dictionary format.
         """
 
-        events_endpoint = f"http://d29dxerjsp82wz.cloudfront.net/api/v3/event/live/{self._event_fmid}.json"
+        event_response = self._transport.get(self._get_events_endpoint())
 
-        event_response = requests.get(events_endpoint)
-        event_response.raise_for_status()
+        return self._parse_event_response(event_response)
 
-        return event_response.json().get("LiveEventDetail")
+    async def _get_event_data_async(self) -> dict:
+        """Queries private UFC api without blocking the event loop and returns response dictionary.
+
+        Returns:
+            dict: API response in dictionary format.
+        """
+
+        event_response = await self._transport.get_async(self._get_events_endpoint())
+
+        return self._parse_event_response(event_response)
 
     def _get_location_obj(self) -> Location:
         """Get location data from event data and return it as a Location object.
@@ -98,10 +270,21 @@ class EventScraper:
                 return None
 
             fighter_name = fighter_name.replace(" ", "-")
-            fighter_url = f"http://www.ufc.com/athlete/{fighter_name}"
+            fighter_url = f"{UFC_URL}/athlete/{fighter_name}"
 
         return fighter_url
 
+    def _iter_booked_fighter_urls(self):
+        """Yields fighter urls from event data in fight card order.
+
+        Yields:
+            str: Fighter url.
+        """
+
+        for fight in self._event_data.get("FightCard"):
+            for fighter in fight.get("Fighters"):
+                yield self._get_fighter_url(fighter)
+
     def _get_booked_fighter_urls(self) -> list[str]:
         """Gets fighter urls from event data.
 
@@ -109,13 +292,37 @@ class EventScraper:
             list[str]: List of fighter urls.
         """
 
-        fighter_urls = []
-        for fight in self._event_data.get("FightCard"):
-            for fighter in fight.get("Fighters"):
-                fighter_url = self._get_fighter_url(fighter)
-                fighter_urls.append(fighter_url)
+        return list(self._iter_booked_fighter_urls())
+
+    def _get_fighter_cache_key(self, fighter_url: str) -> str:
+        """Returns canonical fighter url used as fighter cache key.
+
+        Args:
+            fighter_url (str): Fighters ufc page url.
+
+        Returns:
+            str: Canonical fighter url.
+        """
+
+        return set_fighter_url(fighter_url, self._incorrect_fighter_urls)
+
+    def _create_fighter_scraper(self, fighter_url: str) -> FighterScraper:
+        """Creates scraper for fighter url sharing this scraper's transport and corrections.
+
+        Args:
+            fighter_url (str): Fighters ufc page url.
+
+        Returns:
+            FighterScraper: Fighter scraper.
+        """
 
-        return fighter_urls
+        return FighterScraper(
+            fighter_url,
+            self._incorrect_fighter_urls,
+            self._incorrect_names,
+            transport=self._transport,
+            url_map=self._url_map,
+        )
 
     def _get_fighter_obj(self, fighter_url: str) -> Fighter:
         """Scrapes fighter data from fighter url and returns it as a Fighter object.
@@ -124,37 +331,173 @@ class EventScraper:
             fighter_url (str): Fighters ufc page url.
 
         Returns:
-            Fighter: Fighter object containing fighter's data.
+            Fighter: Fighter object containing fighter's data, None if it could not be requested.
         """
 
+        if not fighter_url:
+            return None
+
+        cache_key = self._get_fighter_cache_key(fighter_url)
+
+        fighter = self._fighter_cache.get(cache_key)
+        if fighter:
+            return fighter
+
         try:
-            fighter_scraper = FighterScraper(fighter_url, self._incorrect_fighter_urls)
-            fighter = fighter_scraper.scrape_fighter()
-        except requests.exceptions.HTTPError:
+            with self._limiter.slot():
+                fighter_scraper = self._create_fighter_scraper(fighter_url)
+                fighter = fighter_scraper.scrape_fighter()
+        except (requests.exceptions.RequestException, FighterNotFound) as error:
+            # A fighter that could not be requested is left out rather than failing the event
+            if is_overloaded(error):
+                self._failed_fighters.add(cache_key)
             fighter = None
 
+        if fighter:
+            self._fighter_cache.set(cache_key, fighter)
+
         return fighter
 
-    def _scrape_fighters(self) -> dict[str, Fighter]:
-        """Scrapes all fighter urls in self._fighter_urls adding their information to a dictionary.
+    async def _get_fighter_obj_async(
+        self, fighter_url: str, semaphore: asyncio.Semaphore
+    ) -> Fighter:
+        """Scrapes fighter data from fighter url as a coroutine and returns it as a Fighter object.
+
+        Args:
+            fighter_url (str): Fighters ufc page url.
+            semaphore (asyncio.Semaphore): Limits how many fighters are scraped at once.
+
+        Returns:
+            Fighter: Fighter object containing fighter's data, None if it could not be requested.
+        """
+
+        if not fighter_url:
+            return None
+
+        cache_key = self._get_fighter_cache_key(fighter_url)
+
+        fighter = self._fighter_cache.get(cache_key)
+        if fighter:
+            return fighter
+
+        async with semaphore:
+            try:
+                fighter_scraper = self._create_fighter_scraper(fighter_url)
+                fighter = await fighter_scraper.scrape_fighter_async()
+            except (requests.exceptions.RequestException, FighterNotFound) as error:
+                if is_overloaded(error):
+                    self._failed_fighters.add(cache_key)
+                fighter = None
+
+        if fighter:
+            self._fighter_cache.set(cache_key, fighter)
+
+        return fighter
+
+    def _get_fighter_obj_when_ready(
+        self, fighter_url: str, incorrect_fighter_urls: concurrent.futures.Future
+    ) -> Fighter:
+        """Scrapes fighter once the correction map has been retrieved.
+
+        Args:
+            fighter_url (str): Fighters ufc page url.
+            incorrect_fighter_urls (concurrent.futures.Future): Pending correction map.
+
+        Returns:
+            Fighter: Fighter object containing fighter's data.
+        """
+
+        # Every task sets the same map, the assignment is idempotent
+        self._incorrect_fighter_urls = incorrect_fighter_urls.result()
+
+        return self._get_fighter_obj(fighter_url)
+
+    def _scrape_fighters(
+        self,
+        executor: concurrent.futures.Executor,
+        incorrect_fighter_urls: concurrent.futures.Future,
+    ) -> dict[str, Fighter]:
+        """Scrapes every booked fighter, queueing each one as soon as its fight card entry is read.
+
+        Fighter tasks wait for the correction map inside the pool, so they are queued while it is still retrieved.
+        It must be submitted to executor before any fighter is. The limiter decides how many fighters are fetched at once.
+
+        Args:
+            executor (concurrent.futures.Executor): Pool fighters are scraped on.
+            incorrect_fighter_urls (concurrent.futures.Future): Pending correction map.
 
         Returns:
             dict[str, Fighter]: Dictionary of Fighter objects, using fighter url as a key.
         """
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
-            futures = [
+        self._fighter_urls = []
+        futures = []
+        for fighter_url in self._iter_booked_fighter_urls():
+            self._fighter_urls.append(fighter_url)
+            futures.append(
                 executor.submit(
-                    self._get_fighter_obj,
+                    self._get_fighter_obj_when_ready,
                     fighter_url,
+                    incorrect_fighter_urls,
                 )
-                for fighter_url in self._fighter_urls
-            ]
+            )
 
         fighters = [future.result() for future in futures]
 
         return dict(zip(self._fighter_urls, fighters))
 
+    async def _get_fighter_obj_when_ready_async(
+        self,
+        fighter_url: str,
+        incorrect_fighter_urls: asyncio.Future,
+        semaphore: asyncio.Semaphore,
+    ) -> Fighter:
+        """Scrapes fighter as a coroutine once the correction map has been retrieved.
+
+        Args:
+            fighter_url (str): Fighters ufc page url.
+            incorrect_fighter_urls (asyncio.Future): Pending correction map.
+            semaphore (asyncio.Semaphore): Limits how many fighters are scraped at once.
+
+        Returns:
+            Fighter: Fighter object containing fighter's data.
+        """
+
+        self._incorrect_fighter_urls = await incorrect_fighter_urls
+
+        return await self._get_fighter_obj_async(fighter_url, semaphore)
+
+    async def _scrape_fighters_async(
+        self, concurrency: int, incorrect_fighter_urls: asyncio.Future
+    ) -> dict[str, Fighter]:
+        """Scrapes every booked fighter as coroutines on the running event loop.
+
+        Args:
+            concurrency (int): Maximum number of fighters scraped at once.
+            incorrect_fighter_urls (asyncio.Future): Pending correction map.
+
+        Returns:
+            dict[str, Fighter]: Dictionary of Fighter objects, using fighter url as a key.
+        """
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        self._fighter_urls = []
+        tasks = []
+        for fighter_url in self._iter_booked_fighter_urls():
+            self._fighter_urls.append(fighter_url)
+            tasks.append(
+                asyncio.ensure_future(
+                    self._get_fighter_obj_when_ready_async(
+                        fighter_url, incorrect_fighter_urls, semaphore
+                    )
+                )
+            )
+
+        fighters = await asyncio.gather(*tasks)
+
+        return dict(zip(self._fighter_urls, fighters))
+
     def _get_fighters_stats(self, fighter: dict) -> FighterStats:
         """Get fighter stats from fighter dictionary and return it as a FighterStats object.
 
@@ -426,21 +769,13 @@ class EventScraper:
 
         return list(card_segments.values())
 
-    def scrape_event(self) -> Event:
-        """Queries private UFC api and returns query as an Event object.
+    def _build_event(self) -> Event:
+        """Builds Event object from loaded event data and scraped fighters.
 
         Returns:
             Event: Event object containing all data about queried event.
         """
 
-        self._event_data = self._get_event_data()
-        if len(self._event_data) < 1:
-            raise MissingEventData
-
-        self._incorrect_fighter_urls = get_incorrect_urls()
-        self._fighter_urls = self._get_booked_fighter_urls()
-        self._scraped_fighters = self._scrape_fighters()
-
         event_date = self._event_data.get("StartTime")
 
         event_info = {
@@ -454,3 +789,203 @@ class EventScraper:
         }
 
         return Event(**event_info)
+
+    def _cache_event(self, event: Event) -> None:
+        """Stores event in the event cache, unless a fighter was left out because its host was failing.
+
+        Args:
+            event (Event): Scraped event.
+        """
+
+        booked = {
+            self._get_fighter_cache_key(fighter_url)
+            for fighter_url in filter(None, self._fighter_urls or [])
+        }
+        if booked & self._failed_fighters:
+            return
+
+        self._event_cache.set(event)
+
+    def _get_cached_event(self) -> Event | None:
+        """Returns event from the event cache, using this scraper's event url.
+
+        Returns:
+            Event: Cached Event object or None on a miss.
+        """
+
+        event = self._event_cache.get(self._event_fmid)
+        if event and self._event_url and event.event_url != self._event_url:
+            event = dataclasses.replace(event, event_url=self._event_url)
+
+        return event
+
+    def scrape_event(self, refresh: bool = False) -> Event:
+        """Queries private UFC api and returns query as an Event object.
+
+        The correction map is retrieved alongside the event data and fighters are queued as soon as the event data is read.
+        Stage durations of the last scrape are kept in timings.
+
+        Args:
+            refresh (bool, optional): Skip the event cache and query the api. Defaults to False.
+
+        Returns:
+            Event: Event object containing all data about queried event.
+        """
+
+        event = not refresh and self._get_cached_event()
+        if event:
+            return event
+
+        self.timings = {}
+        self._failed_fighters = set()
+        start = time.perf_counter()
+
+        with self._get_executor() as executor:
+            # Corrections do not depend on the event data, submitted first so fighters never wait on a queued fetch
+            incorrect_fighter_urls = executor.submit(
+                self._run_stage, "corrections", self._get_incorrect_urls
+            )
+
+            self._event_data = self._run_stage("event_data", self._get_event_data)
+            if len(self._event_data) < 1:
+                raise MissingEventData
+
+            self._scraped_fighters = self._run_stage(
+                "fighters", self._scrape_fighters, executor, incorrect_fighter_urls
+            )
+
+        event = self._run_stage("build", self._build_event)
+        self._cache_event(event)
+
+        self._record_stage("total", start)
+
+        return event
+
+    async def scrape_event_async(
+        self, concurrency: int = MAX_WORKERS, refresh: bool = False
+    ) -> Event:
+        """Queries private UFC api as a coroutine and returns query as an Event object.
+
+        The correction map is retrieved alongside the event data and fighters are queued as soon as the event data is read.
+        Stage durations of the last scrape are kept in timings.
+
+        Args:
+            concurrency (int, optional): Maximum number of fighters scraped at once. Defaults to MAX_WORKERS.
+            refresh (bool, optional): Skip the event cache and query the api. Defaults to False.
+
+        Returns:
+            Event: Event object containing all data about queried event.
+        """
+
+        event = not refresh and self._get_cached_event()
+        if event:
+            return event
+
+        self.timings = {}
+        self._failed_fighters = set()
+        start = time.perf_counter()
+
+        incorrect_fighter_urls = asyncio.ensure_future(
+            asyncio.to_thread(self._run_stage, "corrections", self._get_incorrect_urls)
+        )
+
+        try:
+            self._event_data = await self._run_stage_async(
+                "event_data", self._get_event_data_async()
+            )
+            if len(self._event_data) < 1:
+                raise MissingEventData
+        except BaseException:
+            # The event data error is the one worth raising, a failed correction fetch must not replace it
+            with contextlib.suppress(Exception):
+                await incorrect_fighter_urls
+            raise
+
+        self._scraped_fighters = await self._run_stage_async(
+            "fighters",
+            self._scrape_fighters_async(concurrency, incorrect_fighter_urls),
+        )
+
+        event = self._run_stage("build", self._build_event)
+        self._cache_event(event)
+
+        self._record_stage("total", start)
+
+        return event
+
+
+def scrape_event_batch(
+    event_scrapers: list[EventScraper],
+    max_workers: int = MAX_WORKERS,
+    executor: concurrent.futures.Executor = None,
+) -> list[Event]:
+    """Scrapes several events at once, every distinct fighter across them is scraped only once.
+
+    Args:
+        event_scrapers (list[EventScraper]): Event scrapers sharing a transport and caches.
+        max_workers (int, optional): Size of the worker pool used for every request. Defaults to MAX_WORKERS.
+        executor (concurrent.futures.Executor, optional): Running worker pool to use instead of a new pool of max_workers.
+
+    Returns:
+        list[Event]: Event objects in the same order as event_scrapers.
+    """
+
+    events = [event_scraper._get_cached_event() for event_scraper in event_scrapers]
+
+    pending_indexes = [index for index, event in enumerate(events) if not event]
+    if not pending_indexes:
+        return events
+
+    pending = [event_scrapers[index] for index in pending_indexes]
+
+    # Fighters are scraped once for every event, so are their failures
+    failed_fighters = set()
+    for event_scraper in pending:
+        event_scraper._failed_fighters = failed_fighters
+
+    if executor is not None:
+        pool = contextlib.nullcontext(executor)
+    else:
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+
+    with pool as executor:
+        # Corrections do not depend on the event data, retrieved alongside it
+        corrections = executor.submit(pending[0]._get_incorrect_urls)
+
+        event_data = list(
+            executor.map(lambda event_scraper: event_scraper._get_event_data(), pending)
+        )
+
+        incorrect_fighter_urls = corrections.result()
+
+        # Canonical fighter url -> first booked url, so each fighter is scraped once
+        fighter_urls = {}
+        for event_scraper, data in zip(pending, event_data):
+            if len(data) < 1:
+                raise MissingEventData
+
+            event_scraper._event_data = data
+            event_scraper._incorrect_fighter_urls = incorrect_fighter_urls
+            event_scraper._fighter_urls = event_scraper._get_booked_fighter_urls()
+
+            for fighter_url in filter(None, event_scraper._fighter_urls):
+                cache_key = event_scraper._get_fighter_cache_key(fighter_url)
+                fighter_urls.setdefault(cache_key, fighter_url)
+
+        scraped_fighters = executor.map(
+            pending[0]._get_fighter_obj, fighter_urls.values()
+        )
+        fighters = dict(zip(fighter_urls.keys(), scraped_fighters))
+
+    for index, event_scraper in zip(pending_indexes, pending):
+        event_scraper._scraped_fighters = {
+            fighter_url: fighters[event_scraper._get_fighter_cache_key(fighter_url)]
+            for fighter_url in filter(None, event_scraper._fighter_urls)
+        }
+
+        event = event_scraper._build_event()
+        event_scraper._cache_event(event)
+
+        events[index] = event
+
+    return events
@@ -1,57 +1,89 @@
-import requests
+import asyncio
 import re
+import requests
 
-from bs4 import BeautifulSoup, Tag, ResultSet
+from bs4 import Tag
 from unidecode import unidecode
+from urllib.parse import urlsplit
+
+from ufc_data_scraper.transport import Transport, get_transport
+
+from ufc_data_scraper.scraper.athlete_page import AthletePage, AthletePageParser
+
+from ufc_data_scraper.cache import UrlMap, get_fighter_url_map
+
+from ufc_data_scraper.exceptions import FighterNotFound
 
 from ufc_data_scraper.utils import *
 
 from ufc_data_scraper.data_models.fighter import *
 
-
-def set_fighter_url(fighter_url: str, incorrect_urls: dict) -> str:
+# Class name prefixes of every element the scraper reads
+ATHLETE_REGIONS = (
+    "l-masthead__headline",
+    "hero-profile__",
+    "c-bio__field",
+    "c-stat-3bar",
+    "stats-records",
+    "c-stat-compare",
+    "c-stat-body__svg",
+)
+
+# Extraction engines, "soup" builds a BeautifulSoup tree, "tokenizer" reads parser callbacks
+# and "stream" tokenizes the body while it downloads
+EXTRACTORS = ("soup", "tokenizer", "stream")
+
+# Bytes read from a streamed athlete page between completion checks
+STREAM_CHUNK_SIZE = 8 * 1024
+# Longest tail read after the last section so the connection can be reused, longer tails are cut off
+STREAM_DRAIN_BYTES = 16 * 1024
+
+# ufc.com serves a search page instead of an athlete page for unknown urls
+SEARCH_RESULTS_PATTERN = re.compile(rb'l-masthead__headline"[^>]*>\s*Search results')
+# The masthead comes before any athlete content, misses are found within these bytes
+MISS_SCAN_BYTES = 64 * 1024
+
+
+def set_fighter_url(fighter_url: str, incorrect_urls: dict | CorrectionIndex) -> str:
     """Replaces incorrect urls and removes inconsistencies from url.
 
     Args:
         fighter_url (str): UFC fighter page url.
-        incorrect_urls (dict): Dictionary of incorrect urls with their corrected counterpart.
+        incorrect_urls (dict | CorrectionIndex): Dictionary or compiled index of incorrect urls with their corrected counterpart.
 
     Returns:
         str: Corrected fighter url.
     """
 
-    fighter_url = fighter_url.replace("https", "http")
-    # Remove any strange chars from fighter name
-    url_name = fighter_url.split("/")[-1].lower()
-
-    banned_url_chars = ["--", "'", "."]
-    for banned_char in banned_url_chars:
-        if banned_char in url_name:
-            url_name = url_name.replace(banned_char, "")
-    fighter_url = f"http://www.ufc.com/athlete/{url_name}"
-    fighter_url = unidecode(fighter_url)
-
-    try:
-        fighter_url = incorrect_urls[fighter_url]
-    except (KeyError, TypeError):
-        fighter_url = fighter_url
-
-    return fighter_url
+    return correct_fighter_url(fighter_url, incorrect_urls)
 
 
 class FighterScraper:
     def __init__(
         self,
         fighter_url: str,
-        incorrect_urls=utils.get_incorrect_urls(),
-        incorrect_names=utils.get_incorrect_names(),
+        incorrect_urls: dict = None,
+        incorrect_names: dict = None,
+        transport: Transport = None,
+        parser_backend: str = None,
+        scoped_parse: bool = True,
+        url_map: UrlMap = None,
     ) -> None:
         """Scrapes ufc fighter page and returns data as a Fighter object.
 
+        Corrections are applied before the page is requested, if the corrected url misses the supplied url
+        is tried next and the url that worked is remembered in url_map for next time.
+
         Args:
             fighter_url (url): UFC fighter page url.
             incorrect_urls (dict, optional): Dictionary of incorrect fighter urls and their correct counterpart.
-            If supplied the scraper won't retrieve them, can speed up scraping multiple fighters.
+            If not supplied they are retrieved on first scrape and reused for the rest of the process.
+            incorrect_names (dict, optional): Dictionary of incorrect fighter names and their correct counterpart.
+            If not supplied they are retrieved on first scrape and reused for the rest of the process.
+            transport (Transport, optional): Transport to request with. Defaults to the shared transport.
+            parser_backend (str, optional): One of PARSER_BACKENDS. Defaults to the process wide backend.
+            scoped_parse (bool, optional): Only build a tree for ATHLETE_REGIONS instead of the whole page. Defaults to True.
+            url_map (UrlMap, optional): Guessed fighter urls with their canonical url. Defaults to the shared map.
 
         >>> fighter_scraper = FighterScraper(fighter_url)
         >>> fighter = fighter_scraper.scrape_fighter()
@@ -60,18 +92,15 @@ class FighterScraper:
         self.fighter_url = fighter_url
         self._incorrect_urls = incorrect_urls
         self._incorrect_names = incorrect_names
+        self._transport = transport or get_transport()
+        self._parser_backend = parser_backend
+        self._scoped_parse = scoped_parse
+        self._url_map = url_map if url_map is not None else get_fighter_url_map()
         self._soup = None
-        self._stats_section = None
-        self._stats_targets = None
+        self._page = AthletePage()
 
     def _fighter_not_found(self) -> bool:
-        target = self._soup.find("div", class_="l-masthead__headline")
-        if target:
-            target_text = target.get_text()
-            if target_text == "Search results":
-                return True
-        
-        return False
+        return self._page.masthead == "Search results"
 
     def _create_soup(self, content: bytes) -> None:
         """Creates Beautiful soup object from provided content and assigns it to _soup.
@@ -80,23 +109,196 @@ class FighterScraper:
             content (bytes): Content to create soup from.
         """
 
-        self._soup = BeautifulSoup(content, "html.parser")
+        regions = ATHLETE_REGIONS if self._scoped_parse else None
+        self._soup = create_soup(content, self._parser_backend, regions)
+        self._page = self._read_soup()
 
-        # StrikePosition and Win Method stats - 0 and 1 respectively
-        self._stats_section = self._soup.find_all(
-            "div", class_="c-stat-3bar c-stat-3bar--no-chart"
+    def _tokenize(self, content: bytes | str) -> None:
+        """Reads content with AthletePageParser and assigns the result to _page, no tree is built.
+
+        Args:
+            content (bytes | str): Content to read.
+        """
+
+        parser = AthletePageParser()
+        parser.feed(content)
+        parser.close()
+
+        self._soup = None
+        self._page = parser.page
+
+    def _stream(self, url_response: requests.models.Response) -> None:
+        """Tokenizes a streamed response as it downloads and assigns the result to _page.
+
+        Once every section the getters use has been read, up to STREAM_DRAIN_BYTES of the rest are read
+        without parsing. A fully read response hands its keep-alive connection back to the pool, closing
+        one half read drops the connection, so a longer tail trades a new connection for the transfer.
+
+        Args:
+            url_response (requests.models.Response): Response requested with stream=True.
+        """
+
+        parser = AthletePageParser()
+        chunks = url_response.iter_content(STREAM_CHUNK_SIZE)
+
+        try:
+            for chunk in chunks:
+                parser.feed(chunk)
+                if parser.complete:
+                    break
+
+            drained = 0
+            for chunk in chunks:
+                drained += len(chunk)
+                if drained >= STREAM_DRAIN_BYTES:
+                    break
+        finally:
+            url_response.close()
+
+        parser.close()
+
+        self._soup = None
+        self._page = parser.page
+
+    def _read_soup(self) -> AthletePage:
+        """Reads every element the getters use from _soup.
+
+        Returns:
+            AthletePage: Raw text of the page.
+        """
+
+        page = AthletePage()
+
+        for attribute, tag_name, class_name in (
+            ("masthead", "div", "l-masthead__headline"),
+            ("name", "h1", "hero-profile__name"),
+            ("nickname", "p", "hero-profile__nickname"),
+            ("division_title", "p", "hero-profile__division-title"),
+            ("division_body", "p", "hero-profile__division-body"),
+        ):
+            target = self._soup.find(tag_name, class_=class_name)
+            if target is not None:
+                setattr(page, attribute, target.get_text())
+
+        page.tags = [
+            target.get_text()
+            for target in self._soup.find_all("p", class_="hero-profile__tag")
+        ]
+        page.bio_fields = self._parse_bio_fields()
+        page.stat_compare = self._parse_stat_compare(
+            self._soup.find_all("div", class_="c-stat-compare__group")
         )
 
         # Striking and Grappling stats - 0 and 1 respectively
-        self._stats_targets = self._soup.find_all(
+        for target in self._soup.find_all(
             "div", class_="stats-records stats-records--two-column"
-        )
+        ):
+            title = target.find("title")
+            page.stat_blocks.append(
+                {
+                    "title": title.get_text() if title is not None else None,
+                    "values": [
+                        value.get_text()
+                        for value in target.find_all("dd", "c-overlap__stats-value")
+                    ],
+                }
+            )
+
+        # StrikePosition and Win Method stats - 0 and 1 respectively
+        for target in self._soup.find_all(
+            "div", class_="c-stat-3bar c-stat-3bar--no-chart"
+        ):
+            bar = []
+            for group in target.find_all("div", class_="c-stat-3bar__group"):
+                value = group.find("div", class_="c-stat-3bar__value")
+                bar.append(value.get_text() if value is not None else None)
+            page.stat_bars.append(bar)
+
+        svg = self._soup.find("svg", class_="c-stat-body__svg")
+        if svg is not None:
+            page.strike_targets = [
+                [text.get_text() for text in group.find_all("text")]
+                for group in svg.find_all("g")
+            ]
+
+        return page
+
+    def _parse_bio_fields(self) -> dict:
+        """Parses every bio field once, getters read the result instead of searching the page.
+
+        Returns:
+            dict: Bio labels with their raw text, first occurrence wins.
+        """
+
+        bio_fields = {}
+
+        for target in self._soup.find_all("div", class_="c-bio__field"):
+            label = target.find("div", class_="c-bio__label")
+            text = target.find("div", class_="c-bio__text")
+            if not label or not text:
+                continue
+
+            bio_fields.setdefault(label.get_text().strip(), text.get_text())
+
+        return bio_fields
 
-    def _parse_stat_block(self, target: Tag) -> tuple[int, int, int]:
-        """Parses stat block for striking and takedown stats, gets accuracy, landed and attempted information.
+    def _parse_stat_compare(self, groups: list[Tag]) -> dict:
+        """Parses stat compare groups once, getters read the result instead of searching the page.
 
         Args:
-            target (Tag): Tag containing desired stats.
+            groups (list[Tag]): c-stat-compare__group tags.
+
+        Returns:
+            dict: Stat labels with their value text, empty values are left out.
+        """
+
+        stat_compare = {}
+
+        for group in groups:
+            label = group.find("div", class_="c-stat-compare__label")
+            value = group.find("div", class_="c-stat-compare__number")
+            if not label or not value:
+                continue
+
+            value_text = value.get_text().replace("%", "").strip()
+            if value_text:
+                stat_compare[label.get_text().strip()] = value_text
+
+        return stat_compare
+
+    def _select_stats(self, stat_compare: dict, dict_keys: list[str]) -> dict:
+        """Selects numeric stats from parsed stat compare groups.
+
+        Args:
+            stat_compare (dict): Parsed stat compare groups.
+            dict_keys (list[str]): Stat labels to select.
+
+        Returns:
+            dict: Requested stats, 0 when missing.
+        """
+
+        stats = {key: 0 for key in dict_keys}
+
+        for key in dict_keys:
+            value_text = stat_compare.get(key)
+            if not value_text:
+                continue
+
+            if "." in value_text:
+                stats[key] = float(value_text)
+            else:
+                stats[key] = int(value_text)
+
+        return stats
+
+    def _parse_stat_block_text(
+        self, title: str | None, values: list[str]
+    ) -> tuple[int, int, int]:
+        """Parses stat block text for striking and takedown stats.
+
+        Args:
+            title (str | None): Accuracy title text.
+            values (list[str]): Landed and attempted text.
 
         Returns:
             tuple: (accuracy, landed, attempted)
@@ -105,98 +307,55 @@ class FighterScraper:
         stats = []
 
         try:
-            acc_target = target.find("title")
-            accuracy = acc_target.get_text().split()[-1].replace("%", "").strip()
+            accuracy = title.split()[-1].replace("%", "").strip()
             stats.append(int(accuracy))
         except (IndexError, AttributeError):
             stats.append(0)
 
-        targets = target.find_all("dd", "c-overlap__stats-value")
-        if not targets:
+        if not values:
             return stats[0], 0, 0
 
-        for target in targets:
-            target_text = target.get_text().strip()
-            if target_text:
-                stats.append(int(target_text))
+        for value in values:
+            value_text = value.strip()
+            if value_text:
+                stats.append(int(value_text))
             else:
                 stats.append(0)
 
         return tuple(stats)
 
-    def _parse_stats_section(
-        self, target: Tag
+    def _parse_stat_bar(
+        self, values: list[str | None]
     ) -> tuple[tuple[int, int], tuple[int, int], tuple[int, int]]:
-        """Parses stats section for strike position and win method information.
+        """Parses stat bar value text for strike position and win method information.
 
         Args:
-            target (Tag): Tag containing desired information.
+            values (list[str | None]): Value text of every bar group.
 
         Return
             tuple: Tuple containing tuples of target's value and percentage as ints.
         """
 
-        tags = target.find_all("div", class_="c-stat-3bar__group")
-        if not tags:
+        if not values:
             return (0, 0), (0, 0), (0, 0)
 
         stats = []
-        for tag in tags:
-            text_split = (
-                tag.find("div", class_="c-stat-3bar__value").get_text().split(" ")
-            )
+        for value_text in values:
             try:
+                text_split = value_text.split(" ")
                 value = int(text_split[0].strip())
                 value_per = int(
                     re.search(r"([0-9]+)", text_split[1].strip())
                     .group()
                     .replace("%", "")
                 )
-            except (IndexError, ValueError):
+            except (IndexError, ValueError, AttributeError):
                 value, value_per = 0, 0
 
             stats.append((value, value_per))
 
         return tuple(stats)
 
-    def _parse_result_set(self, result_set: ResultSet, dict_keys: list[str]) -> dict:
-        """Parses result set for supplied dictionary keys and returns them as a dictionary.
-
-        Args:
-            result_set (ResultSet): ResultSet object containing fighters striking and grappling information.
-            dict_keys (list[str]): List of dictionary keys to find within result_set.
-
-        Returns:
-            dict: Dictionary of requested information from ResultSet.
-        """
-
-        stats = {key: 0 for key in dict_keys}
-
-        for result in result_set:
-            for target in result.find_all("div", class_="c-stat-compare__group"):
-                label = target.find("div", class_="c-stat-compare__label")
-
-                if not label:
-                    break
-
-                label = label.get_text().strip()
-                if label not in dict_keys:
-                    continue
-
-                value = target.find("div", class_="c-stat-compare__number")
-                if not value:
-                    continue
-
-                value_text = value.get_text().replace("%", "").strip()
-                if value_text:
-                    if "." in value_text:
-                        value_text = float(value_text)
-                    else:
-                        value_text = int(value_text)
-                    stats[label] = value_text
-
-        return stats
-
     def _get_name(self) -> str:
         """Gets fighter name.
 
@@ -204,18 +363,11 @@ class FighterScraper:
             str: Fighter's full name.
         """
 
-        name = ""
-
-        target = self._soup.find("h1", class_="hero-profile__name")
-        if target:
-            name = target.get_text()
+        name = self._page.name or ""
 
         name = name.replace("-", " ")
 
-        try:
-            name = self._incorrect_names[name]
-        except (KeyError, TypeError):
-            name = name
+        name = correct_fighter_name(name, self._incorrect_names)
 
         return unidecode(name.strip())
 
@@ -228,9 +380,8 @@ class FighterScraper:
 
         nickname = ""
 
-        target = self._soup.find("p", class_="hero-profile__nickname")
-        if target:
-            nickname = target.get_text().strip()
+        if self._page.nickname is not None:
+            nickname = self._page.nickname.strip()
             nickname = nickname.replace('"', "")
 
         return nickname
@@ -242,18 +393,11 @@ class FighterScraper:
             str: Status.
         """
 
-        status = "Unknown"
+        status = self._page.bio_fields.get("Status")
+        if status is None:
+            return "Unknown"
 
-        targets = self._soup.find_all("div", class_="c-bio__field")
-        for target in targets:
-            label = target.find("div", class_="c-bio__label").get_text()
-            if label != "Status":
-                continue
-
-            status = target.find("div", class_="c-bio__text").get_text().strip()
-            break
-
-        return status
+        return status.strip()
 
     def _get_ranking(self) -> tuple[str, str]:
         """Gets fighter's division and pound for pound ranking.
@@ -266,12 +410,8 @@ class FighterScraper:
 
         champion_keywords = ("Interim", "Champion", "Title")
 
-        targets = self._soup.find_all("p", class_="hero-profile__tag")
-        if not targets:
-            return ranking, pfp_ranking
-
-        for target in targets:
-            text = target.get_text().strip()
+        for tag in self._page.tags:
+            text = tag.strip()
             for keyword in champion_keywords:
                 if keyword not in text:
                     continue
@@ -295,22 +435,19 @@ class FighterScraper:
             str: Weight class.
         """
 
-        target = self._soup.find("p", class_="hero-profile__division-title")
-        if target:
-            target_text = target.get_text().strip()
+        if self._page.division_title is not None:
+            target_text = self._page.division_title.strip()
             if target_text:
                 return target_text
 
         # Fallback to checking profile "pills" if weight class section is missing
-        targets = self._soup.find_all("p", class_="hero-profile__tag")
-        if targets:
-            for target in targets:
-                target_text = target.get_text().strip()
-                if not target_text:
-                    continue
+        for tag in self._page.tags:
+            target_text = tag.strip()
+            if not target_text:
+                continue
 
-                if "weight" in target_text:
-                    return target_text
+            if "weight" in target_text:
+                return target_text
 
         return "Unlisted"
 
@@ -323,26 +460,16 @@ class FighterScraper:
 
         city, country = "Unlisted", "Unlisted"
 
-        targets = self._soup.find_all("div", class_="c-bio__field")
-        if not targets:
+        target_text = self._page.bio_fields.get("Place of Birth")
+        if not target_text:
             return city, country
 
-        for target in targets:
-            label = target.find("div", class_="c-bio__label").get_text()
-            if label != "Place of Birth":
-                continue
-
-            target_text = target.find("div", class_="c-bio__text").get_text()
-            if not target_text:
-                break
-
-            split_text = target_text.split(", ")
-            if len(split_text) > 1:
-                city = split_text[0].strip()
-                country = split_text[1].strip()
-            else:
-                country = target_text.strip()
-            break
+        split_text = target_text.split(", ")
+        if len(split_text) > 1:
+            city = split_text[0].strip()
+            country = split_text[1].strip()
+        else:
+            country = target_text.strip()
 
         return city, country
 
@@ -353,24 +480,9 @@ class FighterScraper:
             str: Gym.
         """
 
-        gym = "Unlisted"
-
-        targets = self._soup.find_all("div", class_="c-bio__field")
-        if not targets:
-            return gym
-
-        for target in targets:
-            label = target.find("div", class_="c-bio__label").get_text()
-            if label != "Trains at":
-                continue
-
-            target_text = target.find("div", class_="c-bio__text").get_text().strip()
-            if not target_text:
-                break
-
-            return target_text
+        gym = self._page.bio_fields.get("Trains at", "").strip()
 
-        return gym
+        return gym or "Unlisted"
 
     def _get_fighting_style(self) -> str:
         """Gets fighter's fighting style.
@@ -379,24 +491,9 @@ class FighterScraper:
             str: Fighting style.
         """
 
-        fighting_style = "Unlisted"
+        fighting_style = self._page.bio_fields.get("Fighting style", "").strip()
 
-        targets = self._soup.find_all("div", class_="c-bio__field")
-        if not targets:
-            return fighting_style
-
-        for target in targets:
-            label = target.find("div", class_="c-bio__label").get_text()
-            if label != "Fighting style":
-                continue
-
-            target_text = target.find("div", class_="c-bio__text").get_text().strip()
-            if not target_text:
-                break
-
-            return target_text
-
-        return fighting_style
+        return fighting_style or "Unlisted"
 
     def _get_average_fight_time(self) -> str:
         """Gets fighter's average fight time.
@@ -405,25 +502,7 @@ class FighterScraper:
             str: Average fight time.
         """
 
-        average_fight_time = "00:00"
-
-        targets = self._soup.find_all(
-            "div", class_="c-stat-compare__group c-stat-compare__group-2"
-        )
-        if not targets:
-            return average_fight_time
-
-        for target in targets:
-            label = target.find("div", class_="c-stat-compare__label").get_text()
-            if label != "Average fight time":
-                continue
-
-            target_text = target.find("div", class_="c-stat-compare__number")
-            target_text = target_text.get_text().strip()
-            if target_text:
-                average_fight_time = target_text
-
-        return average_fight_time
+        return self._page.stat_compare.get("Average fight time") or "00:00"
 
     def _get_strike_position_stats(
         self,
@@ -440,9 +519,7 @@ class FighterScraper:
         """
 
         try:
-            strike_position_stats_section = self._stats_section[0]
-
-            return self._parse_stats_section(strike_position_stats_section)
+            return self._parse_stat_bar(self._page.stat_bars[0])
         except IndexError:
             return (0, 0), (0, 0), (0, 0)
 
@@ -455,20 +532,17 @@ class FighterScraper:
 
         strike_target_stats = {}
 
-        target = self._soup.find("svg", class_="c-stat-body__svg")
-        if not target:
+        if not self._page.strike_targets:
             return {"head": (0, 0), "body": (0, 0), "leg": (0, 0)}
 
-        targets = target.find_all("g")
-        for target in targets:
-            text_targets = target.find_all("text")
+        for text_targets in self._page.strike_targets:
             if not text_targets:
                 continue
 
-            stats_key = text_targets[2].get_text().strip().lower()
+            stats_key = text_targets[2].strip().lower()
             stats = []
             for i in range(1, -1, -1):
-                stat = text_targets[i].get_text().replace("%", "").strip()
+                stat = text_targets[i].replace("%", "").strip()
                 try:
                     stat = int(stat)
                 except ValueError:
@@ -485,9 +559,11 @@ class FighterScraper:
             dict: Dictionary containing fighter's striking information.
         """
 
-        # if _stats_targets[0] doesn't exist we catch the error
+        # if stat_blocks[0] doesn't exist we catch the error
         try:
-            accuracy, landed, attempted = self._parse_stat_block(self._stats_targets[0])
+            accuracy, landed, attempted = self._parse_stat_block_text(
+                **self._page.stat_blocks[0]
+            )
         except IndexError:
             accuracy, landed, attempted = 0, 0, 0
 
@@ -503,7 +579,7 @@ class FighterScraper:
             "Sig. Str. Defense",
             "Knockdown Avg",
         ]
-        striking_results = self._parse_result_set(self._stats_targets, dict_keys)
+        striking_results = self._select_stats(self._page.stat_compare, dict_keys)
         striking_stats_block2 = {
             "strikes_average": striking_results["Sig. Str. Landed"],
             "strikes_absorbed_average": striking_results["Sig. Str. Absorbed"],
@@ -524,10 +600,8 @@ class FighterScraper:
 
         win, loss, draw = 0, 0, 0
 
-        target = self._soup.find("p", class_="hero-profile__division-body")
-
         try:
-            text = target.get_text().strip().split()[0]
+            text = self._page.division_body.strip().split()[0]
             record_values = [int(value) if value.isdigit() else 0 for value in text.split("-")]
             return tuple(record_values)
         except (IndexError, AttributeError):
@@ -547,9 +621,7 @@ class FighterScraper:
         """
 
         try:
-            win_method_stats_section = self._stats_section[1]
-
-            return self._parse_stats_section(win_method_stats_section)
+            return self._parse_stat_bar(self._page.stat_bars[1])
         except IndexError:
             return (0, 0), (0, 0), (0, 0)
 
@@ -561,21 +633,18 @@ class FighterScraper:
         """
 
         field_names = ["Age", "Height", "Weight", "Reach", "Leg reach"]
-        targets = self._soup.find_all("div", class_="c-bio__field")
 
         physical_stats = {key.lower().replace(" ", "_"): 0 for key in field_names}
-        for target in targets:
-            label = target.find("div", class_="c-bio__label").get_text()
-            if label not in field_names:
+        for label in field_names:
+            field_value = self._page.bio_fields.get(label, "").strip()
+            if not field_value:
                 continue
 
             key = label.lower().replace(" ", "_")
-            field_value = target.find("div", class_="c-bio__text").get_text().strip()
-            if field_value:
-                if label == "Age":
-                    physical_stats[key] = int(field_value)
-                    continue
-                physical_stats[key] = float(field_value)
+            if label == "Age":
+                physical_stats[key] = int(field_value)
+                continue
+            physical_stats[key] = float(field_value)
 
         return physical_stats
 
@@ -586,9 +655,11 @@ class FighterScraper:
             dict: Dictionary containing fighter's grappling information.
         """
 
-        # if _stats_targets[1] doesn't exist we catch the error
+        # if stat_blocks[1] doesn't exist we catch the error
         try:
-            accuracy, landed, attempted = self._parse_stat_block(self._stats_targets[1])
+            accuracy, landed, attempted = self._parse_stat_block_text(
+                **self._page.stat_blocks[1]
+            )
         except IndexError:
             accuracy, landed, attempted = 0, 0, 0
 
@@ -599,7 +670,7 @@ class FighterScraper:
         }
 
         dict_keys = ["Takedown avg", "Takedown Defense", "Submission avg"]
-        grappling_results = self._parse_result_set(self._stats_targets, dict_keys)
+        grappling_results = self._select_stats(self._page.stat_compare, dict_keys)
         grappling_stats_block2 = {
             "takedowns_average": grappling_results["Takedown avg"],
             "takedown_defence": grappling_results["Takedown Defense"],
@@ -737,22 +808,111 @@ class FighterScraper:
 
         return Grappling(**grappling_stats)
 
-    def scrape_fighter(self) -> Fighter:
-        """Scrapes fighter data from loaded fighter url.
+    def _load_corrections(self) -> None:
+        """Retrieves correction maps that were not supplied to the scraper."""
+
+        if self._incorrect_urls is None:
+            self._incorrect_urls = get_incorrect_urls(self._transport)
+        if self._incorrect_names is None:
+            self._incorrect_names = get_incorrect_names(self._transport)
+
+    def _get_candidate_urls(self, fighter_url: str) -> list[str]:
+        """Returns urls to request for fighter_url, most likely first.
+
+        Args:
+            fighter_url (str): Supplied fighter url.
+
+        Returns:
+            list[str]: Remembered canonical url, corrected url and supplied url without duplicates.
+        """
+
+        candidate_urls = [
+            self._url_map.get(fighter_url),
+            set_fighter_url(fighter_url, self._incorrect_urls),
+            fighter_url,
+        ]
+
+        return list(dict.fromkeys(url for url in candidate_urls if url))
+
+    def _is_miss(self, url_response: requests.models.Response, extractor: str) -> bool:
+        """Checks whether response is a search page instead of an athlete page without parsing it.
+
+        Args:
+            url_response (requests.models.Response): Fighter page response.
+            extractor (str): One of EXTRACTORS, streamed bodies are not scanned.
+
+        Returns:
+            bool: Whether the fighter is missing at the requested url.
+        """
+
+        if url_response.status_code == 404:
+            return True
+
+        parts = urlsplit(url_response.url or "")
+        host = parts.netloc.lower()
+        is_ufc = host in ("www.ufc.com", "ufc.com")
+        if is_ufc and not parts.path.startswith("/athlete/"):
+            return True
+
+        if extractor == "stream":
+            return False
+
+        return bool(
+            SEARCH_RESULTS_PATTERN.search(url_response.content, 0, MISS_SCAN_BYTES)
+        )
+
+    def _parse_candidate(
+        self, url_response: requests.models.Response, extractor: str
+    ) -> Fighter:
+        """Parses candidate url response, raises FighterNotFound on a miss.
+
+        Args:
+            url_response (requests.models.Response): Fighter page response.
+            extractor (str): One of EXTRACTORS.
 
         Returns:
             Fighter: Fighter object containing fighter's data.
         """
 
-        url_response = requests.get(self.fighter_url)
+        if self._is_miss(url_response, extractor):
+            url_response.close()
+            raise FighterNotFound(f"{self.fighter_url} is not an athlete page.")
+
+        return self._parse_fighter(url_response, extractor)
+
+    def _remember_url(self, fighter_url: str, attempt: int) -> None:
+        """Remembers canonical url of fighter_url if it was not the first url requested."""
+
+        if attempt:
+            self._url_map.set(fighter_url, self.fighter_url)
+
+    def _parse_fighter(
+        self, url_response: requests.models.Response, extractor: str = "soup"
+    ) -> Fighter:
+        """Parses fighter page response and returns it as a Fighter object.
+
+        Args:
+            url_response (requests.models.Response): Fighter page response.
+            extractor (str, optional): One of EXTRACTORS. Defaults to "soup".
+
+        Returns:
+            Fighter: Fighter object containing fighter's data.
+        """
+
+        if extractor not in EXTRACTORS:
+            raise ValueError(f"Unknown extractor {extractor}, use one of {EXTRACTORS}")
 
         url_response.raise_for_status()
 
-        self._create_soup(url_response.content)
-        
+        if extractor == "stream":
+            self._stream(url_response)
+        elif extractor == "tokenizer":
+            self._tokenize(url_response.content)
+        else:
+            self._create_soup(url_response.content)
+
         if self._fighter_not_found():
-            self.fighter_url = set_fighter_url(self.fighter_url, self._incorrect_urls)
-            self.scrape_fighter()
+            raise FighterNotFound(f"{self.fighter_url} is not an athlete page.")
 
         ranking, pfp_ranking = self._get_ranking()
         home_city, home_country = self._get_hometown()
@@ -779,3 +939,69 @@ class FighterScraper:
         fighter_obj = Fighter(**fighter_data)
 
         return fighter_obj
+
+    def scrape_fighter(self, extractor: str = "soup") -> Fighter:
+        """Scrapes fighter data from loaded fighter url.
+
+        Args:
+            extractor (str, optional): One of EXTRACTORS, "tokenizer" reads the page without building a tree and
+            "stream" stops downloading once the scraped sections are read. Defaults to "soup".
+
+        Returns:
+            Fighter: Fighter object containing fighter's data.
+        """
+
+        self._load_corrections()
+
+        fighter_url = self.fighter_url
+        for attempt, candidate_url in enumerate(self._get_candidate_urls(fighter_url)):
+            self.fighter_url = candidate_url
+            url_response = self._transport.get(
+                candidate_url, stream=extractor == "stream"
+            )
+            try:
+                fighter = self._parse_candidate(url_response, extractor)
+            except FighterNotFound:
+                continue
+
+            self._remember_url(fighter_url, attempt)
+
+            return fighter
+
+        self.fighter_url = fighter_url
+
+        raise FighterNotFound(f"{fighter_url} is not an athlete page.")
+
+    async def scrape_fighter_async(self, extractor: str = "soup") -> Fighter:
+        """Scrapes fighter data from loaded fighter url without blocking the event loop.
+
+        Args:
+            extractor (str, optional): One of EXTRACTORS, "tokenizer" reads the page without building a tree and
+            "stream" stops downloading once the scraped sections are read. Defaults to "soup".
+
+        Returns:
+            Fighter: Fighter object containing fighter's data.
+        """
+
+        await asyncio.to_thread(self._load_corrections)
+
+        fighter_url = self.fighter_url
+        for attempt, candidate_url in enumerate(self._get_candidate_urls(fighter_url)):
+            self.fighter_url = candidate_url
+            url_response = await self._transport.get_async(
+                candidate_url, stream=extractor == "stream"
+            )
+            try:
+                fighter = await asyncio.to_thread(
+                    self._parse_candidate, url_response, extractor
+                )
+            except FighterNotFound:
+                continue
+
+            await asyncio.to_thread(self._remember_url, fighter_url, attempt)
+
+            return fighter
+
+        self.fighter_url = fighter_url
+
+        raise FighterNotFound(f"{fighter_url} is not an athlete page.")
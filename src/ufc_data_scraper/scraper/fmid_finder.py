@@ -1,55 +1,148 @@
+import asyncio
+import collections
+import itertools
 import json
+import time
 import concurrent.futures
 import requests
 import pytz
 
-from bs4 import BeautifulSoup, SoupStrainer
 from datetime import datetime, timedelta
-
+from html.parser import HTMLParser
+from typing import Iterator
+
+from ufc_data_scraper.cache import (
+    FmidIndex,
+    KnownEvents,
+    get_fmid_index,
+    get_known_events,
+)
 from ufc_data_scraper.exceptions import InvalidEventUrl, MissingEventFMID
 
-from ufc_data_scraper.utils import convert_date
+from ufc_data_scraper.transport import (
+    Transport,
+    get_transport,
+    MAX_WORKERS,
+    API_URL,
+    UFC_URL,
+)
+
+from ufc_data_scraper.utils import convert_date, create_soup
 
+BRUTE_FORCE_MAX_PROBES = 64
+BRUTE_FORCE_DEADLINE = 30.0
+BRUTE_FORCE_WINDOW = 8
+DATE_TOLERANCE = timedelta(days=2)
+HERO_CLASSES = {"c-hero__headline-suffix", "tz-change-inner"}
 
-def _page_has_event_links(site_content: bytes) -> bool:
-    """Checks if page has event links.
+
+def _parse_event_urls(site_content: bytes | str) -> list[str]:
+    """Returns event urls linked from an events listing page, in page order without duplicates.
 
     Args:
-        site_content (bytes): Site raw response content.
+        site_content (bytes | str): Site raw response content.
 
     Returns:
-        bool: Whether page has event links.
+        list[str]: Event urls, empty if the page has no event links.
     """
 
-    soup = BeautifulSoup(site_content, "html.parser")
+    soup = create_soup(site_content, regions=("c-card-event--result__headline",))
 
-    return soup.find("h3", class_="c-card-event--result__headline") and True or False
+    event_urls = {}
+    for headline in soup.find_all("h3", class_="c-card-event--result__headline"):
+        link = headline.find("a", href=True)
+        if link:
+            event_urls[f"{UFC_URL}{link['href']}"] = None
 
+    return list(event_urls)
 
-def _valid_event_page(site_content: bytes) -> bool:
-    """Checks if page is a valid event page.
 
-    Args:
-        site_content (bytes): Site raw response content.
+class _EventPageParser(HTMLParser):
+    """Collects hero date and json scripts from an event page in a single pass."""
 
-    Returns:
-        bool: Whether page is a valid event page.
-    """
+    def __init__(self) -> None:
+        super().__init__()
+        self.hero_text = None
+        self.scripts = []
+        self._hero_depth = 0
+        self._in_json_script = False
 
-    soup = BeautifulSoup(site_content, "html.parser")
+    def handle_starttag(self, tag: str, attrs: list) -> None:
+        if self._hero_depth:
+            if tag == "div":
+                self._hero_depth += 1
+            return
 
-    return (
-        soup.find("div", class_="c-hero__headline-suffix tz-change-inner")
-        and True
-        or False
-    )
+        attrs = dict(attrs)
+        classes = set((attrs.get("class") or "").split())
+
+        if tag == "div" and self.hero_text is None and HERO_CLASSES <= classes:
+            self._hero_depth = 1
+            self.hero_text = []
+        elif tag == "script" and attrs.get("type") == "application/json":
+            self._in_json_script = True
+            self.scripts.append([])
+
+    def handle_endtag(self, tag: str) -> None:
+        if self._hero_depth and tag == "div":
+            self._hero_depth -= 1
+        elif tag == "script":
+            self._in_json_script = False
+
+    def handle_data(self, data: str) -> None:
+        if self._hero_depth:
+            self.hero_text.append(data)
+        elif self._in_json_script:
+            self.scripts[-1].append(data)
+
+
+class EventPage:
+    def __init__(self, site_content: bytes | str) -> None:
+        """Event page parsed once, exposing everything fmid_finder needs from it.
+
+        Args:
+            site_content (bytes | str): Site raw response content.
+
+        >>> event_page = EventPage(requests.get("https://www.ufc.com/event/ufc-282").content)
+        >>> event_page.is_valid, event_page.fmid, event_page.date
+        (True, 1124, "Sat, Dec 10 / 10:00 PM EST")
+        """
+
+        if isinstance(site_content, bytes):
+            site_content = site_content.decode("utf-8", errors="replace")
+
+        parser = _EventPageParser()
+        parser.feed(site_content)
+        parser.close()
 
+        self.is_valid = parser.hero_text is not None
+        self.date = "".join(parser.hero_text).strip() if self.is_valid else None
+        self.fmid = self._parse_fmid(parser.scripts)
 
-def get_event_urls(page_num: int) -> list[str] | None:
+    @staticmethod
+    def _parse_fmid(scripts: list[list[str]]) -> int | None:
+        """Returns event fmid from the last json script on the page.
+
+        Args:
+            scripts (list[list[str]]): Text of every json script on the page.
+
+        Returns:
+            int: Event FMID or None if it cannot be scraped.
+        """
+
+        try:
+            site_scripts = json.loads("".join(scripts[-1]))
+            return int(site_scripts["eventLiveStats"]["event_fmid"])
+        except (KeyError, IndexError, TypeError, ValueError):
+            return None
+
+
+def get_event_urls(page_num: int, transport: Transport = None) -> list[str] | None:
     """Queries events with page_num and adds event urls to list.
 
     Args:
         page_num (int): Page number for query.
+        transport (Transport, optional): Transport to request with. Defaults to the shared transport.
 
     Returns:
         list[str]: List of event urls returned from query.
@@ -57,106 +150,148 @@ def get_event_urls(page_num: int) -> list[str] | None:
 
     page_query = {"page": page_num}
 
-    site_response = requests.get("http://www.ufc.com/events", params=page_query)
+    transport = transport or get_transport()
+    site_response = transport.get(f"{UFC_URL}/events", params=page_query)
 
-    if site_response.status_code != 200 or not _page_has_event_links(
-        site_response.content
-    ):
+    if site_response.status_code != 200:
         return
 
-    only_headlines = SoupStrainer(
-        "h3", attrs={"class": "c-card-event--result__headline"}
-    )
-    soup = BeautifulSoup(site_response.text, "html.parser", parse_only=only_headlines)
-
-    headlines = list(soup)
+    return _parse_event_urls(site_response.content) or None
 
-    event_urls = []
 
-    for item in headlines:
-        url = item.find("a")["href"]
-        url = f"http://www.ufc.com{url}"
-        if url not in event_urls:
-            event_urls.append(url)
+def iter_event_urls(
+    start_page: int = 0,
+    max_pages: int = None,
+    window: int = MAX_WORKERS,
+    transport: Transport = None,
+) -> Iterator[str]:
+    """Yields event urls from the events listing, newest first, fetching pages concurrently.
 
-    return event_urls
+    Pages are requested window at a time ahead of the one being read. Crawling stops at the first
+    page without event links and every url is only yielded once.
 
+    Args:
+        start_page (int, optional): First listing page. Defaults to 0.
+        max_pages (int, optional): Maximum number of pages to crawl. Defaults to every page.
+        window (int, optional): Number of pages requested at once. Defaults to MAX_WORKERS.
+        transport (Transport, optional): Transport to request with. Defaults to the shared transport.
 
-def _get_last_fmid() -> int:
-    """Returns last available fmid from UFC events page.
+    >>> for event_url in iter_event_urls():
+    ...     print(event_url)
 
-    Returns:
-        int: Latest FMID from queried event urls.
+    Yields:
+        str: Event url.
     """
 
-    recent_events = get_event_urls(page_num=0)
-    next_upcoming_event = recent_events[9]
+    transport = transport or get_transport()
+    pages = itertools.count(start_page)
+    if max_pages is not None:
+        pages = iter(range(start_page, start_page + max_pages))
 
-    return _scrape_event_fmid(requests.get(next_upcoming_event))
+    seen = set()
+    futures = collections.deque()
 
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=window)
+    try:
+        for page_num in itertools.islice(pages, window):
+            futures.append(executor.submit(get_event_urls, page_num, transport))
 
-# def _get_last_fmid() -> int:
-#     """Returns last available fmid from UFC events page.
+        while futures:
+            event_urls = futures.popleft().result()
+            if not event_urls:
+                return
 
-#     Returns:
-#         int: Latest FMID from queried event urls.
-#     """
+            page_num = next(pages, None)
+            if page_num is not None:
+                futures.append(executor.submit(get_event_urls, page_num, transport))
 
-#     recent_events = get_event_urls(page_num=0)
+            for event_url in event_urls:
+                if event_url not in seen:
+                    seen.add(event_url)
+                    yield event_url
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
 
-#     with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
-#         futures = [
-#             executor.submit(
-#                 _scrape_event_fmid,
-#                 requests.get(event_url),
-#             )
-#             for event_url in recent_events
-#         ]
 
-#     event_fmids = [future.result() for future in futures if future.result()]
+def sync_event_urls(
+    known_events: KnownEvents = None, transport: Transport = None
+) -> list[str]:
+    """Returns event urls added to the events listing since the last sync and marks them as known.
 
-#     return max(event_fmids)
+    Pages are walked newest first and walking stops at the first page with only known events,
+    so a sync without new events costs a single request.
 
+    Args:
+        known_events (KnownEvents, optional): Event urls seen by previous syncs. Defaults to the shared known events.
+        transport (Transport, optional): Transport to request with. Defaults to the shared transport.
 
-def _get_event_data(event_fmid: int) -> dict | None:
-    """Queries private API and returns json data in dict format.
+    >>> new_event_urls = sync_event_urls()
+
+    Returns:
+        list[str]: New event urls, newest first.
+    """
+
+    known_events = known_events if known_events is not None else get_known_events()
+    transport = transport or get_transport()
+
+    new_event_urls = {}
+
+    for page_num in itertools.count():
+        event_urls = get_event_urls(page_num, transport)
+        if not event_urls:
+            break
+
+        page_new_urls = [url for url in event_urls if url not in known_events]
+        if not page_new_urls:
+            break
+
+        new_event_urls.update(dict.fromkeys(page_new_urls))
+
+    new_event_urls = list(new_event_urls)
+    known_events.add(new_event_urls)
+
+    return new_event_urls
+
+
+def _get_last_fmid(transport: Transport = None) -> int | None:
+    """Returns last available fmid from UFC events page.
 
     Args:
-        event_fmid (int): FMID to query.
+        transport (Transport, optional): Transport to request with. Defaults to the shared transport.
 
     Returns:
-        dict: Event data json in dict format
+        int: Latest FMID from queried event urls or None if its page has no fmid.
     """
 
-    events_endpoint = (
-        f"http://d29dxerjsp82wz.cloudfront.net/api/v3/event/live/{event_fmid}.json"
-    )
-    site_response = requests.get(events_endpoint)
+    transport = transport or get_transport()
 
-    if site_response.status_code != 200:
-        return None
+    recent_events = get_event_urls(page_num=0, transport=transport)
+    next_upcoming_event = recent_events[9]
 
-    return site_response.json().get("LiveEventDetail")
+    return EventPage(transport.get(next_upcoming_event).content).fmid
 
 
-def _get_event_date(soup: BeautifulSoup) -> str | None:
-    """Returns event date.
+def _get_event_data(event_fmid: int, transport: Transport = None) -> dict | None:
+    """Queries private API and returns json data in dict format.
 
     Args:
-        soup (BeautifulSoup): BeautifulSoup object of page response.
+        event_fmid (int): FMID to query.
+        transport (Transport, optional): Transport to request with. Defaults to the shared transport.
 
     Returns:
-        str: Event date in simple string format or None if it cannot be scraped.
-        >>> "Sun, Dec 18 / 2:00 AM SAST"
+        dict: Event data json in dict format
     """
 
-    target = soup.select(
-        "#block-mainpagecontent > div > div.c-hero > div.c-hero__container > div > div.c-hero__bottom-text > div.c-hero__headline-suffix.tz-change-inner"
-    )
-    if len(target) < 1:
+    events_endpoint = f"{API_URL}/api/v3/event/live/{event_fmid}.json"
+    transport = transport or get_transport()
+    site_response = transport.get(events_endpoint)
+
+    if site_response.status_code != 200:
         return None
 
-    return target[0].get_text().strip()
+    return site_response.json().get("LiveEventDetail")
 
 
 def _convert_scraped_date(date: str) -> datetime:
@@ -193,75 +328,294 @@ def _convert_scraped_date(date: str) -> datetime:
     return date_time_obj
 
 
-def _scrape_event_fmid(site_response: requests.models.Response) -> int:
-    """Gets event fmid from response, fmid can be used as API query.
+def _get_api_date(event_fmid: int, transport: Transport = None) -> datetime | None:
+    """Returns event start time from private API.
 
     Args:
-        site_response (requests.models.Response): Url response to scrape for event fmid.
+        event_fmid (int): FMID to query.
+        transport (Transport, optional): Transport to request with. Defaults to the shared transport.
 
     Returns:
-        int: Event FMID, can be used as API query or None if it cannot be scraped.
+        datetime: Event start time, localized to GMT or None if there is no event.
     """
 
-    only_script = SoupStrainer("script", attrs={"type": "application/json"})
-    soup = BeautifulSoup(site_response.content, "html.parser", parse_only=only_script)
+    data = _get_event_data(event_fmid, transport)
+    if not data:
+        return None
 
-    try:
-        site_scripts = json.loads(list(soup)[-1].text)
-        fmid = int(site_scripts["eventLiveStats"]["event_fmid"])
-    except (KeyError, IndexError):
-        fmid = None
+    return convert_date(data.get("StartTime"))
 
-    return fmid
 
+def _next_candidates(
+    probed: dict,
+    anchor: int,
+    lower: int | None,
+    upper: int | None,
+    step: int,
+    count: int,
+) -> list[int]:
+    """Returns fmids to probe next, galloping away from a single bound or bisecting between two.
+
+    Args:
+        probed (dict): Already probed fmids.
+        anchor (int): Fmid the search starts from.
+        lower (int): Highest fmid known to be before the target or None.
+        upper (int): Lowest fmid known to be after the target or None.
+        step (int): Gallop step.
+        count (int): Maximum number of candidates.
+
+    Returns:
+        list[int]: Fmids to probe.
+    """
 
-def _brute_force_event_fmid(site_response: requests.models.Response) -> int | None:
+    if lower is None and upper is None:
+        candidates = [anchor + i for i in range(count)]
+    elif upper is None:
+        candidates = [lower + step * (i + 1) for i in range(count)]
+    elif lower is None:
+        candidates = [upper - step * (i + 1) for i in range(count)]
+    else:
+        gap = upper - lower - 1
+        if gap <= count:
+            candidates = list(range(lower + 1, upper))
+        else:
+            candidates = [
+                lower + (gap + 1) * (i + 1) // (count + 1) for i in range(count)
+            ]
+
+    return [
+        fmid for fmid in dict.fromkeys(candidates) if fmid > 0 and fmid not in probed
+    ]
+
+
+def _brute_force_event_fmid(
+    event_page: EventPage,
+    transport: Transport = None,
+    max_probes: int = BRUTE_FORCE_MAX_PROBES,
+    deadline: float = BRUTE_FORCE_DEADLINE,
+    window: int = BRUTE_FORCE_WINDOW,
+) -> int | None:
     """Attempt to brute force guess the event fmid if it is not available from the event url.
 
+    Fmids are probed concurrently in windows around the last listed fmid. API start times increase with
+    fmid, so the search gallops until the page date is bracketed and then bisects.
+
     Args:
-        site_response (requests.models.Response): Url response to guess fmid from.
+        event_page (EventPage): Event page to guess fmid from.
+        transport (Transport, optional): Transport to request with. Defaults to the shared transport.
+        max_probes (int, optional): Maximum number of API requests. Defaults to BRUTE_FORCE_MAX_PROBES.
+        deadline (float, optional): Seconds before giving up. Defaults to BRUTE_FORCE_DEADLINE.
+        window (int, optional): Number of fmids probed at once. Defaults to BRUTE_FORCE_WINDOW.
 
     Returns:
         int: Event FMID, can be used as API query or None if it cannot be acquired.
     """
 
-    current_fmid = _get_last_fmid()
+    if not event_page.date:
+        return None
 
-    while True:
-        data = _get_event_data(current_fmid)
+    target_date = _convert_scraped_date(event_page.date)
+    transport = transport or get_transport()
+    expires_at = time.monotonic() + deadline
 
-        if not data or (data and len(data) < 1):
-            break
+    # Without a known fmid there is nowhere to start the search from
+    anchor = _get_last_fmid(transport)
+    if anchor is None:
+        return None
 
-        soup = BeautifulSoup(site_response.content, "html.parser")
+    probed = {}
+    lower = upper = None
+    step = 1
 
-        scraped_date = _get_event_date(soup)
-        if scraped_date:
-            scraped_date = _convert_scraped_date(scraped_date)
-            api_date = convert_date(data["StartTime"])
-            if abs(scraped_date - api_date) <= timedelta(days=2):
-                return current_fmid
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=window)
+    try:
+        while len(probed) < max_probes:
+            timeout = expires_at - time.monotonic()
+            if timeout <= 0:
+                break
+
+            count = min(window, max_probes - len(probed))
+            candidates = _next_candidates(probed, anchor, lower, upper, step, count)
+            if not candidates:
+                break
+
+            futures = {
+                executor.submit(_get_api_date, fmid, transport): fmid
+                for fmid in candidates
+            }
+            done, not_done = concurrent.futures.wait(futures, timeout=timeout)
+
+            for future in done:
+                fmid = futures[future]
+                api_date = probed[fmid] = future.result()
+
+                # Missing events are past the newest fmid
+                if api_date is None or api_date > target_date + DATE_TOLERANCE:
+                    upper = fmid if upper is None else min(upper, fmid)
+                elif api_date < target_date - DATE_TOLERANCE:
+                    lower = fmid if lower is None else max(lower, fmid)
+
+            matches = [
+                fmid
+                for fmid, api_date in probed.items()
+                if api_date and abs(target_date - api_date) <= DATE_TOLERANCE
+            ]
+            if matches:
+                return min(matches, key=lambda fmid: abs(target_date - probed[fmid]))
+
+            if not_done or (lower is not None and upper is not None and lower >= upper):
+                break
+
+            step *= 2
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
-        current_fmid += 1
     return None
 
 
-def get_event_fmid(event_url: str) -> int | None:
-    """Gets event fmids from url, fmid can be used as API query.
+def _get_fmid_from_response(
+    event_url: str, site_response: requests.models.Response, transport: Transport
+) -> int:
+    """Gets event fmid from event page response, falling back to brute forcing it.
+
+    Args:
+        event_url (str): UFC Event page.
+        site_response (requests.models.Response): Event page response.
+        transport (Transport): Transport to request with.
 
     Returns:
         int: Event FMID, can be used as API query.
     """
 
-    site_response = requests.get(event_url)
-
     site_response.raise_for_status()
 
-    if not _valid_event_page(site_response.content):
+    event_page = EventPage(site_response.content)
+    if not event_page.is_valid:
         raise InvalidEventUrl
 
-    fmid = _scrape_event_fmid(site_response) or _brute_force_event_fmid(site_response)
+    fmid = event_page.fmid or _brute_force_event_fmid(event_page, transport)
     if not fmid:
         raise MissingEventFMID(f"FMID could not be found for {event_url}")
 
     return fmid
+
+
+def get_event_fmid(
+    event_url: str, transport: Transport = None, fmid_index: FmidIndex = None
+) -> int | None:
+    """Gets event fmids from url, fmid can be used as API query.
+
+    Indexed urls are answered without a request, resolved fmids are added to the index.
+
+    Args:
+        event_url (str): UFC Event page.
+        transport (Transport, optional): Transport to request with. Defaults to the shared transport.
+        fmid_index (FmidIndex, optional): FMID index to consult and update. Defaults to the shared index.
+
+    Returns:
+        int: Event FMID, can be used as API query.
+    """
+
+    fmid_index = fmid_index if fmid_index is not None else get_fmid_index()
+    fmid = fmid_index.get(event_url)
+    if fmid:
+        return fmid
+
+    transport = transport or get_transport()
+    site_response = transport.get(event_url)
+
+    fmid = _get_fmid_from_response(event_url, site_response, transport)
+    fmid_index.set(event_url, fmid)
+
+    return fmid
+
+
+async def get_event_fmid_async(
+    event_url: str, transport: Transport = None, fmid_index: FmidIndex = None
+) -> int | None:
+    """Gets event fmids from url without blocking the event loop, fmid can be used as API query.
+
+    Args:
+        event_url (str): UFC Event page.
+        transport (Transport, optional): Transport to request with. Defaults to the shared transport.
+        fmid_index (FmidIndex, optional): FMID index to consult and update. Defaults to the shared index.
+
+    Returns:
+        int: Event FMID, can be used as API query.
+    """
+
+    fmid_index = fmid_index if fmid_index is not None else get_fmid_index()
+    fmid = fmid_index.get(event_url)
+    if fmid:
+        return fmid
+
+    transport = transport or get_transport()
+    site_response = await transport.get_async(event_url)
+
+    fmid = await asyncio.to_thread(
+        _get_fmid_from_response, event_url, site_response, transport
+    )
+    await asyncio.to_thread(fmid_index.set, event_url, fmid)
+
+    return fmid
+
+
+def build_fmid_index(
+    fmid_index: FmidIndex = None,
+    start_page: int = 0,
+    max_pages: int = None,
+    transport: Transport = None,
+    max_workers: int = MAX_WORKERS,
+) -> int:
+    """Walks the UFC events listing and adds every event not yet indexed to the FMID index.
+
+    Events whose fmid cannot be resolved are skipped.
+
+    Args:
+        fmid_index (FmidIndex, optional): FMID index to build. Defaults to the shared index.
+        start_page (int, optional): First listing page to walk. Defaults to 0.
+        max_pages (int, optional): Maximum number of pages to walk. Defaults to every page.
+        transport (Transport, optional): Transport to request with. Defaults to the shared transport.
+        max_workers (int, optional): Maximum number of event pages requested at once. Defaults to MAX_WORKERS.
+
+    Returns:
+        int: Number of events added to the index.
+    """
+
+    fmid_index = fmid_index if fmid_index is not None else get_fmid_index()
+    transport = transport or get_transport()
+
+    def resolve_fmid(event_url: str) -> int | None:
+        try:
+            return _get_fmid_from_response(
+                event_url, transport.get(event_url), transport
+            )
+        except (InvalidEventUrl, MissingEventFMID, requests.RequestException):
+            return None
+
+    new_urls = (
+        event_url
+        for event_url in iter_event_urls(start_page, max_pages, max_workers, transport)
+        if event_url not in fmid_index
+    )
+
+    added = 0
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            event_urls = list(itertools.islice(new_urls, max_workers * 4))
+            if not event_urls:
+                break
+
+            event_fmids = {
+                event_url: fmid
+                for event_url, fmid in zip(
+                    event_urls, executor.map(resolve_fmid, event_urls)
+                )
+                if fmid
+            }
+            fmid_index.update(event_fmids)
+
+            added += len(event_fmids)
+
+    return added
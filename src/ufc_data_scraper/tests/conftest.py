@@ -0,0 +1,31 @@
+import os
+
+import pytest
+
+from ufc_data_scraper.transport import (
+    CircuitBreaker,
+    RateLimiter,
+    set_circuit_breaker,
+    set_rate_limiter,
+)
+
+from ufc_data_scraper.utils import ConcurrencyLimiter, Metrics, set_fighter_limiter
+
+
+@pytest.fixture(autouse=True, scope="session")
+def cache_dir(tmp_path_factory):
+    """Keeps persistent maps and indexes written during tests out of the user's cache directory."""
+
+    cache_dir = tmp_path_factory.mktemp("cache")
+    os.environ["UFC_DATA_SCRAPER_CACHE_DIR"] = str(cache_dir)
+
+    return cache_dir
+
+
+@pytest.fixture(autouse=True)
+def fresh_request_limits():
+    """Gives every test its own circuit breaker, rate limiter and fighter limiter, failures of one test do not carry over."""
+
+    set_circuit_breaker(CircuitBreaker())
+    set_rate_limiter(RateLimiter(metrics=Metrics()))
+    set_fighter_limiter(ConcurrencyLimiter(metrics=Metrics()))
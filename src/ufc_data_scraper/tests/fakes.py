@@ -0,0 +1,133 @@
+import io
+import json
+import requests
+
+from datetime import datetime
+
+from pathlib import Path
+
+from ufc_data_scraper.transport import canonical_url
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+def load_fixture(file_name: str) -> bytes:
+    """Returns raw content of a fixture file, for testing only."""
+
+    return (FIXTURES_DIR / file_name).read_bytes()
+
+
+class CountingStream(io.BytesIO):
+    """Raw response body recording how many bytes were read from it, for testing only."""
+
+    def __init__(self, content: bytes) -> None:
+        super().__init__(content)
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = super().read(size)
+        self.bytes_read += len(data)
+
+        return data
+
+
+class FakeSession(requests.Session):
+    """Session serving canned responses instead of touching the network, for testing only.
+
+    Pages are served at their canonical url, like the real site.
+    """
+
+    def __init__(self, pages: dict = None) -> None:
+        super().__init__()
+        self.pages = {canonical_url(url): page for url, page in (pages or {}).items()}
+        self.redirects = {}
+        self.requested = []
+        self.streams = []
+
+    def add_page(
+        self, url: str, content, status_code: int = 200, headers: dict = None
+    ) -> None:
+        if isinstance(content, (dict, list)):
+            content = json.dumps(content)
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+
+        self.pages[canonical_url(url)] = (status_code, content, headers or {})
+
+    def add_redirect(self, url: str, location: str, status_code: int = 301) -> None:
+        self.redirects[url] = (status_code, location)
+
+    def request(
+        self, method, url, params=None, headers=None, **kwargs
+    ) -> requests.Response:
+        request = requests.Request(
+            method, url, params=params, headers=headers
+        ).prepare()
+        self.requested.append(request.url)
+
+        if request.url in self.redirects:
+            status_code, location = self.redirects[request.url]
+
+            hop = requests.Response()
+            hop.status_code = status_code
+            hop.url = request.url
+            hop.headers["Location"] = location
+
+            response = self.request(method, location, headers=headers, **kwargs)
+            response.history = [hop] + response.history
+
+            return response
+
+        status_code, content, page_headers = self.pages.get(request.url, (404, b"", {}))
+
+        etag = page_headers.get("ETag")
+        if etag and request.headers.get("If-None-Match") == etag:
+            status_code, content = 304, b""
+
+        headers = page_headers
+
+        response = requests.Response()
+        response.status_code = status_code
+        if kwargs.get("stream"):
+            response.raw = CountingStream(content)
+            self.streams.append(response.raw)
+        else:
+            response._content = content
+            response._content_consumed = True
+        response.headers.update(headers)
+        response.url = request.url
+        response.request = request
+        response.encoding = "utf-8"
+
+        return response
+
+
+def event_page(event_fmid: int = None, date: str = "Sat, Dec 10 / 10:00 PM EST") -> str:
+    """Returns minimal event page, without an fmid if event_fmid is None, for testing only."""
+
+    scripts = {}
+    if event_fmid:
+        scripts = {"eventLiveStats": {"event_fmid": str(event_fmid)}}
+
+    return (
+        '<div id="block-mainpagecontent"><div><div class="c-hero">'
+        '<div class="c-hero__container"><div><div class="c-hero__bottom-text">'
+        f'<div class="c-hero__headline-suffix tz-change-inner">{date}</div>'
+        "</div></div></div></div></div></div>"
+        f'<script type="application/json">{json.dumps(scripts)}</script>'
+    )
+
+
+def api_event(start_time: datetime) -> dict:
+    """Returns minimal private API payload, for testing only."""
+
+    return {"LiveEventDetail": {"StartTime": start_time.strftime("%Y-%m-%dT%H:%MZ")}}
+
+
+def listing_page(slugs: list[str]) -> str:
+    """Returns minimal events listing page, for testing only."""
+
+    return "".join(
+        f'<h3 class="c-card-event--result__headline"><a href="/event/{slug}">{slug}</a></h3>'
+        for slug in slugs
+    )
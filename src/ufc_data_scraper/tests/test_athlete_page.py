@@ -0,0 +1,171 @@
+import pytest
+
+from ufc_data_scraper.scraper import FighterScraper
+from ufc_data_scraper.scraper import fighter_scraper as fighter_scraper_module
+from ufc_data_scraper.scraper.athlete_page import AthletePageParser
+from ufc_data_scraper.transport import Transport
+
+from ufc_data_scraper.tests.fakes import FakeSession, load_fixture
+
+ATHLETE_FIXTURES = (
+    "athlete_ali_alqaisi.html",
+    "athlete_joseph_benavidez.html",
+    "athlete_cristian_quinonez.html",
+)
+
+
+def scrape_fixture(file_name: str, extractor: str, session: FakeSession = None):
+    """Scrapes athlete fixture with extractor, for testing only."""
+
+    fighter_url = "http://www.ufc.com/athlete/fixture"
+    session = session or FakeSession()
+    session.add_page(fighter_url, load_fixture(file_name))
+
+    fighter_scraper = FighterScraper(
+        fighter_url,
+        incorrect_urls={},
+        incorrect_names={},
+        transport=Transport(session),
+        parser_backend="html.parser",
+    )
+
+    return fighter_scraper.scrape_fighter(extractor=extractor)
+
+
+def read_page(content: bytes, chunk_size: int = None):
+    """Feeds content to AthletePageParser in chunks, for testing only."""
+
+    chunk_size = chunk_size or len(content)
+
+    parser = AthletePageParser()
+    for i in range(0, len(content), chunk_size):
+        parser.feed(content[i : i + chunk_size])
+    parser.close()
+
+    return parser.page
+
+
+class TestAthletePage:
+    # Differential
+    @pytest.mark.parametrize("extractor", ("tokenizer", "stream"))
+    @pytest.mark.parametrize("file_name", ATHLETE_FIXTURES)
+    def test_fighter_identical_across_extractors(self, file_name, extractor):
+        expected = scrape_fixture(file_name, "soup")
+        actual = scrape_fixture(file_name, extractor)
+
+        assert actual.as_dict() == expected.as_dict()
+
+    @pytest.mark.parametrize("chunk_size", (1, 97, 1024))
+    @pytest.mark.parametrize("file_name", ATHLETE_FIXTURES)
+    def test_stream_small_chunks_identical_to_soup(
+        self, file_name, chunk_size, monkeypatch
+    ):
+        # Early stop is checked after every chunk, small chunks stop closest to the end sections
+        monkeypatch.setattr(fighter_scraper_module, "STREAM_CHUNK_SIZE", chunk_size)
+
+        expected = scrape_fixture(file_name, "soup")
+        actual = scrape_fixture(file_name, "stream")
+
+        assert actual.as_dict() == expected.as_dict()
+
+    @pytest.mark.parametrize("file_name", ATHLETE_FIXTURES)
+    def test_page_identical_across_extractors(self, file_name):
+        fighter_scraper = FighterScraper("", {}, {}, parser_backend="html.parser")
+        fighter_scraper._create_soup(load_fixture(file_name))
+
+        actual = read_page(load_fixture(file_name))
+
+        assert vars(actual) == vars(fighter_scraper._page)
+
+    # AthletePageParser
+    @pytest.mark.parametrize("file_name", ATHLETE_FIXTURES)
+    def test_feed_chunked(self, file_name):
+        content = load_fixture(file_name)
+
+        assert vars(read_page(content, 7)) == vars(read_page(content))
+
+    def test_feed_multibyte_split(self):
+        content = '<h1 class="hero-profile__name">Cristian Quiñonez</h1>'.encode()
+
+        assert read_page(content, 1).name == "Cristian Quiñonez"
+
+    def test_nested_strike_target_groups(self):
+        content = (
+            b'<svg class="c-stat-body__svg"><g><text>10</text>'
+            b"<g><text>1</text><text>2</text></g></g></svg>"
+        )
+
+        assert read_page(content).strike_targets == [["10", "1", "2"], ["1", "2"]]
+
+    def test_unclosed_elements(self):
+        content = b'<div class="c-bio__field"><div class="c-bio__label">Status</div>'
+        content += b'<div class="c-bio__text">Active'
+
+        assert read_page(content).bio_fields == {"Status": "Active"}
+
+    def test_complete_after_bio(self):
+        parser = AthletePageParser()
+
+        parser.feed(b'<div class="c-bio"><div class="c-bio__field"></div>')
+        assert parser.complete is False
+
+        parser.feed(b'</div><h1 class="hero-profile__name">Late</h1>')
+        assert parser.complete is True
+        assert parser.page.name is None
+
+    def test_complete_at_end_section(self):
+        parser = AthletePageParser()
+
+        parser.feed(b'<div class="l-container athlete-record">')
+
+        assert parser.complete is True
+
+    # _stream
+    @pytest.mark.parametrize("file_name", ATHLETE_FIXTURES)
+    def test_stream_stops_early(self, file_name):
+        session = FakeSession()
+
+        scrape_fixture(file_name, "stream", session)
+
+        assert session.streams[0].bytes_read < len(load_fixture(file_name))
+        assert session.streams[0].closed
+
+    def test_stream_short_tail_read(self, monkeypatch):
+        monkeypatch.setattr(fighter_scraper_module, "STREAM_CHUNK_SIZE", 64)
+        content = load_fixture("athlete_cristian_quinonez.html")
+        end = content.index(b"athlete-record")
+        tail = fighter_scraper_module.STREAM_DRAIN_BYTES // 2
+        session = FakeSession()
+        session.add_page("http://www.ufc.com/athlete/fixture", content[: end + tail])
+        fighter_scraper = FighterScraper(
+            "http://www.ufc.com/athlete/fixture",
+            incorrect_urls={},
+            incorrect_names={},
+            transport=Transport(session),
+        )
+
+        fighter_scraper.scrape_fighter(extractor="stream")
+
+        assert session.streams[0].bytes_read == end + tail
+        # A fully read body is not closed, its connection goes back to the pool
+        assert not session.streams[0].closed
+
+    # _fighter_not_found
+    def test_fighter_not_found_tokenizer(self):
+        fighter_scraper = FighterScraper("", {}, {})
+
+        fighter_scraper._tokenize(load_fixture("athlete_search_results.html"))
+
+        assert fighter_scraper._fighter_not_found() is True
+
+    def test_fighter_found_tokenizer(self):
+        fighter_scraper = FighterScraper("", {}, {})
+
+        fighter_scraper._tokenize(load_fixture("athlete_ali_alqaisi.html"))
+
+        assert fighter_scraper._fighter_not_found() is False
+
+    # scrape_fighter
+    def test_scrape_fighter_unknown_extractor(self):
+        with pytest.raises(ValueError):
+            scrape_fixture("athlete_ali_alqaisi.html", "regex")
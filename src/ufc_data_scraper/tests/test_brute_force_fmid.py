@@ -0,0 +1,109 @@
+from datetime import timedelta
+
+from ufc_data_scraper.scraper.fmid_finder import (
+    EventPage,
+    _brute_force_event_fmid,
+    _convert_scraped_date,
+    _next_candidates,
+)
+from ufc_data_scraper.transport import Transport
+
+from ufc_data_scraper.tests.fakes import (
+    FakeSession,
+    api_event,
+    event_page,
+    listing_page,
+)
+
+API_URL = "http://d29dxerjsp82wz.cloudfront.net/api/v3/event/live/{}.json"
+EVENT_DATE = "Sat, Dec 10 / 10:00 PM EST"
+
+
+def weekly_events(last_listed: int, target: int, newest: int) -> FakeSession:
+    """Returns session with one API event a week up to newest, target falling on EVENT_DATE."""
+
+    session = FakeSession()
+    slugs = [f"ufc-{i}" for i in range(10)]
+    session.add_page("http://www.ufc.com/events?page=0", listing_page(slugs))
+    session.add_page("http://www.ufc.com/event/ufc-9", event_page(last_listed))
+
+    target_date = _convert_scraped_date(EVENT_DATE)
+    for fmid in range(1, newest + 1):
+        start_time = target_date + timedelta(weeks=fmid - target)
+        session.add_page(API_URL.format(fmid), api_event(start_time))
+
+    return session
+
+
+def target_page() -> EventPage:
+    return EventPage(event_page(date=EVENT_DATE))
+
+
+def api_probes(session: FakeSession) -> int:
+    return sum(1 for url in session.requested if "cloudfront" in url)
+
+
+class TestBruteForceEventFmid:
+    # _next_candidates
+    def test_next_candidates_gallops_forward(self):
+        assert _next_candidates({}, 100, 100, None, 4, 3) == [104, 108, 112]
+
+    def test_next_candidates_gallops_backward(self):
+        assert _next_candidates({}, 100, None, 100, 2, 3) == [98, 96, 94]
+
+    def test_next_candidates_bisects(self):
+        assert _next_candidates({}, 100, 100, 200, 1, 3) == [125, 150, 175]
+
+    def test_next_candidates_skips_probed(self):
+        assert _next_candidates({101: None}, 100, 100, 104, 1, 8) == [102, 103]
+
+    # _brute_force_event_fmid
+    def test_next_to_last_listed(self):
+        session = weekly_events(last_listed=1100, target=1103, newest=1110)
+
+        fmid = _brute_force_event_fmid(target_page(), Transport(session))
+
+        assert fmid == 1103
+        assert api_probes(session) <= 8
+
+    def test_far_ahead(self):
+        session = weekly_events(last_listed=1000, target=1150, newest=1200)
+
+        fmid = _brute_force_event_fmid(target_page(), Transport(session))
+
+        assert fmid == 1150
+        assert api_probes(session) < 50
+
+    def test_before_last_listed(self):
+        session = weekly_events(last_listed=1100, target=1037, newest=1110)
+
+        fmid = _brute_force_event_fmid(target_page(), Transport(session))
+
+        assert fmid == 1037
+
+    def test_probe_budget(self):
+        session = weekly_events(last_listed=1000, target=1150, newest=1200)
+
+        fmid = _brute_force_event_fmid(target_page(), Transport(session), max_probes=10)
+
+        assert fmid is None
+        assert api_probes(session) == 10
+
+    def test_deadline(self):
+        session = weekly_events(last_listed=1000, target=1150, newest=1200)
+
+        fmid = _brute_force_event_fmid(target_page(), Transport(session), deadline=0)
+
+        assert fmid is None
+        assert api_probes(session) == 0
+
+    def test_missing_date(self):
+        session = weekly_events(last_listed=1100, target=1103, newest=1110)
+
+        assert _brute_force_event_fmid(EventPage(""), Transport(session)) is None
+
+    def test_last_listed_without_fmid(self):
+        session = weekly_events(last_listed=None, target=1103, newest=1110)
+
+        assert _brute_force_event_fmid(target_page(), Transport(session)) is None
+        assert api_probes(session) == 0
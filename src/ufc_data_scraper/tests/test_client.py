@@ -0,0 +1,163 @@
+import asyncio
+import threading
+
+import pytest
+
+from ufc_data_scraper import UFCClient, get_client, set_client, ufc_scraper
+
+from ufc_data_scraper.cache import EventCache, FighterCache, FmidIndex
+
+from ufc_data_scraper.transport import Transport, UrlMap
+
+from ufc_data_scraper.utils import CorrectionIndex, Metrics
+
+from ufc_data_scraper.tests.fakes import FakeSession, load_fixture
+
+EVENT_API_URL = "https://d29dxerjsp82wz.cloudfront.net/api/v3/event/live/{}.json"
+
+
+def create_session() -> FakeSession:
+    session = FakeSession()
+    for event_fmid in (1124, 1150):
+        session.add_page(
+            EVENT_API_URL.format(event_fmid), load_fixture(f"event_{event_fmid}.json")
+        )
+    session.add_page(
+        "https://www.ufc.com/athlete/ali-alqaisi",
+        load_fixture("athlete_ali_alqaisi.html"),
+    )
+
+    return session
+
+
+def create_client(session: FakeSession = None, **kwargs) -> UFCClient:
+    fmid_index = FmidIndex()
+    fmid_index.set("https://www.ufc.com/event/ufc-282", 1124)
+
+    return UFCClient(
+        Transport(session or create_session()),
+        event_cache=EventCache(),
+        fighter_cache=FighterCache(),
+        fmid_index=fmid_index,
+        url_map=UrlMap(),
+        metrics=Metrics(),
+        **kwargs,
+    )
+
+
+class TestUFCClient:
+    # executor
+    def test_executor_reused(self):
+        with create_client() as client:
+            executor = client.executor
+
+            client.scrape_event_fmid(1124)
+            client.scrape_event_fmid(1150)
+
+            assert client.executor is executor
+
+    def test_executor_bounded(self):
+        with create_client(max_workers=2) as client:
+            assert client.executor._max_workers == 2
+
+    # close
+    def test_close(self):
+        session = create_session()
+        client = create_client(session)
+        executor = client.executor
+
+        with client:
+            client.scrape_event_fmid(1124)
+
+        assert executor._shutdown
+        with pytest.raises(RuntimeError):
+            client.scrape_event_fmid(1124)
+
+    # load_corrections
+    def test_corrections_kept_after_scrape(self):
+        with create_client() as client:
+            client.scrape_event_fmid(1124)
+
+            incorrect_urls, incorrect_names = client.load_corrections()
+
+            assert isinstance(incorrect_urls, CorrectionIndex)
+            assert isinstance(incorrect_names, CorrectionIndex)
+            assert (
+                client._create_event_scraper(1150)._incorrect_fighter_urls
+                is incorrect_urls
+            )
+
+    def test_executor_available_while_loading_corrections(self, monkeypatch):
+        loading = threading.Event()
+        release = threading.Event()
+
+        def slow_incorrect_urls(transport):
+            loading.set()
+            release.wait(5)
+            return {}
+
+        monkeypatch.setattr(
+            "ufc_data_scraper.client.get_incorrect_urls", slow_incorrect_urls
+        )
+
+        with create_client() as client:
+            loader = threading.Thread(target=client.load_corrections)
+            loader.start()
+            loading.wait(5)
+
+            getter = threading.Thread(target=lambda: client.executor)
+            getter.start()
+            getter.join(1)
+            blocked = getter.is_alive()
+
+            release.set()
+            loader.join()
+
+            assert not blocked
+
+    # scrape_event_url
+    def test_scrape_event_url_uses_fmid_index(self):
+        session = create_session()
+
+        with create_client(session) as client:
+            event = client.scrape_event_url("https://www.ufc.com/event/ufc-282")
+
+        assert event.fmid == 1124
+        assert "https://www.ufc.com/event/ufc-282" not in session.requested
+
+    # scrape_events
+    def test_scrape_events_matches_single_scrapes(self):
+        with create_client() as client:
+            expected = [client.scrape_event_fmid(1124), client.scrape_event_fmid(1150)]
+
+        with create_client() as client:
+            actual = client.scrape_events([1124, 1150])
+
+        assert actual == expected
+
+    # scrape_event_fmid_async
+    def test_scrape_event_async_matches_sync(self):
+        with create_client() as client:
+            expected = client.scrape_event_fmid(1124)
+
+        with create_client() as client:
+            actual = asyncio.run(client.scrape_event_fmid_async(1124))
+
+        assert actual == expected
+
+    # get_client / set_client
+    def test_module_functions_use_default_client(self):
+        previous = get_client()
+        set_client(create_client())
+
+        try:
+            event = ufc_scraper.scrape_event_url("https://www.ufc.com/event/ufc-282")
+            fighter = ufc_scraper.scrape_fighter_url(
+                "https://www.ufc.com/athlete/ali-alqaisi"
+            )
+        finally:
+            get_client().close()
+            set_client(previous)
+
+        assert event.fmid == 1124
+        assert fighter.name == "Ali Al Qaisi"
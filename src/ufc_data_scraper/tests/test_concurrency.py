@@ -0,0 +1,201 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from ufc_data_scraper.cache import EventCache, FighterCache
+
+from ufc_data_scraper.exceptions import FighterNotFound
+
+from ufc_data_scraper.scraper import EventScraper
+
+from ufc_data_scraper.transport import RetryPolicy, Transport, UrlMap
+from ufc_data_scraper.transport import retry as retry_module
+
+from ufc_data_scraper.utils import ConcurrencyLimiter, Metrics, is_overloaded
+
+from ufc_data_scraper.tests.fakes import FakeSession, load_fixture
+
+EVENT_API_URL = "https://d29dxerjsp82wz.cloudfront.net/api/v3/event/live/1124.json"
+UFC_PAGE = "https://www.ufc.com/athlete/ali-alqaisi"
+
+
+class SlowRateLimiter:
+    """Rate limiter waiting before every request, for testing only."""
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+
+    def acquire(self, url: str) -> None:
+        time.sleep(self.delay)
+
+
+class SlowSession(FakeSession):
+    """Session taking delay seconds to answer, for testing only."""
+
+    def __init__(self, delay: float) -> None:
+        super().__init__()
+        self.delay = delay
+
+    def request(self, method, url, **kwargs) -> requests.Response:
+        time.sleep(self.delay)
+
+        return super().request(method, url, **kwargs)
+
+
+def http_error(status_code: int) -> requests.exceptions.HTTPError:
+    response = requests.Response()
+    response.status_code = status_code
+
+    return requests.exceptions.HTTPError(response=response)
+
+
+def create_limiter(**kwargs) -> ConcurrencyLimiter:
+    return ConcurrencyLimiter(metrics=Metrics(), **kwargs)
+
+
+class TestConcurrencyLimiter:
+    # is_overloaded
+    @pytest.mark.parametrize(
+        "error",
+        (
+            http_error(429),
+            http_error(503),
+            requests.exceptions.ReadTimeout(),
+            requests.exceptions.ConnectionError(),
+        ),
+    )
+    def test_is_overloaded(self, error):
+        assert is_overloaded(error)
+
+    @pytest.mark.parametrize(
+        "error", (http_error(404), FighterNotFound(), ValueError())
+    )
+    def test_is_not_overloaded(self, error):
+        assert not is_overloaded(error)
+
+    # __init__
+    def test_invalid_limits(self):
+        with pytest.raises(ValueError):
+            create_limiter(initial=8, maximum=4)
+
+    # release
+    def test_additive_increase(self):
+        limiter = create_limiter(initial=2, maximum=3)
+
+        for _ in range(10):
+            limiter.release(limiter.acquire(), latency=0.1)
+
+        assert limiter.limit == 3
+
+    def test_multiplicative_decrease(self):
+        limiter = create_limiter(initial=8)
+
+        limiter.release(limiter.acquire(), latency=0.1, overloaded=True)
+
+        assert limiter.limit == 4
+
+    def test_slow_request_decreases(self):
+        limiter = create_limiter(initial=8, latency_target=1.0)
+
+        limiter.release(limiter.acquire(), latency=1.5)
+
+        assert limiter.limit == 4
+
+    def test_burst_decreases_once(self):
+        limiter = create_limiter(initial=8)
+        epochs = [limiter.acquire() for _ in range(4)]
+
+        for epoch in epochs:
+            limiter.release(epoch, latency=0.1, overloaded=True)
+
+        assert limiter.limit == 4
+
+    def test_minimum(self):
+        limiter = create_limiter(initial=2, minimum=2)
+
+        limiter.release(limiter.acquire(), latency=0.1, overloaded=True)
+
+        assert limiter.limit == 2
+
+    def test_limit_published(self):
+        metrics = Metrics()
+        limiter = ConcurrencyLimiter(initial=8, metrics=metrics, name="test")
+
+        limiter.release(limiter.acquire(), latency=0.1, overloaded=True)
+
+        assert metrics.get_gauge("test.concurrency_limit") == 4
+
+    # acquire
+    def test_acquire_blocks_at_limit(self):
+        limiter = create_limiter(initial=1)
+        epoch = limiter.acquire()
+        acquired = threading.Event()
+
+        def acquire():
+            limiter.acquire()
+            acquired.set()
+
+        threading.Thread(target=acquire, daemon=True).start()
+        assert not acquired.wait(timeout=0.05)
+
+        limiter.release(epoch, latency=0.1)
+        assert acquired.wait(timeout=1)
+
+    # slot
+    def test_slot_classifies_errors(self):
+        limiter = create_limiter(initial=8)
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            with limiter.slot():
+                raise http_error(503)
+
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+
+    def test_slot_ignores_rate_limit_and_backoff(self, monkeypatch):
+        # Longest delay, so backoff is deterministic
+        monkeypatch.setattr(retry_module.random, "uniform", lambda low, high: high)
+        session = FakeSession()
+        session.add_page(UFC_PAGE, b"", 503)
+        transport = Transport(
+            session,
+            rate_limiter=SlowRateLimiter(0.1),
+            retry=RetryPolicy(attempts=2, base_delay=0.1),
+        )
+        limiter = create_limiter(initial=8, latency_target=0.05)
+
+        with limiter.slot():
+            transport.get(UFC_PAGE)
+
+        assert limiter.limit == 8
+
+    def test_slot_slow_network_decreases(self):
+        session = SlowSession(0.1)
+        session.add_page(UFC_PAGE, b"fighter")
+        limiter = create_limiter(initial=8, latency_target=0.05)
+
+        with limiter.slot():
+            Transport(session).get(UFC_PAGE)
+
+        assert limiter.limit == 4
+
+    # EventScraper
+    def test_event_scraper_backs_off_on_server_errors(self):
+        session = FakeSession()
+        session.add_page(EVENT_API_URL, load_fixture("event_1124.json"))
+        session.add_page("https://www.ufc.com/athlete/ali-alqaisi", b"", 503)
+        limiter = create_limiter(initial=8)
+
+        EventScraper(
+            1124,
+            transport=Transport(session),
+            event_cache=EventCache(),
+            fighter_cache=FighterCache(),
+            url_map=UrlMap(),
+            limiter=limiter,
+        ).scrape_event()
+
+        assert limiter.limit < 8
+        assert limiter.in_flight == 0
@@ -0,0 +1,127 @@
+import pickle
+
+import pytest
+
+from ufc_data_scraper.utils import (
+    CorrectionIndex,
+    compile_correction_index,
+    correct_fighter_name,
+    correct_fighter_url,
+    fighter_url_slug,
+)
+
+CHAINED_URLS = {
+    "http://www.ufc.com/athlete/dan-argueta": "http://www.ufc.com/athlete/daniel-argueta",
+    "http://www.ufc.com/athlete/daniel-argueta": "http://www.ufc.com/athlete/daniel-argueta-2",
+    "http://www.ufc.com/athlete/daniel-argueta-2": "http://www.ufc.com/athlete/daniel-argueta-3",
+}
+
+
+class TestCorrections:
+    # fighter_url_slug
+    def test_fighter_url_slug(self):
+        actual = fighter_url_slug("http://www.ufc.com/athlete/Jan-B.łachowicz")
+
+        assert actual == "jan-blachowicz"
+
+    # CorrectionIndex.compile
+    def test_chain_collapsed(self):
+        index = CorrectionIndex.compile(CHAINED_URLS, "urls")
+
+        for incorrect_url in CHAINED_URLS:
+            assert (
+                index.get(incorrect_url)
+                == "https://www.ufc.com/athlete/daniel-argueta-3"
+            )
+
+    def test_cycle_terminates(self):
+        corrections = {"Fighter A": "Fighter B", "Fighter B": "Fighter A"}
+
+        index = CorrectionIndex.compile(corrections, "names")
+
+        assert index.get("Fighter A") == "Fighter A"
+        assert index.get("Fighter B") == "Fighter B"
+
+    def test_normalized_lookup(self):
+        index = CorrectionIndex.compile(CHAINED_URLS, "urls")
+
+        assert "https://ufc.com/athlete/Dan-Argueta" in index
+        assert index.get("https://www.ufc.com/athlete/unknown") is None
+
+    def test_unknown_kind(self):
+        with pytest.raises(ValueError):
+            CorrectionIndex.compile({}, "events")
+
+    # CorrectionIndex.dump / CorrectionIndex.load
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "corrections_urls.pickle"
+        index = CorrectionIndex.compile(CHAINED_URLS, "urls")
+
+        index.dump(path)
+        loaded = CorrectionIndex.load(path, "urls", index.version)
+
+        assert len(loaded) == len(index)
+        assert loaded.get("dan-argueta") == index.get("dan-argueta")
+
+    def test_stale_version_not_loaded(self, tmp_path):
+        path = tmp_path / "corrections_urls.pickle"
+        CorrectionIndex.compile(CHAINED_URLS, "urls").dump(path)
+
+        assert CorrectionIndex.load(path, "urls", "other-version") is None
+
+    def test_corrupt_file_not_loaded(self, tmp_path):
+        path = tmp_path / "corrections_urls.pickle"
+        path.write_bytes(b"not a pickle")
+
+        assert CorrectionIndex.load(path, "urls", "any") is None
+
+    # compile_correction_index
+    def test_compiled_once_per_map(self):
+        corrections = dict(CHAINED_URLS)
+
+        first = compile_correction_index(corrections, "urls")
+        second = compile_correction_index(corrections, "urls")
+
+        assert first is second
+
+    def test_changed_map_recompiled(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("UFC_DATA_SCRAPER_CACHE_DIR", str(tmp_path))
+        compile_correction_index(dict(CHAINED_URLS), "names")
+
+        changed = {"Fighter A": "Fighter B"}
+        index = compile_correction_index(changed, "names")
+
+        with open(tmp_path / "corrections_names.pickle", "rb") as index_file:
+            persisted = pickle.load(index_file)
+
+        assert index.get("Fighter A") == "Fighter B"
+        assert persisted["entries"] == {"Fighter A": "Fighter B"}
+
+    def test_copied_map_sees_new_correction(self):
+        corrections = {"Fighter A": "Fighter B"}
+        compile_correction_index(corrections, "names")
+
+        changed = corrections | {"Fighter C": "Fighter D"}
+
+        assert correct_fighter_name("Fighter C", changed) == "Fighter D"
+
+    def test_no_corrections_shared(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("UFC_DATA_SCRAPER_CACHE_DIR", str(tmp_path))
+
+        index = compile_correction_index(None, "urls")
+
+        assert index is compile_correction_index({}, "urls")
+        assert len(index) == 0
+        assert not (tmp_path / "corrections_urls.pickle").exists()
+
+    # correct_fighter_url / correct_fighter_name
+    def test_correct_fighter_url_without_corrections(self):
+        actual = correct_fighter_url("http://www.ufc.com/athlete/Jan-Błachowicz", None)
+
+        assert actual == "https://www.ufc.com/athlete/jan-blachowicz"
+
+    def test_correct_fighter_name(self):
+        corrections = {"Йоэль Альварез": "Zelim Imadaev"}
+
+        assert correct_fighter_name(" Йоэль Альварез ", corrections) == "Zelim Imadaev"
+        assert correct_fighter_name("Jan Blachowicz", corrections) == "Jan Blachowicz"
@@ -0,0 +1,107 @@
+import tempfile
+
+from ufc_data_scraper.cache import EventCache
+
+from ufc_data_scraper.scraper import EventScraper
+
+from ufc_data_scraper.transport import Transport
+
+from ufc_data_scraper.tests.fakes import FakeSession, load_fixture
+
+EVENT_API_URL = "http://d29dxerjsp82wz.cloudfront.net/api/v3/event/live/{}.json"
+
+
+def create_transport() -> Transport:
+    session = FakeSession()
+    for event_fmid in (1124, 1150):
+        session.add_page(
+            EVENT_API_URL.format(event_fmid), load_fixture(f"event_{event_fmid}.json")
+        )
+
+    return Transport(session=session)
+
+
+class TestEventCache:
+    def test_final_event_served_without_network(self):
+        transport = create_transport()
+        event_cache = EventCache(ttl=0)
+
+        expected = EventScraper(
+            1124, transport=transport, event_cache=event_cache
+        ).scrape_event()
+        requests_made = len(transport.session.requested)
+        actual = EventScraper(
+            1124, transport=transport, event_cache=event_cache
+        ).scrape_event()
+
+        assert actual is expected
+        assert len(transport.session.requested) == requests_made
+
+    def test_upcoming_event_expires(self):
+        transport = create_transport()
+        event_cache = EventCache(ttl=0)
+
+        event = EventScraper(
+            1150, transport=transport, event_cache=event_cache
+        ).scrape_event()
+
+        assert event.status == "Upcoming"
+        assert event_cache.get(1150) is None
+
+    def test_upcoming_event_within_ttl(self):
+        transport = create_transport()
+        event_cache = EventCache(ttl=60)
+
+        expected = EventScraper(
+            1150, transport=transport, event_cache=event_cache
+        ).scrape_event()
+
+        assert event_cache.get(1150) is expected
+
+    def test_refresh_skips_cache(self):
+        transport = create_transport()
+        event_cache = EventCache()
+
+        EventScraper(1124, transport=transport, event_cache=event_cache).scrape_event()
+        requests_made = len(transport.session.requested)
+        EventScraper(1124, transport=transport, event_cache=event_cache).scrape_event(
+            refresh=True
+        )
+
+        assert len(transport.session.requested) > requests_made
+
+    def test_cached_event_uses_scraper_event_url(self):
+        transport = create_transport()
+        event_cache = EventCache()
+        test_url = "https://www.ufc.com/event/ufc-282"
+
+        EventScraper(1124, transport=transport, event_cache=event_cache).scrape_event()
+        actual = EventScraper(
+            1124, test_url, transport=transport, event_cache=event_cache
+        ).scrape_event()
+
+        assert actual.event_url == test_url
+
+    def test_final_event_persisted(self):
+        directory = tempfile.mkdtemp()
+        transport = create_transport()
+
+        expected = EventScraper(
+            1124, transport=transport, event_cache=EventCache(directory=directory)
+        ).scrape_event()
+        actual = EventCache(directory=directory).get(1124)
+
+        assert actual == expected
+
+    def test_final_event_unwritable_directory(self, tmp_path):
+        transport = create_transport()
+        # Cache directory under a regular file can never be created
+        (tmp_path / "file").touch()
+        event_cache = EventCache(directory=tmp_path / "file" / "events")
+
+        expected = EventScraper(
+            1124, transport=transport, event_cache=event_cache
+        ).scrape_event()
+
+        assert expected.fmid == 1124
+        assert event_cache.get(1124) is expected
@@ -9,21 +9,19 @@ from datetime import datetime, timedelta
 from ufc_data_scraper.exceptions import InvalidEventUrl
 
 from ufc_data_scraper.scraper.fmid_finder import (
-    _page_has_event_links,
-    _valid_event_page,
+    _parse_event_urls,
+    EventPage,
     get_event_urls,
     _get_last_fmid,
     _get_event_data,
-    _get_event_date,
     _convert_scraped_date,
-    _scrape_event_fmid,
     _brute_force_event_fmid,
     get_event_fmid,
 )
 
 
 class TestEventFmidFinder:
-    def test_page_has_event_links_has_links(self):
+    def test_parse_event_urls_has_links(self):
         test_page = """
             <div class="c-card-event--result__info">
                 <h3 class="c-card-event--result__headline">
@@ -36,9 +34,9 @@ class TestEventFmidFinder:
             </div>
         """
 
-        assert _page_has_event_links(test_page) is True
+        assert _parse_event_urls(test_page) == ["https://www.ufc.com/event/ufc-287"]
 
-    def test_page_has_event_links_no_links(self):
+    def test_parse_event_urls_no_links(self):
         test_page = """
             <div class="c-card-event--result__info">
                 <h3>
@@ -51,19 +49,19 @@ class TestEventFmidFinder:
             </div>
         """
 
-        assert _page_has_event_links(test_page) is False
+        assert _parse_event_urls(test_page) == []
 
-    def test_page_has_event_links_empty_page(self):
+    def test_parse_event_urls_empty_page(self):
         test_page = ""
 
-        assert _page_has_event_links(test_page) is False
+        assert _parse_event_urls(test_page) == []
 
     def test_valid_event_page_valid_page(self):
         test_page = """
             <div class="c-hero__headline-suffix tz-change-inner" data-locale="en" data-timestamp="1670727600" data-metric="0">Sun, Dec 11 / 5:00 AM SAST</div>
         """
 
-        assert _valid_event_page(test_page) is True
+        assert EventPage(test_page).is_valid is True
 
     def test_valid_event_page_invalid_page(self):
         test_page = """
@@ -78,12 +76,12 @@ class TestEventFmidFinder:
             </div>
         """
 
-        assert _valid_event_page(test_page) is False
+        assert EventPage(test_page).is_valid is False
 
     def test_valid_event_page_empty_page(self):
         test_page = ""
 
-        assert _valid_event_page(test_page) is False
+        assert EventPage(test_page).is_valid is False
 
     def test_get_event_urls(self):
         # test whether function actually returns urls.
@@ -118,16 +116,14 @@ class TestEventFmidFinder:
     def test_get_event_date(self):
         test_event_url = "https://www.ufc.com/event/ufc-282"
         test_response = requests.get(test_event_url)
-        test_soup = BeautifulSoup(test_response.content, "html.parser")
         expected = "Sat, Dec 10 / 10:00 PM EST"
-        actual = _get_event_date(test_soup)
+        actual = EventPage(test_response.content).date
 
         assert actual == expected
 
     def test_get_event_date_invalid_page(self):
         invalid_page = ""
-        test_soup = BeautifulSoup(invalid_page, "html.parser")
-        actual = _get_event_date(test_soup)
+        actual = EventPage(invalid_page).date
 
         assert actual is None
 
@@ -157,13 +153,13 @@ class TestEventFmidFinder:
     def test_scrape_event_fmid(self):
         test_url = "https://www.ufc.com/event/ufc-282"
         expected = 1124
-        actual = _scrape_event_fmid(requests.get(test_url))
+        actual = EventPage(requests.get(test_url).content).fmid
 
         assert actual == expected
 
     def test_scrape_event_fmid_no_fmid_on_page(self):
         test_url = "https://www.google.com"
-        actual = _scrape_event_fmid(requests.get(test_url))
+        actual = EventPage(requests.get(test_url).content).fmid
 
         assert actual is None
 
@@ -181,7 +177,7 @@ class TestEventFmidFinder:
 
         test_url = event_urls[recent_event_count]
 
-        actual = _brute_force_event_fmid(requests.get(test_url))
+        actual = _brute_force_event_fmid(EventPage(requests.get(test_url).content))
 
         assert actual is not None
 
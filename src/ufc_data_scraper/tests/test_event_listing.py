@@ -0,0 +1,116 @@
+from ufc_data_scraper.cache import KnownEvents
+from ufc_data_scraper.scraper import iter_event_urls, sync_event_urls
+from ufc_data_scraper.scraper.fmid_finder import _parse_event_urls, get_event_urls
+from ufc_data_scraper.transport import Transport
+
+from ufc_data_scraper.tests.fakes import FakeSession, listing_page
+
+LISTING_URL = "https://www.ufc.com/events?page={}"
+
+
+def listing_session(pages: list[list[str]]) -> FakeSession:
+    """Returns session serving pages of event slugs, for testing only."""
+
+    session = FakeSession()
+    for page_num, slugs in enumerate(pages):
+        session.add_page(LISTING_URL.format(page_num), listing_page(slugs))
+
+    return session
+
+
+def listing_requests(session: FakeSession) -> list[str]:
+    return [url for url in session.requested if "/events?" in url]
+
+
+class TestEventListing:
+    # _parse_event_urls
+    def test_parse_event_urls_dedupes_in_order(self):
+        test_page = listing_page(["ufc-282", "ufc-281", "ufc-282"])
+
+        assert _parse_event_urls(test_page) == [
+            "https://www.ufc.com/event/ufc-282",
+            "https://www.ufc.com/event/ufc-281",
+        ]
+
+    def test_parse_event_urls_skips_headlines_without_links(self):
+        test_page = '<h3 class="c-card-event--result__headline">TBA</h3>'
+
+        assert _parse_event_urls(test_page) == []
+
+    # get_event_urls
+    def test_get_event_urls_empty_page(self):
+        session = listing_session([[]])
+
+        assert get_event_urls(0, Transport(session)) is None
+
+    # iter_event_urls
+    def test_iter_event_urls(self):
+        session = listing_session([["ufc-3", "ufc-2"], ["ufc-2", "ufc-1"], []])
+
+        actual = list(iter_event_urls(window=2, transport=Transport(session)))
+
+        assert actual == [
+            "https://www.ufc.com/event/ufc-3",
+            "https://www.ufc.com/event/ufc-2",
+            "https://www.ufc.com/event/ufc-1",
+        ]
+
+    def test_iter_event_urls_stops_at_first_empty_page(self):
+        session = listing_session([["ufc-3"], [], ["ufc-1"]])
+
+        actual = list(iter_event_urls(window=1, transport=Transport(session)))
+
+        assert actual == ["https://www.ufc.com/event/ufc-3"]
+        assert listing_requests(session) == [
+            LISTING_URL.format(0),
+            LISTING_URL.format(1),
+        ]
+
+    def test_iter_event_urls_bounded_read_ahead(self):
+        session = listing_session([[f"ufc-{i}"] for i in range(10)])
+
+        event_urls = iter_event_urls(window=4, transport=Transport(session))
+        next(event_urls)
+        event_urls.close()
+
+        assert len(listing_requests(session)) <= 5
+
+    def test_iter_event_urls_max_pages(self):
+        session = listing_session([[f"ufc-{i}"] for i in range(10)])
+
+        actual = list(
+            iter_event_urls(start_page=2, max_pages=3, transport=Transport(session))
+        )
+
+        assert actual == [f"https://www.ufc.com/event/ufc-{i}" for i in (2, 3, 4)]
+
+    # sync_event_urls
+    def test_sync_event_urls_first_sync(self, tmp_path):
+        session = listing_session([["ufc-3", "ufc-2"], ["ufc-1"], []])
+        known_events = KnownEvents(tmp_path / "known_events.json")
+
+        actual = sync_event_urls(known_events, Transport(session))
+
+        assert actual == [f"https://www.ufc.com/event/ufc-{i}" for i in (3, 2, 1)]
+        assert len(KnownEvents(tmp_path / "known_events.json")) == 3
+
+    def test_sync_event_urls_returns_delta(self, tmp_path):
+        known_events = KnownEvents(tmp_path / "known_events.json")
+        sync_event_urls(known_events, Transport(listing_session([["ufc-2", "ufc-1"]])))
+        session = listing_session([["ufc-4", "ufc-3"], ["ufc-2", "ufc-1"], ["ufc-0"]])
+
+        actual = sync_event_urls(known_events, Transport(session))
+
+        assert actual == [f"https://www.ufc.com/event/ufc-{i}" for i in (4, 3)]
+        assert listing_requests(session) == [
+            LISTING_URL.format(0),
+            LISTING_URL.format(1),
+        ]
+
+    def test_sync_event_urls_steady_state(self):
+        known_events = KnownEvents()
+        known_events.add(["https://www.ufc.com/event/ufc-2"])
+        session = listing_session([["ufc-2"], ["ufc-1"]])
+
+        assert sync_event_urls(known_events, Transport(session)) == []
+        assert len(listing_requests(session)) == 1
@@ -0,0 +1,42 @@
+from ufc_data_scraper.scraper.fmid_finder import EventPage
+
+from ufc_data_scraper.tests.fakes import event_page
+
+
+class TestEventPage:
+    def test_event_page(self):
+        actual = EventPage(event_page(1124).encode("utf-8"))
+
+        assert actual.is_valid is True
+        assert actual.date == "Sat, Dec 10 / 10:00 PM EST"
+        assert actual.fmid == 1124
+
+    def test_event_page_without_fmid(self):
+        actual = EventPage(event_page())
+
+        assert actual.is_valid is True
+        assert actual.fmid is None
+
+    def test_event_page_uses_last_json_script(self):
+        test_page = (
+            '<script type="application/json">{"other": 1}</script>' + event_page(1124)
+        )
+
+        assert EventPage(test_page).fmid == 1124
+
+    def test_event_page_malformed_json(self):
+        test_page = '<script type="application/json">{not json</script>'
+
+        assert EventPage(test_page).fmid is None
+
+    def test_event_page_nested_hero_markup(self):
+        test_page = """
+            <div class="c-hero__headline-suffix tz-change-inner" data-locale="en">
+                Sat, Dec 10 <div><span>/</span></div> 10:00 PM EST
+            </div>
+            <div>Not the date</div>
+        """
+
+        assert (
+            " ".join(EventPage(test_page).date.split()) == "Sat, Dec 10 / 10:00 PM EST"
+        )
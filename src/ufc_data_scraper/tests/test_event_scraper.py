@@ -348,7 +348,7 @@ class TestEventScraper:
             "UFCLink": None,
             "Name": {"FirstName": "Bryce", "LastName": "Mitchell"},
         }
-        expected = "http://www.ufc.com/athlete/Bryce-Mitchell"
+        expected = "https://www.ufc.com/athlete/Bryce-Mitchell"
         actual = self.test_event_scraper._get_fighter_url(test_fighter)
 
         assert actual == expected
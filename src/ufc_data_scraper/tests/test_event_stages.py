@@ -0,0 +1,150 @@
+import asyncio
+import threading
+
+import pytest
+import requests
+
+from ufc_data_scraper.cache import EventCache, FighterCache
+
+from ufc_data_scraper.scraper import EventScraper
+
+from ufc_data_scraper.transport import Transport
+
+from ufc_data_scraper.utils import Metrics
+from ufc_data_scraper.utils.utils import CORRECTIONS_URL
+
+from ufc_data_scraper.tests.fakes import FakeSession, load_fixture
+
+EVENT_API_URL = "https://d29dxerjsp82wz.cloudfront.net/api/v3/event/live/1124.json"
+
+STAGES = {"corrections", "event_data", "fighters", "build", "total"}
+
+
+class OverlapSession(FakeSession):
+    """Holds the event data request until the correction map is requested, for testing only."""
+
+    def __init__(self, pages: dict = None) -> None:
+        super().__init__(pages)
+        self.corrections_requested = threading.Event()
+        self.overlapped = False
+
+    def request(self, method, url, params=None, **kwargs):
+        if url == CORRECTIONS_URL.format("incorrect_urls.json"):
+            self.corrections_requested.set()
+        elif url == EVENT_API_URL:
+            self.overlapped = self.corrections_requested.wait(timeout=2)
+
+        return super().request(method, url, params=params, **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def fresh_correction_maps(monkeypatch):
+    # Correction maps are retrieved once per process, forget them so every test requests them
+    monkeypatch.setattr("ufc_data_scraper.utils.utils._correction_maps", {})
+
+
+def create_event_scraper(session: FakeSession, metrics: Metrics = None) -> EventScraper:
+    session.add_page(EVENT_API_URL, load_fixture("event_1124.json"))
+    session.add_page(
+        "https://www.ufc.com/athlete/ali-alqaisi",
+        load_fixture("athlete_ali_alqaisi.html"),
+    )
+
+    return EventScraper(
+        1124,
+        transport=Transport(session=session),
+        event_cache=EventCache(),
+        fighter_cache=FighterCache(),
+        metrics=metrics or Metrics(),
+    )
+
+
+class TestEventStages:
+    # scrape_event
+    def test_corrections_overlap_event_data(self):
+        session = OverlapSession()
+
+        create_event_scraper(session).scrape_event()
+
+        assert session.overlapped
+
+    def test_timings(self):
+        event_scraper = create_event_scraper(FakeSession())
+
+        event_scraper.scrape_event()
+
+        assert set(event_scraper.timings) == STAGES
+        assert event_scraper.timings["total"] >= event_scraper.timings["fighters"]
+
+    def test_timings_recorded_to_metrics(self):
+        metrics = Metrics()
+
+        create_event_scraper(FakeSession(), metrics).scrape_event()
+
+        timings = metrics.snapshot()["timings"]
+        assert {f"scrape_event.{stage}" for stage in STAGES} <= set(timings)
+        assert timings["scrape_event.total"]["count"] == 1
+
+    def test_fighters_scraped(self):
+        event_scraper = create_event_scraper(FakeSession())
+
+        event_scraper.scrape_event()
+
+        assert event_scraper._fighter_urls
+        assert event_scraper._incorrect_fighter_urls
+        assert len(event_scraper._scraped_fighters) == len(
+            set(event_scraper._fighter_urls)
+        )
+
+    # scrape_event_async
+    def test_async_corrections_overlap_event_data(self):
+        session = OverlapSession()
+
+        asyncio.run(create_event_scraper(session).scrape_event_async())
+
+        assert session.overlapped
+
+    def test_async_matches_sync(self):
+        expected = create_event_scraper(FakeSession()).scrape_event()
+
+        event_scraper = create_event_scraper(FakeSession())
+        actual = asyncio.run(event_scraper.scrape_event_async())
+
+        assert actual == expected
+        assert set(event_scraper.timings) == STAGES
+
+    def test_async_event_data_error_not_hidden(self, monkeypatch):
+        event_scraper = EventScraper(
+            1124,
+            transport=Transport(session=FakeSession()),
+            event_cache=EventCache(),
+            fighter_cache=FighterCache(),
+            metrics=Metrics(),
+        )
+
+        def fail():
+            raise requests.exceptions.ConnectionError()
+
+        monkeypatch.setattr(event_scraper, "_get_incorrect_urls", fail)
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            asyncio.run(event_scraper.scrape_event_async())
+
+    # Metrics
+    def test_metrics_aggregate(self):
+        metrics = Metrics()
+
+        metrics.record("stage", 1.0)
+        metrics.record("stage", 3.0)
+
+        expected = {"count": 2, "total": 4.0, "last": 3.0, "max": 3.0}
+        assert metrics.snapshot()["timings"]["stage"] == expected
+
+    def test_metrics_gauge(self):
+        metrics = Metrics()
+
+        metrics.set_gauge("limit", 4)
+        metrics.set_gauge("limit", 6)
+
+        assert metrics.get_gauge("limit") == 6
+        assert metrics.get_gauge("unknown") is None
@@ -0,0 +1,84 @@
+import dataclasses
+
+from ufc_data_scraper.cache import EventCache, FighterCache
+
+from ufc_data_scraper.scraper import EventScraper, FighterScraper
+
+from ufc_data_scraper.transport import Transport
+
+from ufc_data_scraper.tests.fakes import FakeSession, load_fixture
+
+ALI_URL = "http://www.ufc.com/athlete/ali-alqaisi"
+
+
+def create_transport() -> Transport:
+    session = FakeSession()
+    session.add_page(
+        "http://d29dxerjsp82wz.cloudfront.net/api/v3/event/live/1124.json",
+        load_fixture("event_1124.json"),
+    )
+    session.add_page(ALI_URL, load_fixture("athlete_ali_alqaisi.html"))
+    session.add_page(
+        "http://www.ufc.com/athlete/Joseph-Benavidez",
+        load_fixture("athlete_joseph_benavidez.html"),
+    )
+
+    return Transport(session=session)
+
+
+class TestFighterCache:
+    test_fighter = FighterScraper(
+        ALI_URL, {}, {}, transport=create_transport()
+    ).scrape_fighter()
+
+    def test_get_missing(self):
+        assert FighterCache().get(ALI_URL) is None
+
+    def test_set_get(self):
+        fighter_cache = FighterCache()
+        fighter_cache.set(ALI_URL, self.test_fighter)
+
+        assert fighter_cache.get(ALI_URL) is self.test_fighter
+
+    def test_ttl_depends_on_status(self):
+        fighter_cache = FighterCache(ttls={"Not Fighting": 0})
+        fighter_cache.set(ALI_URL, self.test_fighter)
+
+        assert self.test_fighter.status == "Not Fighting"
+        assert fighter_cache.get(ALI_URL) is None
+
+    def test_least_recently_used_evicted(self):
+        fighter_cache = FighterCache(max_size=2)
+        other_fighter = dataclasses.replace(self.test_fighter, name="Other")
+
+        fighter_cache.set("first", self.test_fighter)
+        fighter_cache.set("second", other_fighter)
+        fighter_cache.get("first")
+        fighter_cache.set("third", other_fighter)
+
+        assert len(fighter_cache) == 2
+        assert fighter_cache.get("second") is None
+        assert fighter_cache.get("first") is self.test_fighter
+
+    def test_shared_across_event_scrapers(self):
+        transport = create_transport()
+        fighter_cache = FighterCache()
+
+        EventScraper(
+            1124,
+            transport=transport,
+            event_cache=EventCache(),
+            fighter_cache=fighter_cache,
+        ).scrape_event()
+        transport.session.requested.clear()
+
+        EventScraper(
+            1124,
+            transport=transport,
+            event_cache=EventCache(),
+            fighter_cache=fighter_cache,
+        ).scrape_event()
+
+        requested = {url.lower() for url in transport.session.requested}
+        assert "https://www.ufc.com/athlete/ali-alqaisi" not in requested
+        assert "https://www.ufc.com/athlete/joseph-benavidez" not in requested
@@ -1,5 +1,6 @@
 from datetime import datetime
 
+from ufc_data_scraper.scraper.athlete_page import AthletePage, AthletePageParser
 from ufc_data_scraper.scraper.fighter_scraper import FighterScraper, set_fighter_url
 
 from ufc_data_scraper.utils import get_incorrect_urls
@@ -29,8 +30,16 @@ class TestFighterScraper:
         """Clears FighterScrapers soup, for testing only."""
 
         fighter_scraper._soup = None
-        fighter_scraper._stats_section = None
-        fighter_scraper._stats_targets = None
+        fighter_scraper._page = AthletePage()
+
+    def _read_page(self, content: str) -> AthletePage:
+        """Reads content with AthletePageParser, for testing only."""
+
+        parser = AthletePageParser()
+        parser.feed(content)
+        parser.close()
+
+        return parser.page
 
     # _create_soup
     def test_create_soup_with_soup(self):
@@ -38,27 +47,25 @@ class TestFighterScraper:
         self.test_fighter_scraper._create_soup(test_soup)
 
         assert self.test_fighter_scraper._soup is not None
-        assert self.test_fighter_scraper._stats_section is not None
-        assert self.test_fighter_scraper._stats_targets is not None
+        assert self.test_fighter_scraper._page.stat_blocks == []
+        assert self.test_fighter_scraper._page.stat_bars == []
 
         self._clean_soup(self.test_fighter_scraper)
         assert self.test_fighter_scraper._soup is None
-        assert self.test_fighter_scraper._stats_section is None
-        assert self.test_fighter_scraper._stats_targets is None
 
-    # _parse_stat_block
+    # _parse_stat_block_text
     def test_parse_stat_block_webpage_striking(self):
         expected = (42, 73, 172)
-        actual = self.scraper_ali_alqaisi._parse_stat_block(
-            self.scraper_ali_alqaisi._stats_targets[0]
+        actual = self.scraper_ali_alqaisi._parse_stat_block_text(
+            **self.scraper_ali_alqaisi._page.stat_blocks[0]
         )
 
         assert actual == expected
 
     def test_parse_stat_block_webpage_grappling(self):
         expected = (29, 0, 24)
-        actual = self.scraper_ali_alqaisi._parse_stat_block(
-            self.scraper_ali_alqaisi._stats_targets[1]
+        actual = self.scraper_ali_alqaisi._parse_stat_block_text(
+            **self.scraper_ali_alqaisi._page.stat_blocks[1]
         )
 
         assert actual == expected
@@ -95,44 +102,44 @@ class TestFighterScraper:
                 </div>
             </div>
         """
-        self.test_fighter_scraper._create_soup(test_data)
+        test_page = self._read_page(test_data)
 
         expected = (42, 73, 0)
-        actual = self.test_fighter_scraper._parse_stat_block(
-            self.test_fighter_scraper._stats_targets[0]
+        actual = self.test_fighter_scraper._parse_stat_block_text(
+            **test_page.stat_blocks[0]
         )
 
         assert actual == expected
 
     def test_parse_stat_block_raw_no_targets(self):
         test_data = '<div class="stats-records stats-records--two-column"></div>'
-        self.test_fighter_scraper._create_soup(test_data)
+        test_page = self._read_page(test_data)
 
         expected = (0, 0, 0)
-        actual = self.test_fighter_scraper._parse_stat_block(
-            self.test_fighter_scraper._stats_targets[0]
+        actual = self.test_fighter_scraper._parse_stat_block_text(
+            **test_page.stat_blocks[0]
         )
 
         assert actual == expected
 
-    # _parse_stats_section
-    def test_parse_stats_section_webpage_win_method(self):
+    # _parse_stat_bar
+    def test_parse_stat_bar_webpage_win_method(self):
         expected = ((1, 13), (3, 38), (4, 50))
-        actual = self.scraper_ali_alqaisi._parse_stats_section(
-            self.scraper_ali_alqaisi._stats_section[1]
+        actual = self.scraper_ali_alqaisi._parse_stat_bar(
+            self.scraper_ali_alqaisi._page.stat_bars[1]
         )
 
         assert actual == expected
 
-    def test_parse_stats_section_webpage_strike_position(self):
+    def test_parse_stat_bar_webpage_strike_position(self):
         expected = ((63, 86), (9, 12), (1, 1))
-        actual = self.scraper_ali_alqaisi._parse_stats_section(
-            self.scraper_ali_alqaisi._stats_section[0]
+        actual = self.scraper_ali_alqaisi._parse_stat_bar(
+            self.scraper_ali_alqaisi._page.stat_bars[0]
         )
 
         assert actual == expected
 
-    def test_parse_stats_section_raw_empty_targets(self):
+    def test_parse_stat_bar_raw_empty_targets(self):
         test_data = """
             <div class="c-stat-3bar c-stat-3bar--no-chart">
                 <h2 class="c-stat-3bar__title">Sig. Str. By Position</h2>
@@ -152,28 +159,24 @@ class TestFighterScraper:
                 </div>
             </div>
         """
-        self.test_fighter_scraper._create_soup(test_data)
+        test_page = self._read_page(test_data)
 
         expected = ((63, 86), (0, 0), (1, 1))
-        actual = self.test_fighter_scraper._parse_stats_section(
-            self.test_fighter_scraper._stats_section[0]
-        )
+        actual = self.test_fighter_scraper._parse_stat_bar(test_page.stat_bars[0])
 
         assert actual == expected
 
-    def test_parse_stats_section_raw_no_targets(self):
+    def test_parse_stat_bar_raw_no_targets(self):
         test_data = '<div class="c-stat-3bar c-stat-3bar--no-chart"></div>'
-        self.test_fighter_scraper._create_soup(test_data)
+        test_page = self._read_page(test_data)
 
         expected = (0, 0), (0, 0), (0, 0)
-        actual = self.test_fighter_scraper._parse_stats_section(
-            self.test_fighter_scraper._stats_section[0]
-        )
+        actual = self.test_fighter_scraper._parse_stat_bar(test_page.stat_bars[0])
 
         assert actual == expected
 
-    # _parse_result_set
-    def test_parse_result_set_webpage_win_method(self):
+    # _select_stats
+    def test_select_stats_webpage_win_method(self):
         expected = {
             "Sig. Str. Landed": 2.43,
             "Sig. Str. Absorbed": 1.97,
@@ -181,25 +184,25 @@ class TestFighterScraper:
             "Knockdown Avg": 0.00,
         }
 
-        actual = self.scraper_ali_alqaisi._parse_result_set(
-            self.scraper_ali_alqaisi._stats_targets, expected.keys()
+        actual = self.scraper_ali_alqaisi._select_stats(
+            self.scraper_ali_alqaisi._page.stat_compare, expected.keys()
         )
 
         assert actual == expected
 
-    def test_parse_result_set_webpage_strike_position(self):
+    def test_select_stats_webpage_strike_position(self):
         expected = {
             "Takedown avg": 3.50,
             "Takedown Defense": 60,
             "Submission avg": 1.00,
         }
-        actual = self.scraper_ali_alqaisi._parse_result_set(
-            self.scraper_ali_alqaisi._stats_targets, expected.keys()
+        actual = self.scraper_ali_alqaisi._select_stats(
+            self.scraper_ali_alqaisi._page.stat_compare, expected.keys()
         )
 
         assert actual == expected
 
-    def test_parse_result_set_raw_empty_targets(self):
+    def test_select_stats_raw_empty_targets(self):
         test_data = """
             <div class="stats-records stats-records--two-column">
             <div class="stats-records--compare stats-records-inner">
@@ -272,7 +275,7 @@ class TestFighterScraper:
             </div>
             </div>
         """
-        self.test_fighter_scraper._create_soup(test_data)
+        test_page = self._read_page(test_data)
 
         expected = {
             "Sig. Str. Landed": 0,
@@ -280,15 +283,15 @@ class TestFighterScraper:
             "Sig. Str. Defense": 0,
             "Knockdown Avg": 0.00,
         }
-        actual = self.test_fighter_scraper._parse_result_set(
-            self.test_fighter_scraper._stats_targets, expected.keys()
+        actual = self.test_fighter_scraper._select_stats(
+            test_page.stat_compare, expected.keys()
         )
 
         assert actual == expected
 
-    def test_parse_result_set_raw_no_targets(self):
+    def test_select_stats_raw_no_targets(self):
         test_data = '<div class="stats-records stats-records--two-column"></div>'
-        self.test_fighter_scraper._create_soup(test_data)
+        test_page = self._read_page(test_data)
 
         expected = {
             "Sig. Str. Landed": 0,
@@ -296,8 +299,8 @@ class TestFighterScraper:
             "Sig. Str. Defense": 0,
             "Knockdown Avg": 0,
         }
-        actual = self.test_fighter_scraper._parse_result_set(
-            self.test_fighter_scraper._stats_targets, expected.keys()
+        actual = self.test_fighter_scraper._select_stats(
+            test_page.stat_compare, expected.keys()
         )
 
         assert actual == expected
@@ -305,29 +308,29 @@ class TestFighterScraper:
     # set_fighter_url
     def test_set_fighter_url_lower_case(self):
         test_url = "http://www.ufc.com/athlete/Jan-Blachowicz"
-        expected = "http://www.ufc.com/athlete/jan-blachowicz"
+        expected = "https://www.ufc.com/athlete/jan-blachowicz"
 
         actual = set_fighter_url(test_url, self.incorrect_fighter_urls)
 
         assert actual == expected
 
     def test_set_fighter_url_https(self):
-        test_url = "https://www.ufc.com/athlete/jan-blachowicz"
-        expected = "http://www.ufc.com/athlete/jan-blachowicz"
+        test_url = "http://www.ufc.com/athlete/jan-blachowicz"
+        expected = "https://www.ufc.com/athlete/jan-blachowicz"
         actual = set_fighter_url(test_url, self.incorrect_fighter_urls)
 
         assert actual == expected
 
     def test_set_fighter_url_banned_chars(self):
         test_url = "http://www.ufc.com/athlete/jan'-blachowicz--"
-        expected = "http://www.ufc.com/athlete/jan-blachowicz"
+        expected = "https://www.ufc.com/athlete/jan-blachowicz"
         actual = set_fighter_url(test_url, self.incorrect_fighter_urls)
 
         assert actual == expected
 
     def test_set_fighter_url_incorrect_url(self):
         test_url = "http://www.ufc.com/athlete/Raul-Rosas-Jr."
-        expected = "http://www.ufc.com/athlete/raul-rosas-jr"
+        expected = "https://www.ufc.com/athlete/raul-rosas-jr"
         actual = set_fighter_url(test_url, self.incorrect_fighter_urls)
 
         assert actual == expected
@@ -335,7 +338,7 @@ class TestFighterScraper:
     def test_set_fighter_url_incorrect_url_unidecode(self):
         # Tests if text is correctly decoded
         test_url = "http://www.ufc.com/athlete/Cristian-Quiñonez"
-        expected = "http://www.ufc.com/athlete/trevin-dzhayls-6"
+        expected = "https://www.ufc.com/athlete/trevin-dzhayls-6"
         actual = set_fighter_url(test_url, self.incorrect_fighter_urls)
 
         assert actual == expected
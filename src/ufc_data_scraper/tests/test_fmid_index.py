@@ -0,0 +1,121 @@
+from ufc_data_scraper.cache import FmidIndex
+from ufc_data_scraper.cache.fmid_index import normalize_event_url
+from ufc_data_scraper.scraper import get_event_fmid, build_fmid_index
+from ufc_data_scraper.transport import Transport
+
+from ufc_data_scraper.tests.fakes import FakeSession, event_page, listing_page
+
+
+class TestFmidIndex:
+    # normalize_event_url
+    def test_normalize_event_url(self):
+        assert (
+            normalize_event_url("https://www.UFC.com/event/UFC-282/")
+            == normalize_event_url("http://www.ufc.com/event/ufc-282?tab=1")
+            == "www.ufc.com/event/ufc-282"
+        )
+
+    # get / set
+    def test_set_persists(self, tmp_path):
+        path = tmp_path / "fmid_index.json"
+
+        FmidIndex(path).set("https://www.ufc.com/event/ufc-282", 1124)
+
+        fmid_index = FmidIndex(path)
+        assert fmid_index.get("http://www.ufc.com/event/ufc-282/") == 1124
+        assert "https://www.ufc.com/event/ufc-282" in fmid_index
+        assert len(fmid_index) == 1
+
+    def test_get_missing(self, tmp_path):
+        assert (
+            FmidIndex(tmp_path / "fmid_index.json").get(
+                "https://www.ufc.com/event/ufc-1"
+            )
+            is None
+        )
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        path = tmp_path / "fmid_index.json"
+        path.write_text("{not json")
+
+        assert len(FmidIndex(path)) == 0
+
+    # get_event_fmid
+    def test_get_event_fmid_uses_index(self):
+        session = FakeSession()
+        fmid_index = FmidIndex()
+        fmid_index.set("https://www.ufc.com/event/ufc-282", 1124)
+
+        fmid = get_event_fmid(
+            "https://www.ufc.com/event/ufc-282",
+            transport=Transport(session),
+            fmid_index=fmid_index,
+        )
+
+        assert fmid == 1124
+        assert session.requested == []
+
+    def test_get_event_fmid_writes_index(self):
+        session = FakeSession()
+        session.add_page("https://www.ufc.com/event/ufc-282", event_page(1124))
+        fmid_index = FmidIndex()
+
+        get_event_fmid(
+            "https://www.ufc.com/event/ufc-282",
+            transport=Transport(session),
+            fmid_index=fmid_index,
+        )
+
+        assert fmid_index.get("https://www.ufc.com/event/ufc-282") == 1124
+
+    def test_get_event_fmid_unwritable_index(self, tmp_path):
+        session = FakeSession()
+        session.add_page("https://www.ufc.com/event/ufc-282", event_page(1124))
+        # Cache directory under a regular file can never be created
+        (tmp_path / "file").touch()
+        fmid_index = FmidIndex(tmp_path / "file" / "fmid_index.json")
+
+        fmid = get_event_fmid(
+            "https://www.ufc.com/event/ufc-282",
+            transport=Transport(session),
+            fmid_index=fmid_index,
+        )
+
+        assert fmid == 1124
+        assert fmid_index.get("https://www.ufc.com/event/ufc-282") == 1124
+
+    # build_fmid_index
+    def test_build_fmid_index(self, tmp_path):
+        session = FakeSession()
+        session.add_page(
+            "http://www.ufc.com/events?page=0", listing_page(["ufc-282", "ufc-281"])
+        )
+        session.add_page("http://www.ufc.com/events?page=1", listing_page(["ufc-280"]))
+        session.add_page("http://www.ufc.com/events?page=2", "<html></html>")
+        for slug, event_fmid in (
+            ("ufc-282", 1124),
+            ("ufc-281", 1123),
+            ("ufc-280", 1122),
+        ):
+            session.add_page(f"http://www.ufc.com/event/{slug}", event_page(event_fmid))
+        fmid_index = FmidIndex(tmp_path / "fmid_index.json")
+        fmid_index.set("http://www.ufc.com/event/ufc-281", 1123)
+
+        added = build_fmid_index(fmid_index, transport=Transport(session))
+
+        assert added == 2
+        assert (
+            FmidIndex(tmp_path / "fmid_index.json").get(
+                "https://www.ufc.com/event/ufc-280"
+            )
+            == 1122
+        )
+        assert "https://www.ufc.com/event/ufc-281" not in session.requested
+
+    def test_build_fmid_index_skips_unresolved(self):
+        session = FakeSession()
+        session.add_page("http://www.ufc.com/events?page=0", listing_page(["ufc-282"]))
+
+        added = build_fmid_index(FmidIndex(), max_pages=1, transport=Transport(session))
+
+        assert added == 0
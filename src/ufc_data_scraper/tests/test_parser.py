@@ -0,0 +1,102 @@
+import pytest
+
+from ufc_data_scraper.scraper import FighterScraper
+from ufc_data_scraper.scraper.fmid_finder import _parse_event_urls
+from ufc_data_scraper.transport import Transport
+from ufc_data_scraper.utils import parser
+from ufc_data_scraper.utils.parser import (
+    PARSER_BACKENDS,
+    available_parser_backends,
+    resolve_parser_backend,
+)
+
+from ufc_data_scraper.tests.fakes import FakeSession, listing_page, load_fixture
+
+ATHLETE_FIXTURES = (
+    "athlete_ali_alqaisi.html",
+    "athlete_joseph_benavidez.html",
+    "athlete_cristian_quinonez.html",
+)
+
+
+def scrape_fixture(file_name: str, backend: str, scoped_parse: bool = True):
+    """Scrapes athlete fixture with backend, for testing only."""
+
+    fighter_url = "https://www.ufc.com/athlete/fixture"
+    session = FakeSession()
+    session.add_page(fighter_url, load_fixture(file_name))
+
+    fighter_scraper = FighterScraper(
+        fighter_url,
+        incorrect_urls={},
+        incorrect_names={},
+        transport=Transport(session),
+        parser_backend=backend,
+        scoped_parse=scoped_parse,
+    )
+
+    return fighter_scraper.scrape_fighter()
+
+
+class TestParser:
+    # resolve_parser_backend
+    def test_resolve_parser_backend_html_parser(self):
+        assert resolve_parser_backend("html.parser") == "html.parser"
+
+    def test_resolve_parser_backend_unknown(self):
+        with pytest.raises(ValueError):
+            resolve_parser_backend("html5")
+
+    def test_resolve_parser_backend_falls_back(self, monkeypatch):
+        monkeypatch.setattr(parser, "LexborHTMLParser", None)
+        monkeypatch.setattr(parser, "lxml", None)
+
+        assert available_parser_backends() == ("html.parser",)
+        assert resolve_parser_backend("selectolax", ("c-bio__field",)) == "html.parser"
+
+    def test_resolve_parser_backend_selectolax_needs_regions(self):
+        if "selectolax" not in available_parser_backends():
+            pytest.skip("selectolax is not installed")
+
+        assert resolve_parser_backend("selectolax", ("c-bio__field",)) == "selectolax"
+        assert resolve_parser_backend("selectolax") != "selectolax"
+
+    # Differential
+    @pytest.mark.parametrize("scoped_parse", (True, False))
+    @pytest.mark.parametrize("backend", PARSER_BACKENDS)
+    @pytest.mark.parametrize("file_name", ATHLETE_FIXTURES)
+    def test_fighter_identical_across_backends(self, backend, file_name, scoped_parse):
+        if backend not in available_parser_backends():
+            pytest.skip(f"{backend} is not installed")
+
+        expected = scrape_fixture(file_name, "html.parser", scoped_parse=False)
+        actual = scrape_fixture(file_name, backend, scoped_parse)
+
+        assert actual.as_dict() == expected.as_dict()
+
+    @pytest.mark.parametrize("backend", PARSER_BACKENDS)
+    def test_event_urls_identical_across_backends(self, backend, monkeypatch):
+        monkeypatch.setattr(parser, "_parser_backend", backend)
+        test_page = listing_page(["ufc-282", "ufc-281", "ufc-282"])
+
+        assert _parse_event_urls(test_page) == [
+            "https://www.ufc.com/event/ufc-282",
+            "https://www.ufc.com/event/ufc-281",
+        ]
+
+    @pytest.mark.parametrize("backend", PARSER_BACKENDS)
+    def test_scoped_parse_keeps_search_results_headline(self, backend, monkeypatch):
+        monkeypatch.setattr(parser, "_parser_backend", backend)
+        fighter_scraper = FighterScraper("", {}, {})
+
+        fighter_scraper._create_soup(load_fixture("athlete_search_results.html"))
+
+        assert fighter_scraper._fighter_not_found() is True
+
+    def test_scoped_parse_drops_other_markup(self):
+        fighter_scraper = FighterScraper("", {}, {}, parser_backend="html.parser")
+
+        fighter_scraper._create_soup(load_fixture("athlete_ali_alqaisi.html"))
+
+        assert fighter_scraper._soup.find("footer") is None
+        assert fighter_scraper._soup.find("h1", class_="hero-profile__name")
@@ -0,0 +1,132 @@
+import pytest
+
+from ufc_data_scraper.transport import (
+    RateLimiter,
+    TokenBucket,
+    Transport,
+    get_rate_limiter,
+    get_transport,
+    set_transport,
+)
+from ufc_data_scraper.transport import rate_limiter as rate_limiter_module
+
+from ufc_data_scraper.utils import Metrics
+
+from ufc_data_scraper.tests.fakes import FakeSession
+
+UFC_PAGE = "https://www.ufc.com/athlete/ali-alqaisi"
+API_PAGE = "https://d29dxerjsp82wz.cloudfront.net/api/v3/event/live/1124.json"
+
+
+class FakeClock:
+    """Monotonic clock advanced by sleeping, for testing only."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter_module.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(rate_limiter_module.time, "sleep", clock.sleep)
+
+    return clock
+
+
+class TestRateLimiter:
+    # TokenBucket
+    def test_burst_then_rate(self, clock):
+        bucket = TokenBucket(rate=10.0, burst=2)
+
+        waits = [bucket.reserve() for _ in range(4)]
+
+        assert waits == pytest.approx([0.0, 0.0, 0.1, 0.2])
+
+    def test_refill_capped_at_burst(self, clock):
+        bucket = TokenBucket(rate=10.0, burst=2)
+        bucket.reserve()
+        bucket.reserve()
+
+        clock.now += 60
+
+        waits = [bucket.reserve() for _ in range(3)]
+
+        assert waits == pytest.approx([0.0, 0.0, 0.1])
+
+    def test_invalid_bucket(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0, burst=1)
+
+    # RateLimiter
+    def test_hosts_limited_independently(self, clock):
+        rate_limiter = RateLimiter(
+            {"www.ufc.com": (1.0, 1), "d29dxerjsp82wz.cloudfront.net": (1.0, 1)}
+        )
+
+        assert rate_limiter.acquire(UFC_PAGE) == 0
+        assert rate_limiter.acquire(API_PAGE) == 0
+        assert rate_limiter.acquire(UFC_PAGE) == pytest.approx(1.0)
+
+    def test_unlisted_host_not_limited(self, clock):
+        rate_limiter = RateLimiter({"www.ufc.com": (1.0, 1)})
+
+        for _ in range(5):
+            rate_limiter.acquire("https://raw.githubusercontent.com/corrections.json")
+
+        assert clock.sleeps == []
+
+    def test_set_limit(self, clock):
+        rate_limiter = RateLimiter({})
+        rate_limiter.set_limit("www.ufc.com", 2.0, 1)
+
+        rate_limiter.acquire(UFC_PAGE)
+        rate_limiter.acquire(UFC_PAGE)
+
+        assert clock.sleeps == pytest.approx([0.5])
+
+    def test_wait_reported(self, clock):
+        metrics = Metrics()
+        rate_limiter = RateLimiter({"www.ufc.com": (4.0, 1)}, metrics=metrics)
+
+        for _ in range(3):
+            rate_limiter.acquire(UFC_PAGE)
+
+        stats = rate_limiter.get_stats()["www.ufc.com"]
+        assert stats["requests"] == 3
+        assert stats["waited"] == pytest.approx(0.5)
+        assert stats["max_wait"] == pytest.approx(0.25)
+        assert metrics.snapshot()["timings"]["rate_limit.www.ufc.com"]["count"] == 3
+
+    # Transport
+    def test_transport_limits_network_requests(self, clock):
+        session = FakeSession()
+        session.add_page(UFC_PAGE, b"")
+        rate_limiter = RateLimiter({"www.ufc.com": (1.0, 1)})
+        transport = Transport(session, rate_limiter=rate_limiter)
+
+        transport.get(UFC_PAGE)
+        transport.get(UFC_PAGE)
+
+        assert clock.sleeps == pytest.approx([1.0])
+        assert rate_limiter.get_stats()["www.ufc.com"]["requests"] == 2
+
+    def test_transport_unlimited_by_default(self):
+        assert Transport(FakeSession()).rate_limiter is None
+
+    def test_set_transport_shares_rate_limiter(self):
+        previous = get_transport()
+        set_transport(FakeSession())
+
+        try:
+            assert get_transport().rate_limiter is get_rate_limiter()
+        finally:
+            set_transport(previous)
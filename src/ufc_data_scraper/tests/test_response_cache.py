@@ -0,0 +1,110 @@
+import tempfile
+
+from ufc_data_scraper.transport import Transport, ResponseCache, create_transport
+from ufc_data_scraper.transport.response_cache import classify_url, normalize_url
+
+from ufc_data_scraper.tests.fakes import FakeSession
+
+ATHLETE_URL = "https://www.ufc.com/athlete/ali-alqaisi"
+
+
+def create_cached_transport(ttls: dict = None) -> Transport:
+    session = FakeSession()
+    session.add_page(ATHLETE_URL, "<h1>Ali Al-Qaisi</h1>", headers={"ETag": '"v1"'})
+
+    cache = ResponseCache(tempfile.mkdtemp(), ttls)
+
+    return Transport(session=session, cache=cache)
+
+
+class TestResponseCache:
+    # classify_url
+    def test_classify_url_event_api(self):
+        test_url = "http://d29dxerjsp82wz.cloudfront.net/api/v3/event/live/1124.json"
+
+        assert classify_url(test_url) == "event_api"
+
+    def test_classify_url_athlete(self):
+        assert classify_url(ATHLETE_URL) == "athlete"
+
+    def test_classify_url_events_listing(self):
+        assert classify_url("http://www.ufc.com/events?page=2") == "events_listing"
+
+    def test_classify_url_corrections(self):
+        test_url = "https://raw.githubusercontent.com/HeXeDMinD/ufc-data-scraper/main/src/ufc_data_scraper/data/incorrect_urls.json"
+
+        assert classify_url(test_url) == "corrections"
+
+    def test_classify_url_not_cached(self):
+        assert classify_url("https://www.ufc.com/event/ufc-282") is None
+
+    # normalize_url
+    def test_normalize_url_scheme_and_params(self):
+        expected = normalize_url("https://www.ufc.com/events?page=1")
+        actual = normalize_url("http://WWW.UFC.COM/events/", params={"page": 1})
+
+        assert actual == expected
+
+    # Transport with cache
+    def test_fresh_response_served_from_cache(self):
+        transport = create_cached_transport()
+
+        first = transport.get(ATHLETE_URL)
+        second = transport.get(ATHLETE_URL)
+
+        assert len(transport.session.requested) == 1
+        assert second.content == first.content
+        assert second.from_cache is True
+
+    def test_stale_response_revalidated(self):
+        transport = create_cached_transport({"athlete": 0})
+
+        transport.get(ATHLETE_URL)
+        actual = transport.get(ATHLETE_URL)
+
+        assert len(transport.session.requested) == 2
+        assert actual.status_code == 200
+        assert actual.content == b"<h1>Ali Al-Qaisi</h1>"
+        assert actual.from_cache is True
+
+    def test_changed_response_replaces_cache(self):
+        transport = create_cached_transport({"athlete": 0})
+
+        transport.get(ATHLETE_URL)
+        transport.session.add_page(
+            ATHLETE_URL, "<h1>Ali Al Qaisi</h1>", headers={"ETag": '"v2"'}
+        )
+        actual = transport.get(ATHLETE_URL)
+
+        assert actual.content == b"<h1>Ali Al Qaisi</h1>"
+        assert not hasattr(actual, "from_cache")
+
+    def test_failed_response_not_cached(self):
+        transport = create_cached_transport()
+        missing_url = "https://www.ufc.com/athlete/missing"
+
+        transport.get(missing_url)
+        actual = transport.get(missing_url)
+
+        assert actual.status_code == 404
+        assert len(transport.session.requested) == 2
+
+    def test_unwritable_cache_serves_response(self, tmp_path):
+        (tmp_path / "cache").touch()
+        session = FakeSession()
+        session.add_page(ATHLETE_URL, "<h1>Ali Al-Qaisi</h1>")
+        transport = Transport(
+            session=session, cache=ResponseCache(tmp_path / "cache" / "responses")
+        )
+
+        first = transport.get(ATHLETE_URL)
+        second = transport.get(ATHLETE_URL)
+
+        assert first.content == second.content == b"<h1>Ali Al-Qaisi</h1>"
+        assert len(session.requested) == 2
+
+    # create_transport
+    def test_create_transport_with_cache(self):
+        cache = ResponseCache(tempfile.mkdtemp())
+
+        assert create_transport(FakeSession(), cache=cache).cache is cache
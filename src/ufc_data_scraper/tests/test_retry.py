@@ -0,0 +1,336 @@
+import pytest
+import requests
+
+from ufc_data_scraper.cache import EventCache, FighterCache
+
+from ufc_data_scraper.exceptions import CircuitOpen
+
+from ufc_data_scraper.scraper import EventScraper, scrape_event_batch
+
+from ufc_data_scraper.transport import (
+    CircuitBreaker,
+    RetryPolicy,
+    Transport,
+    UrlMap,
+    get_circuit_breaker,
+    get_transport,
+    set_transport,
+)
+from ufc_data_scraper.transport import retry as retry_module
+from ufc_data_scraper.transport import transport as transport_module
+
+from ufc_data_scraper.utils import ConcurrencyLimiter, Metrics, is_overloaded
+
+from ufc_data_scraper.tests.fakes import FakeSession, load_fixture
+
+UFC_HOST = "www.ufc.com"
+UFC_PAGE = "https://www.ufc.com/athlete/ali-alqaisi"
+# Fighter link as listed by the event API
+UFC_LINK = "http://www.ufc.com/athlete/ali-alqaisi"
+EVENT_API_URL = "https://d29dxerjsp82wz.cloudfront.net/api/v3/event/live/1124.json"
+
+
+class FlakySession(FakeSession):
+    """Session raising the queued errors before serving pages, for testing only."""
+
+    def __init__(self, errors: list = None) -> None:
+        super().__init__()
+        self.errors = list(errors or [])
+
+    def request(self, method, url, **kwargs) -> requests.Response:
+        if self.errors and url == UFC_PAGE:
+            self.requested.append(url)
+            raise self.errors.pop(0)
+
+        return super().request(method, url, **kwargs)
+
+
+class FakeClock:
+    """Monotonic clock advanced by sleeping, for testing only."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(retry_module.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(transport_module.time, "sleep", clock.sleep)
+    # Longest delay, so backoff is deterministic
+    monkeypatch.setattr(retry_module.random, "uniform", lambda low, high: high)
+
+    return clock
+
+
+def create_transport(session: FakeSession, **kwargs) -> Transport:
+    kwargs.setdefault("retry", RetryPolicy(attempts=3, base_delay=0.5))
+
+    return Transport(session, **kwargs)
+
+
+def create_event_scraper(session: FakeSession) -> EventScraper:
+    return EventScraper(
+        1124,
+        transport=create_transport(session),
+        event_cache=EventCache(),
+        fighter_cache=FighterCache(),
+        url_map=UrlMap(),
+        limiter=ConcurrencyLimiter(metrics=Metrics()),
+    )
+
+
+class TestRetry:
+    # RetryPolicy
+    def test_delay_grows_exponentially(self, clock):
+        retry = RetryPolicy(base_delay=0.5, max_delay=1.5)
+
+        assert [retry.get_delay(n) for n in range(4)] == [0.5, 1.0, 1.5, 1.5]
+
+    def test_delay_jittered(self, monkeypatch):
+        bounds = []
+        monkeypatch.setattr(
+            retry_module.random, "uniform", lambda low, high: bounds.append((low, high))
+        )
+
+        RetryPolicy(base_delay=0.5).get_delay(2)
+
+        assert bounds == [(0, 2.0)]
+
+    def test_retry_after(self, clock):
+        response = requests.Response()
+        response.headers["Retry-After"] = "3"
+
+        assert RetryPolicy(base_delay=0.5).get_delay(0, response) == 3.0
+        assert RetryPolicy(max_delay=2.0).get_delay(0, response) == 2.0
+
+    def test_invalid_attempts(self):
+        with pytest.raises(ValueError):
+            RetryPolicy(attempts=0)
+
+    # Transport
+    def test_status_retried_until_success(self, clock):
+        session = FakeSession()
+        session.add_page(UFC_PAGE, b"", 503)
+        transport = create_transport(session)
+
+        original_request = session.request
+
+        def recover(method, url, **kwargs):
+            if len(session.requested) == 2:
+                session.add_page(UFC_PAGE, b"fighter")
+            return original_request(method, url, **kwargs)
+
+        session.request = recover
+
+        response = transport.get(UFC_PAGE)
+
+        assert response.status_code == 200
+        assert len(session.requested) == 3
+        assert clock.sleeps == [0.5, 1.0]
+
+    def test_exhausted_retries_return_last_response(self, clock):
+        session = FakeSession()
+        session.add_page(UFC_PAGE, b"", 503)
+
+        response = create_transport(session).get(UFC_PAGE)
+
+        assert response.status_code == 503
+        assert len(session.requested) == 3
+
+    def test_client_error_not_retried(self, clock):
+        session = FakeSession()
+
+        response = create_transport(session).get(UFC_PAGE)
+
+        assert response.status_code == 404
+        assert len(session.requested) == 1
+        assert clock.sleeps == []
+
+    def test_connection_error_retried(self, clock):
+        session = FlakySession([requests.exceptions.ConnectionError()])
+        session.add_page(UFC_PAGE, b"fighter")
+
+        response = create_transport(session).get(UFC_PAGE)
+
+        assert response.status_code == 200
+        assert clock.sleeps == [0.5]
+
+    def test_connection_error_raised_after_attempts(self, clock):
+        session = FlakySession([requests.exceptions.ConnectionError()] * 3)
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            create_transport(session).get(UFC_PAGE)
+
+        assert len(session.requested) == 3
+
+    def test_not_retried_by_default(self, clock):
+        session = FlakySession([requests.exceptions.ReadTimeout()])
+
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            Transport(session).get(UFC_PAGE)
+
+        assert len(session.requested) == 1
+
+    # CircuitBreaker
+    def test_circuit_opens_at_threshold(self, clock):
+        circuit_breaker = CircuitBreaker(failure_threshold=2)
+
+        circuit_breaker.record_failure(UFC_HOST)
+        assert not circuit_breaker.is_open(UFC_HOST)
+
+        circuit_breaker.record_failure(UFC_HOST)
+        assert circuit_breaker.is_open(UFC_HOST)
+
+        with pytest.raises(CircuitOpen):
+            circuit_breaker.before_request(UFC_HOST)
+
+    def test_success_resets_failures(self, clock):
+        circuit_breaker = CircuitBreaker(failure_threshold=2)
+
+        circuit_breaker.record_failure(UFC_HOST)
+        circuit_breaker.record_success(UFC_HOST)
+        circuit_breaker.record_failure(UFC_HOST)
+
+        assert not circuit_breaker.is_open(UFC_HOST)
+
+    def test_single_trial_after_reset_timeout(self, clock):
+        circuit_breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0)
+        circuit_breaker.record_failure(UFC_HOST)
+
+        clock.now += 10.0
+        circuit_breaker.before_request(UFC_HOST)
+
+        with pytest.raises(CircuitOpen):
+            circuit_breaker.before_request(UFC_HOST)
+
+        circuit_breaker.record_success(UFC_HOST)
+        circuit_breaker.before_request(UFC_HOST)
+
+    def test_failed_trial_reopens(self, clock):
+        circuit_breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10.0)
+        for _ in range(3):
+            circuit_breaker.record_failure(UFC_HOST)
+
+        clock.now += 10.0
+        circuit_breaker.before_request(UFC_HOST)
+        circuit_breaker.record_failure(UFC_HOST)
+
+        with pytest.raises(CircuitOpen):
+            circuit_breaker.before_request(UFC_HOST)
+
+    def test_hosts_independent(self, clock):
+        circuit_breaker = CircuitBreaker(failure_threshold=1)
+
+        circuit_breaker.record_failure(UFC_HOST)
+
+        circuit_breaker.before_request("d29dxerjsp82wz.cloudfront.net")
+
+    def test_open_circuit_not_sent(self, clock):
+        session = FakeSession()
+        session.add_page(UFC_PAGE, b"", 503)
+        transport = create_transport(
+            session, circuit_breaker=CircuitBreaker(failure_threshold=2)
+        )
+
+        with pytest.raises(CircuitOpen):
+            transport.get(UFC_PAGE)
+        with pytest.raises(CircuitOpen):
+            transport.get(UFC_PAGE)
+
+        assert len(session.requested) == 2
+
+    def test_caller_errors_not_counted(self, clock):
+        session = FlakySession([requests.exceptions.InvalidURL()] * 2)
+        circuit_breaker = CircuitBreaker(failure_threshold=1)
+
+        for _ in range(2):
+            with pytest.raises(requests.exceptions.InvalidURL):
+                create_transport(session, circuit_breaker=circuit_breaker).get(UFC_PAGE)
+
+        assert not circuit_breaker.is_open(UFC_HOST)
+
+    def test_failures_follow_retry_policy(self, clock):
+        session = FakeSession()
+        session.add_page(UFC_PAGE, b"", 500)
+        circuit_breaker = CircuitBreaker(failure_threshold=1)
+        transport = create_transport(
+            session,
+            retry=RetryPolicy(status_codes=(503,)),
+            circuit_breaker=circuit_breaker,
+        )
+
+        assert transport.get(UFC_PAGE).status_code == 500
+        assert not circuit_breaker.is_open(UFC_HOST)
+
+    def test_ignored_trial_lets_next_through(self, clock):
+        circuit_breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0)
+        circuit_breaker.record_failure(UFC_HOST)
+
+        clock.now += 10.0
+        circuit_breaker.before_request(UFC_HOST)
+        circuit_breaker.record_ignored(UFC_HOST)
+
+        circuit_breaker.before_request(UFC_HOST)
+
+    def test_circuit_open_is_overloaded(self):
+        assert is_overloaded(CircuitOpen())
+
+    def test_set_transport_shares_circuit_breaker(self):
+        previous = get_transport()
+        set_transport(FakeSession())
+
+        try:
+            assert get_transport().circuit_breaker is get_circuit_breaker()
+            assert get_transport().retry is not None
+        finally:
+            set_transport(previous)
+
+    # EventScraper
+    def test_failed_fighter_does_not_fail_event(self, clock):
+        session = FlakySession([requests.exceptions.ConnectionError()] * 3)
+        session.add_page(EVENT_API_URL, load_fixture("event_1124.json"))
+        event_scraper = create_event_scraper(session)
+
+        event = event_scraper.scrape_event()
+
+        assert event.fmid == 1124
+        assert event_scraper._scraped_fighters[UFC_LINK] is None
+        assert session.requested.count(UFC_PAGE) == 3
+
+    def test_event_missing_failed_fighter_not_cached(self, clock):
+        session = FakeSession()
+        session.add_page(EVENT_API_URL, load_fixture("event_1124.json"))
+        session.add_page(UFC_PAGE, b"", 503)
+        event_scraper = create_event_scraper(session)
+
+        event_scraper.scrape_event()
+
+        assert event_scraper._event_cache.get(1124) is None
+
+    def test_event_missing_unknown_fighter_cached(self, clock):
+        session = FakeSession()
+        session.add_page(EVENT_API_URL, load_fixture("event_1124.json"))
+        event_scraper = create_event_scraper(session)
+
+        event_scraper.scrape_event()
+
+        assert event_scraper._event_cache.get(1124) is not None
+
+    def test_batch_event_missing_failed_fighter_not_cached(self, clock):
+        session = FakeSession()
+        session.add_page(EVENT_API_URL, load_fixture("event_1124.json"))
+        session.add_page(UFC_PAGE, b"", 503)
+        event_scraper = create_event_scraper(session)
+
+        scrape_event_batch([event_scraper])
+
+        assert event_scraper._event_cache.get(1124) is None
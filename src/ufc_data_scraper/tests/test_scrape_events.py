@@ -0,0 +1,81 @@
+from collections import Counter
+
+from ufc_data_scraper.cache import EventCache, FighterCache
+
+from ufc_data_scraper.scraper import EventScraper, scrape_event_batch
+
+from ufc_data_scraper.transport import Transport
+
+from ufc_data_scraper.tests.fakes import FakeSession, load_fixture
+
+EVENT_API_URL = "http://d29dxerjsp82wz.cloudfront.net/api/v3/event/live/{}.json"
+
+
+def create_transport() -> Transport:
+    session = FakeSession()
+    for event_fmid in (1124, 1150):
+        session.add_page(
+            EVENT_API_URL.format(event_fmid), load_fixture(f"event_{event_fmid}.json")
+        )
+    session.add_page(
+        "http://www.ufc.com/athlete/ali-alqaisi",
+        load_fixture("athlete_ali_alqaisi.html"),
+    )
+    session.add_page(
+        "http://www.ufc.com/athlete/Joseph-Benavidez",
+        load_fixture("athlete_joseph_benavidez.html"),
+    )
+
+    return Transport(session=session)
+
+
+def create_event_scrapers(transport: Transport, event_fmids: list[int]) -> list:
+    event_cache = EventCache()
+    fighter_cache = FighterCache()
+
+    return [
+        EventScraper(
+            event_fmid,
+            transport=transport,
+            event_cache=event_cache,
+            fighter_cache=fighter_cache,
+        )
+        for event_fmid in event_fmids
+    ]
+
+
+class TestScrapeEventBatch:
+    def test_events_in_order(self):
+        transport = create_transport()
+        actual = scrape_event_batch(create_event_scrapers(transport, [1150, 1124]))
+
+        assert [event.fmid for event in actual] == [1150, 1124]
+
+    def test_matches_single_event_scrape(self):
+        expected = create_event_scrapers(create_transport(), [1124])[0].scrape_event()
+        actual = scrape_event_batch(create_event_scrapers(create_transport(), [1124]))
+
+        assert actual == [expected]
+
+    def test_fighters_scraped_once(self):
+        transport = create_transport()
+        scrape_event_batch(create_event_scrapers(transport, [1124, 1150]))
+
+        requested = Counter(transport.session.requested)
+        athlete_requests = [
+            count for url, count in requested.items() if "/athlete/" in url
+        ]
+
+        assert athlete_requests
+        assert max(athlete_requests) == 1
+
+    def test_cached_events_skip_network(self):
+        transport = create_transport()
+        event_scrapers = create_event_scrapers(transport, [1124])
+
+        expected = scrape_event_batch(event_scrapers)
+        transport.session.requested.clear()
+        actual = scrape_event_batch(event_scrapers)
+
+        assert actual == expected
+        assert transport.session.requested == []
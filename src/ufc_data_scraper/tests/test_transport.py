@@ -0,0 +1,144 @@
+import requests
+
+from ufc_data_scraper.transport import (
+    Transport,
+    UrlMap,
+    canonical_url,
+    create_session,
+    get_transport,
+    set_transport,
+    MAX_CONCURRENCY,
+)
+
+from ufc_data_scraper.tests.fakes import FakeSession
+
+
+class TestTransport:
+    # create_session
+    def test_create_session_pools_ufc(self):
+        session = create_session()
+
+        http_adapter = session.get_adapter("http://www.ufc.com/athlete/jan-blachowicz")
+        https_adapter = session.get_adapter("https://www.ufc.com/event/ufc-282")
+
+        assert http_adapter is https_adapter
+        assert http_adapter._pool_maxsize == MAX_CONCURRENCY
+
+    def test_create_session_separate_api_pool(self):
+        session = create_session(pool_maxsize=4)
+
+        ufc_adapter = session.get_adapter("https://www.ufc.com/events")
+        api_adapter = session.get_adapter(
+            "http://d29dxerjsp82wz.cloudfront.net/api/v3/event/live/1124.json"
+        )
+
+        assert ufc_adapter is not api_adapter
+        assert api_adapter._pool_maxsize == 4
+
+    # canonical_url
+    def test_canonical_url_ufc(self):
+        assert (
+            canonical_url("http://ufc.com/athlete/jan-blachowicz")
+            == "https://www.ufc.com/athlete/jan-blachowicz"
+        )
+
+    def test_canonical_url_api(self):
+        assert (
+            canonical_url(
+                "http://d29dxerjsp82wz.cloudfront.net/api/v3/event/live/1.json"
+            )
+            == "https://d29dxerjsp82wz.cloudfront.net/api/v3/event/live/1.json"
+        )
+
+    def test_canonical_url_keeps_query(self):
+        assert (
+            canonical_url("http://www.ufc.com/events?page=2")
+            == "https://www.ufc.com/events?page=2"
+        )
+
+    def test_canonical_url_other_host(self):
+        assert canonical_url("http://www.google.com") == "http://www.google.com"
+
+    # Transport
+    def test_transport_requests_canonical_url(self):
+        session = FakeSession()
+        session.add_page("https://www.ufc.com/events", "<html></html>")
+
+        response = Transport(session).get("http://www.ufc.com/events")
+
+        assert response.status_code == 200
+        assert session.requested == ["https://www.ufc.com/events"]
+
+    def test_transport_learns_permanent_redirects(self, tmp_path):
+        session = FakeSession()
+        session.add_page("https://www.ufc.com/athlete/jan-blachowicz", "<html></html>")
+        session.add_redirect(
+            "https://www.ufc.com/athlete/jan-blachowicz-2",
+            "https://www.ufc.com/athlete/jan-blachowicz",
+        )
+        redirects = UrlMap(tmp_path / "redirects.json")
+
+        Transport(session, redirects=redirects).get(
+            "http://www.ufc.com/athlete/jan-blachowicz-2"
+        )
+        session.requested.clear()
+        Transport(session, redirects=UrlMap(tmp_path / "redirects.json")).get(
+            "http://www.ufc.com/athlete/jan-blachowicz-2"
+        )
+
+        assert session.requested == ["https://www.ufc.com/athlete/jan-blachowicz"]
+
+    def test_transport_redirect_map_unwritable(self, tmp_path):
+        session = FakeSession()
+        session.add_page("https://www.ufc.com/athlete/jan-blachowicz", "<html></html>")
+        session.add_redirect(
+            "https://www.ufc.com/athlete/jan-blachowicz-2",
+            "https://www.ufc.com/athlete/jan-blachowicz",
+        )
+        # Cache directory under a regular file can never be created
+        (tmp_path / "file").touch()
+        redirects = UrlMap(tmp_path / "file" / "redirects.json")
+
+        response = Transport(session, redirects=redirects).get(
+            "http://www.ufc.com/athlete/jan-blachowicz-2"
+        )
+
+        assert response.status_code == 200
+        assert redirects.get("https://www.ufc.com/athlete/jan-blachowicz-2")
+
+    def test_transport_ignores_temporary_redirects(self):
+        session = FakeSession()
+        session.add_page("https://www.ufc.com/search", "<html></html>")
+        session.add_redirect(
+            "https://www.ufc.com/athlete/unknown",
+            "https://www.ufc.com/search",
+            status_code=302,
+        )
+        transport = Transport(session)
+
+        transport.get("https://www.ufc.com/athlete/unknown")
+
+        assert len(transport.redirects) == 0
+
+    def test_transport_uses_supplied_session(self):
+        session = requests.Session()
+        transport = Transport(session=session)
+
+        assert transport.session is session
+
+    # get_transport / set_transport
+    def test_get_transport_is_shared(self):
+        assert get_transport() is get_transport()
+
+    def test_set_transport_wraps_session(self):
+        previous = get_transport()
+        session = requests.Session()
+
+        try:
+            set_transport(session)
+            actual = get_transport()
+
+            assert isinstance(actual, Transport)
+            assert actual.session is session
+        finally:
+            set_transport(previous)
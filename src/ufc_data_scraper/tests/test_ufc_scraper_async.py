@@ -0,0 +1,114 @@
+import asyncio
+import threading
+import time
+
+from ufc_data_scraper import scrape_event_fmid_async, scrape_fighter_url_async
+
+from ufc_data_scraper.scraper import EventScraper, FighterScraper
+
+from ufc_data_scraper.transport import Transport, get_transport, set_transport
+
+from ufc_data_scraper.cache import EventCache, FighterCache
+
+from ufc_data_scraper.data_models import Fighter, Event
+
+from ufc_data_scraper.tests.fakes import FakeSession, load_fixture
+
+
+def create_fake_session() -> FakeSession:
+    session = FakeSession()
+    session.add_page(
+        "http://d29dxerjsp82wz.cloudfront.net/api/v3/event/live/1124.json",
+        load_fixture("event_1124.json"),
+    )
+    session.add_page(
+        "http://www.ufc.com/athlete/ali-alqaisi",
+        load_fixture("athlete_ali_alqaisi.html"),
+    )
+    session.add_page(
+        "http://www.ufc.com/athlete/Joseph-Benavidez",
+        load_fixture("athlete_joseph_benavidez.html"),
+    )
+
+    return session
+
+
+class SlowSession(FakeSession):
+    """Tracks how many requests are in flight at once, for testing only."""
+
+    def __init__(self, pages: dict = None) -> None:
+        super().__init__(pages)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def request(self, method, url, params=None, **kwargs):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.02)
+        try:
+            return super().request(method, url, params=params, **kwargs)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+class TestUfcScraperAsync:
+    def test_scrape_fighter_async_matches_sync(self):
+        transport = Transport(session=create_fake_session())
+        fighter_url = "http://www.ufc.com/athlete/ali-alqaisi"
+
+        expected = FighterScraper(fighter_url, transport=transport).scrape_fighter()
+        actual = asyncio.run(
+            FighterScraper(fighter_url, transport=transport).scrape_fighter_async()
+        )
+
+        assert isinstance(actual, Fighter)
+        assert actual == expected
+
+    def test_scrape_event_async_matches_sync(self):
+        transport = Transport(session=create_fake_session())
+
+        expected = EventScraper(
+            1124, transport=transport, event_cache=EventCache()
+        ).scrape_event()
+        actual = asyncio.run(
+            EventScraper(
+                1124,
+                transport=transport,
+                event_cache=EventCache(),
+                fighter_cache=FighterCache(),
+            ).scrape_event_async()
+        )
+
+        assert isinstance(actual, Event)
+        assert actual == expected
+
+    def test_scrape_event_async_concurrency(self):
+        session = SlowSession(create_fake_session().pages)
+        event_scraper = EventScraper(
+            1124,
+            transport=Transport(session=session),
+            event_cache=EventCache(),
+            fighter_cache=FighterCache(),
+        )
+
+        asyncio.run(event_scraper.scrape_event_async(concurrency=2))
+
+        assert session.max_in_flight <= 2
+
+    def test_module_level_async_entry_points(self):
+        previous = get_transport()
+        set_transport(create_fake_session())
+
+        try:
+            event = asyncio.run(scrape_event_fmid_async(1124))
+            fighter = asyncio.run(
+                scrape_fighter_url_async("http://www.ufc.com/athlete/ali-alqaisi")
+            )
+        finally:
+            set_transport(previous)
+
+        assert event.fmid == 1124
+        assert fighter.name == "Ali Al Qaisi"
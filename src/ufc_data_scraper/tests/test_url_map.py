@@ -0,0 +1,116 @@
+import pytest
+import requests
+
+from ufc_data_scraper.cache import UrlMap
+from ufc_data_scraper.exceptions import FighterNotFound
+from ufc_data_scraper.scraper import FighterScraper
+from ufc_data_scraper.transport import Transport
+
+from ufc_data_scraper.tests.fakes import FakeSession, load_fixture
+
+GUESSED_URL = "https://www.ufc.com/athlete/Ali-AlQaisi"
+CORRECTED_URL = "https://www.ufc.com/athlete/ali-alqaisi"
+
+
+def create_scraper(
+    session: FakeSession, url_map: UrlMap, fighter_url: str = GUESSED_URL
+) -> FighterScraper:
+    return FighterScraper(
+        fighter_url, {}, {}, transport=Transport(session), url_map=url_map
+    )
+
+
+class TestUrlMap:
+    # UrlMap
+    def test_persisted(self, tmp_path):
+        path = tmp_path / "fighter_urls.json"
+
+        UrlMap(path).set(GUESSED_URL, CORRECTED_URL)
+
+        assert UrlMap(path).get(GUESSED_URL) == CORRECTED_URL
+
+    def test_unchanged_mapping_not_written(self, tmp_path):
+        path = tmp_path / "fighter_urls.json"
+        url_map = UrlMap(path)
+        url_map.set(GUESSED_URL, CORRECTED_URL)
+        path.unlink()
+
+        url_map.set(GUESSED_URL, CORRECTED_URL)
+
+        assert not path.exists()
+
+    # scrape_fighter
+    def test_corrected_url_requested_first(self):
+        session = FakeSession()
+        session.add_page(CORRECTED_URL, load_fixture("athlete_ali_alqaisi.html"))
+        url_map = UrlMap()
+
+        fighter = create_scraper(session, url_map).scrape_fighter()
+
+        assert session.requested == [CORRECTED_URL]
+        assert fighter.fighter_url == CORRECTED_URL
+        assert len(url_map) == 0
+
+    @pytest.mark.parametrize("extractor", ("soup", "stream"))
+    def test_miss_falls_back_and_is_remembered(self, extractor):
+        session = FakeSession()
+        session.add_page(CORRECTED_URL, load_fixture("athlete_search_results.html"))
+        session.add_page(GUESSED_URL, load_fixture("athlete_ali_alqaisi.html"))
+        url_map = UrlMap()
+
+        fighter = create_scraper(session, url_map).scrape_fighter(extractor)
+
+        assert session.requested == [CORRECTED_URL, GUESSED_URL]
+        assert fighter.name == "Ali Al Qaisi"
+        assert url_map.get(GUESSED_URL) == GUESSED_URL
+
+    def test_unwritable_map_does_not_lose_fighter(self, tmp_path):
+        session = FakeSession()
+        session.add_page(CORRECTED_URL, load_fixture("athlete_search_results.html"))
+        session.add_page(GUESSED_URL, load_fixture("athlete_ali_alqaisi.html"))
+        # Cache directory under a regular file can never be created
+        (tmp_path / "file").touch()
+        url_map = UrlMap(tmp_path / "file" / "fighter_urls.json")
+
+        fighter = create_scraper(session, url_map).scrape_fighter()
+
+        assert fighter.name == "Ali Al Qaisi"
+        assert url_map.get(GUESSED_URL) == GUESSED_URL
+
+    def test_remembered_url_requested_first(self):
+        session = FakeSession()
+        session.add_page(GUESSED_URL, load_fixture("athlete_ali_alqaisi.html"))
+        url_map = UrlMap()
+        url_map.set(GUESSED_URL, GUESSED_URL)
+
+        create_scraper(session, url_map).scrape_fighter()
+
+        assert session.requested == [GUESSED_URL]
+
+    def test_every_candidate_missing(self):
+        session = FakeSession()
+        session.add_page(CORRECTED_URL, load_fixture("athlete_search_results.html"))
+
+        with pytest.raises(FighterNotFound):
+            create_scraper(session, UrlMap()).scrape_fighter()
+
+        assert session.requested == [CORRECTED_URL, GUESSED_URL]
+
+    # _is_miss
+    def test_is_miss_redirected_to_search(self):
+        url_response = requests.Response()
+        url_response.status_code = 200
+        url_response.url = "https://www.ufc.com/search?query=ali"
+        url_response._content = b""
+
+        assert create_scraper(FakeSession(), UrlMap())._is_miss(url_response, "soup")
+
+    def test_is_miss_athlete_page(self):
+        url_response = requests.Response()
+        url_response.status_code = 200
+        url_response.url = CORRECTED_URL
+        url_response._content = load_fixture("athlete_ali_alqaisi.html")
+
+        assert not create_scraper(FakeSession(), UrlMap())._is_miss(
+            url_response, "soup"
+        )
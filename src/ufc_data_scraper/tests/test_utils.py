@@ -1,8 +1,21 @@
+import subprocess
+import sys
 import pytz
+import requests
 
 from datetime import datetime
 
-from ufc_data_scraper.utils import convert_date, get_incorrect_urls
+from ufc_data_scraper.transport import Transport
+
+from ufc_data_scraper.utils import convert_date, get_incorrect_urls, get_incorrect_names
+from ufc_data_scraper.utils import utils
+
+
+class OfflineSession(requests.Session):
+    """Session that fails every request, for testing only."""
+
+    def get(self, url, **kwargs):
+        raise requests.exceptions.ConnectionError(url)
 
 
 class TestUtils:
@@ -33,3 +46,29 @@ class TestUtils:
 
         assert actual is not None
         assert isinstance(actual, dict)
+
+    def test_get_incorrect_urls_memoized(self):
+        assert get_incorrect_urls() is get_incorrect_urls()
+
+    def test_get_incorrect_names_offline_fallback(self):
+        utils._correction_maps.pop("incorrect_names.json", None)
+
+        offline_transport = Transport(session=OfflineSession())
+        actual = get_incorrect_names(offline_transport)
+
+        assert actual == utils._load_bundled_map("incorrect_names.json")
+
+    def test_import_does_no_network_io(self):
+        probe = (
+            "import sys\n"
+            "calls = []\n"
+            "network = ('socket.connect', 'socket.getaddrinfo', 'socket.sendto')\n"
+            "sys.addaudithook(lambda event, args: event in network and calls.append(event))\n"
+            "import ufc_data_scraper\n"
+            "print(len(calls))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", probe], capture_output=True, check=True, text=True
+        ).stdout
+
+        assert output.strip() == "0"
@@ -0,0 +1,27 @@
+from .transport import (
+    Transport,
+    create_session,
+    create_transport,
+    get_network_time,
+    get_transport,
+    set_transport,
+    MAX_WORKERS,
+    MAX_CONCURRENCY,
+)
+from .response_cache import ResponseCache, DEFAULT_TTLS
+from .url_map import UrlMap
+from .urls import canonical_url, UFC_URL, API_URL
+from .rate_limiter import (
+    RateLimiter,
+    TokenBucket,
+    DEFAULT_RATE_LIMITS,
+    get_rate_limiter,
+    set_rate_limiter,
+)
+from .retry import (
+    RetryPolicy,
+    CircuitBreaker,
+    RETRY_STATUS_CODES,
+    get_circuit_breaker,
+    set_circuit_breaker,
+)
@@ -0,0 +1,80 @@
+import contextlib
+import json
+import os
+import tempfile
+import threading
+
+from pathlib import Path
+
+
+class JsonStore:
+    def __init__(self, path: str | Path = None) -> None:
+        """Data kept in memory and mirrored to a JSON file, loaded on first use.
+
+        Subclasses override _empty, _decode and _encode to store something other than a dict.
+
+        Args:
+            path (str | Path, optional): JSON file the data is stored in. Defaults to in memory only.
+        """
+
+        self.path = path and Path(path).expanduser()
+        self._data = None
+        self._lock = threading.RLock()
+
+    def _empty(self):
+        """Returns data of a store with nothing saved yet."""
+
+        return {}
+
+    def _decode(self, data):
+        """Returns in memory data from the decoded JSON file."""
+
+        return data
+
+    def _encode(self):
+        """Returns in memory data as something json can dump."""
+
+        return self._data
+
+    def _load(self):
+        """Loads the data from disk on first use.
+
+        Returns:
+            In memory data.
+        """
+
+        with self._lock:
+            if self._data is None:
+                self._data = self._empty()
+                if self.path:
+                    try:
+                        self._data = self._decode(
+                            json.loads(self.path.read_text(encoding="utf-8"))
+                        )
+                    except (OSError, ValueError):
+                        pass
+
+            return self._data
+
+    def _save(self) -> None:
+        """Writes the data to disk, replacing the file at once so readers never see half of it.
+
+        A file that cannot be written is skipped, the data is kept in memory for the rest of the process.
+        """
+
+        if not self.path:
+            return
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            file_handle, temp_path = tempfile.mkstemp(dir=self.path.parent)
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(file_handle, "w", encoding="utf-8") as temp_file:
+                json.dump(self._encode(), temp_file, indent=2, sort_keys=True)
+            os.replace(temp_path, self.path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_path)
@@ -0,0 +1,169 @@
+import threading
+import time
+
+from urllib.parse import urlsplit
+
+from ufc_data_scraper.transport.urls import UFC_HOST, API_HOST
+
+# Sustained requests per second and burst size per host, hosts not listed are not limited
+DEFAULT_RATE_LIMITS = {
+    UFC_HOST: (8.0, 16),
+    API_HOST: (20.0, 20),
+}
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int) -> None:
+        """Token bucket refilled at rate tokens per second, holding at most burst tokens.
+
+        Args:
+            rate (float): Sustained requests per second.
+            burst (int): Requests allowed at once after the bucket has been idle.
+        """
+
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Takes a token, going into debt if none is left so waiting callers are served in order.
+
+        Returns:
+            float: Seconds to wait before the token may be used.
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+
+            return -self._tokens / self.rate
+
+
+class RateLimiter:
+    def __init__(
+        self, limits: dict[str, tuple[float, int]] = None, metrics=None
+    ) -> None:
+        """Per host token bucket rate limit shared by every thread requesting through it.
+
+        Args:
+            limits (dict[str, tuple[float, int]], optional): Host with its sustained requests per second and burst size.
+            Defaults to DEFAULT_RATE_LIMITS.
+            metrics (Metrics, optional): Waits are recorded to it as "rate_limit.<host>" timings. Defaults to None.
+
+        >>> rate_limiter = RateLimiter({"www.ufc.com": (4.0, 8), "d29dxerjsp82wz.cloudfront.net": (10.0, 10)})
+        >>> transport = Transport(rate_limiter=rate_limiter)
+        """
+
+        limits = limits if limits is not None else DEFAULT_RATE_LIMITS
+
+        self.metrics = metrics
+        self._buckets = {
+            host.lower(): TokenBucket(rate, burst)
+            for host, (rate, burst) in limits.items()
+        }
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def set_limit(self, host: str, rate: float, burst: int) -> None:
+        """Sets sustained requests per second and burst size of host.
+
+        Args:
+            host (str): Host name, i.e "www.ufc.com".
+            rate (float): Sustained requests per second.
+            burst (int): Requests allowed at once after the host has been idle.
+        """
+
+        with self._lock:
+            self._buckets[host.lower()] = TokenBucket(rate, burst)
+
+    def acquire(self, url: str) -> float:
+        """Blocks until a request to url is within its host's rate.
+
+        Args:
+            url (str): Url about to be requested.
+
+        Returns:
+            float: Seconds waited.
+        """
+
+        host = urlsplit(url).netloc.lower()
+
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            return 0.0
+
+        wait = bucket.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+        with self._lock:
+            stats = self._stats.setdefault(
+                host, {"requests": 0, "waited": 0.0, "max_wait": 0.0}
+            )
+            stats["requests"] += 1
+            stats["waited"] += wait
+            stats["max_wait"] = max(stats["max_wait"], wait)
+
+        if self.metrics is not None:
+            self.metrics.record(f"rate_limit.{host}", wait)
+
+        return wait
+
+    def get_stats(self) -> dict[str, dict]:
+        """Returns requests and seconds waited per host.
+
+        Returns:
+            dict[str, dict]: {host: {"requests", "waited", "max_wait"}}
+        """
+
+        with self._lock:
+            return {host: dict(stats) for host, stats in self._stats.items()}
+
+
+_default_rate_limiter = None
+_default_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Returns the process wide rate limiter used by the shared transport, creating it on first use.
+
+    Returns:
+        RateLimiter: Shared rate limiter.
+    """
+
+    global _default_rate_limiter
+
+    if _default_rate_limiter is None:
+        with _default_rate_limiter_lock:
+            if _default_rate_limiter is None:
+                # utils depends on transport, import it once both are loaded
+                from ufc_data_scraper.utils import get_metrics
+
+                _default_rate_limiter = RateLimiter(metrics=get_metrics())
+
+    return _default_rate_limiter
+
+
+def set_rate_limiter(rate_limiter: RateLimiter) -> None:
+    """Replaces the process wide rate limiter, transports already using the previous one keep it.
+
+    Args:
+        rate_limiter (RateLimiter): Rate limiter for the shared transport.
+    """
+
+    global _default_rate_limiter
+
+    with _default_rate_limiter_lock:
+        _default_rate_limiter = rate_limiter
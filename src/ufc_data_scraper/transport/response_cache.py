@@ -0,0 +1,261 @@
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+import time
+import requests
+
+from pathlib import Path
+from urllib.parse import urlencode, parse_qsl, urlsplit
+
+from requests.structures import CaseInsensitiveDict
+
+# Seconds a stored response is served without revalidation, None disables caching.
+DEFAULT_TTLS = {
+    "event_api": 5 * 60,
+    "athlete": 24 * 60 * 60,
+    "events_listing": 15 * 60,
+    "corrections": 24 * 60 * 60,
+}
+
+STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+def classify_url(url: str) -> str | None:
+    """Returns the cache policy name for a url.
+
+    Args:
+        url (str): Requested url.
+
+    Returns:
+        str: Policy name or None if responses from url are not cached.
+    """
+
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    path = parts.path.rstrip("/")
+
+    if host == "d29dxerjsp82wz.cloudfront.net" and path.startswith(
+        "/api/v3/event/live/"
+    ):
+        return "event_api"
+
+    if host in ("www.ufc.com", "ufc.com"):
+        if path.startswith("/athlete/"):
+            return "athlete"
+        if path == "/events":
+            return "events_listing"
+
+    if host == "raw.githubusercontent.com" and path.endswith(".json"):
+        return "corrections"
+
+    return None
+
+
+def normalize_url(url: str, params: dict = None) -> str:
+    """Builds cache key from url, http and https or reordered queries share a key.
+
+    Args:
+        url (str): Requested url.
+        params (dict, optional): Query parameters sent with the request.
+
+    Returns:
+        str: Normalized url.
+    """
+
+    parts = urlsplit(url)
+
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if params:
+        query += [(str(key), str(value)) for key, value in params.items()]
+
+    path = parts.path.rstrip("/") or "/"
+    normalized = f"{parts.netloc.lower()}{path}"
+    if query:
+        normalized = f"{normalized}?{urlencode(sorted(query))}"
+
+    return normalized
+
+
+class ResponseCache:
+    def __init__(self, directory: str | Path, ttls: dict = None) -> None:
+        """On disk cache of successful GET responses, revalidated with ETag/Last-Modified once stale.
+
+        Args:
+            directory (str | Path): Directory responses are stored in, created if missing. Responses are served
+            uncached while it cannot be written.
+            ttls (dict, optional): Overrides for DEFAULT_TTLS, keyed by policy name.
+
+        >>> transport = Transport(cache=ResponseCache("~/.cache/ufc_data_scraper"))
+        """
+
+        self.directory = Path(directory).expanduser()
+        with contextlib.suppress(OSError):
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttls = DEFAULT_TTLS | (ttls or {})
+
+    def get_ttl(self, url: str) -> int | None:
+        """Returns time to live for responses from url.
+
+        Args:
+            url (str): Requested url.
+
+        Returns:
+            int: Seconds before a stored response must be revalidated, None if it is not cached.
+        """
+
+        policy = classify_url(url)
+        if not policy:
+            return None
+
+        return self.ttls.get(policy)
+
+    def _get_paths(self, key: str) -> tuple[Path, Path]:
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+        return self.directory / f"{name}.json", self.directory / f"{name}.body"
+
+    def _write_file(self, path: Path, content: bytes) -> bool:
+        """Replaces path with content at once, so readers never see half of it.
+
+        Returns:
+            bool: Whether content was written, False if the directory cannot be written.
+        """
+
+        try:
+            file_handle, temp_path = tempfile.mkstemp(dir=self.directory)
+        except OSError:
+            return False
+
+        try:
+            with os.fdopen(file_handle, "wb") as temp_file:
+                temp_file.write(content)
+            os.replace(temp_path, path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_path)
+            return False
+
+        return True
+
+    def load(self, key: str) -> dict | None:
+        """Loads stored response metadata and body.
+
+        Args:
+            key (str): Normalized url.
+
+        Returns:
+            dict: Stored entry or None if nothing is stored.
+        """
+
+        meta_path, body_path = self._get_paths(key)
+
+        try:
+            entry = json.loads(meta_path.read_text(encoding="utf-8"))
+            entry["content"] = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+
+        return entry
+
+    def store(self, key: str, response: requests.Response) -> None:
+        """Stores a successful response, it is left uncached if the directory cannot be written.
+
+        Args:
+            key (str): Normalized url.
+            response (requests.Response): Response to store.
+        """
+
+        meta_path, body_path = self._get_paths(key)
+
+        headers = {
+            header: response.headers[header]
+            for header in STORED_HEADERS
+            if header in response.headers
+        }
+        entry = {
+            "url": response.url,
+            "encoding": response.encoding,
+            "headers": headers,
+            "stored_at": time.time(),
+        }
+
+        # Metadata is written last, a body without it is never loaded
+        if self._write_file(body_path, response.content):
+            self._write_file(meta_path, json.dumps(entry).encode("utf-8"))
+
+    def touch(self, key: str, entry: dict) -> None:
+        """Marks a stored response as fresh again after a 304 response.
+
+        Args:
+            key (str): Normalized url.
+            entry (dict): Stored entry.
+        """
+
+        meta_path, _ = self._get_paths(key)
+
+        entry = {name: value for name, value in entry.items() if name != "content"}
+        entry["stored_at"] = time.time()
+
+        self._write_file(meta_path, json.dumps(entry).encode("utf-8"))
+
+    def is_fresh(self, entry: dict, ttl: int) -> bool:
+        """Checks whether stored entry can be served without revalidation.
+
+        Args:
+            entry (dict): Stored entry.
+            ttl (int): Time to live in seconds.
+
+        Returns:
+            bool: Whether entry is still fresh.
+        """
+
+        return time.time() - entry["stored_at"] < ttl
+
+    def get_validators(self, entry: dict) -> dict:
+        """Returns conditional request headers for a stored entry.
+
+        Args:
+            entry (dict): Stored entry.
+
+        Returns:
+            dict: If-None-Match and If-Modified-Since headers where available.
+        """
+
+        validators = {}
+
+        headers = entry["headers"]
+        if "ETag" in headers:
+            validators["If-None-Match"] = headers["ETag"]
+        if "Last-Modified" in headers:
+            validators["If-Modified-Since"] = headers["Last-Modified"]
+
+        return validators
+
+    def build_response(self, entry: dict) -> requests.Response:
+        """Builds response object from stored entry.
+
+        Args:
+            entry (dict): Stored entry.
+
+        Returns:
+            requests.Response: Response marked with from_cache.
+        """
+
+        response = requests.Response()
+        response.status_code = 200
+        response.url = entry["url"]
+        response.encoding = entry["encoding"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response._content = entry["content"]
+        response.from_cache = True
+
+        return response
+
+    def clear(self) -> None:
+        """Removes every stored response."""
+
+        for path in self.directory.iterdir():
+            if path.suffix in (".json", ".body") and len(path.stem) == 64:
+                path.unlink(missing_ok=True)
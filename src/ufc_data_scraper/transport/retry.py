@@ -0,0 +1,194 @@
+import random
+import threading
+import time
+import requests
+
+from ufc_data_scraper.exceptions import CircuitOpen
+
+# Responses worth another attempt, the host is throttling or briefly unavailable
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Errors worth another attempt, the request may not have reached the host
+RETRY_EXCEPTIONS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        status_codes: tuple[int] = RETRY_STATUS_CODES,
+        exceptions: tuple[type] = RETRY_EXCEPTIONS,
+    ) -> None:
+        """Retries transient failures with jittered exponential backoff.
+
+        The delay before retry n is drawn uniformly between 0 and min(max_delay, base_delay * 2 ** n), so clients
+        failing together do not retry together. A Retry-After header in seconds raises the delay, up to max_delay.
+
+        Args:
+            attempts (int, optional): Requests sent at most, including the first. Defaults to 3.
+            base_delay (float, optional): Backoff of the first retry in seconds. Defaults to 0.5.
+            max_delay (float, optional): Longest delay between attempts in seconds. Defaults to 8.0.
+            status_codes (tuple[int], optional): Response status codes retried. Defaults to RETRY_STATUS_CODES.
+            exceptions (tuple[type], optional): Errors retried. Defaults to RETRY_EXCEPTIONS.
+
+        >>> transport = Transport(retry=RetryPolicy(attempts=5, base_delay=1.0))
+        """
+
+        if attempts < 1:
+            raise ValueError("attempts must be at least 1")
+
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.status_codes = status_codes
+        self.exceptions = exceptions
+
+    def get_delay(self, retry: int, response: requests.Response = None) -> float:
+        """Returns seconds to wait before retry.
+
+        Args:
+            retry (int): Number of the retry, starting at 0.
+            response (requests.Response, optional): Response being retried. Defaults to None.
+
+        Returns:
+            float: Delay in seconds.
+        """
+
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2**retry))
+
+        retry_after = (
+            response.headers.get("Retry-After") if response is not None else None
+        )
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, min(self.max_delay, float(retry_after)))
+
+        return delay
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        """Fails requests to a host fast while it keeps failing.
+
+        After failure_threshold failures in a row the circuit of the host opens and requests raise CircuitOpen
+        without being sent. Once reset_timeout has passed a single trial request is let through, its success closes
+        the circuit and its failure opens it again.
+
+        Args:
+            failure_threshold (int, optional): Failures in a row that open the circuit. Defaults to 5.
+            reset_timeout (float, optional): Seconds the circuit stays open before a trial request. Defaults to 30.0.
+
+        >>> transport = Transport(circuit_breaker=CircuitBreaker(failure_threshold=3, reset_timeout=10.0))
+        """
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = {}
+        self._opened_at = {}
+        self._trials = set()
+        self._lock = threading.Lock()
+
+    def is_open(self, host: str) -> bool:
+        """Returns whether requests to host currently fail fast.
+
+        Args:
+            host (str): Host name.
+
+        Returns:
+            bool: Whether the circuit of host is open.
+        """
+
+        with self._lock:
+            return host in self._opened_at
+
+    def before_request(self, host: str) -> None:
+        """Raises CircuitOpen if a request to host may not be sent.
+
+        Args:
+            host (str): Host name.
+        """
+
+        with self._lock:
+            opened_at = self._opened_at.get(host)
+            if opened_at is None:
+                return
+
+            waiting = time.monotonic() - opened_at < self.reset_timeout
+            if waiting or host in self._trials:
+                raise CircuitOpen(f"{host} is failing, request was not sent.")
+
+            self._trials.add(host)
+
+    def record_success(self, host: str) -> None:
+        """Closes the circuit of host.
+
+        Args:
+            host (str): Host name.
+        """
+
+        with self._lock:
+            self._failures.pop(host, None)
+            self._opened_at.pop(host, None)
+            self._trials.discard(host)
+
+    def record_ignored(self, host: str) -> None:
+        """Lets another trial request through after one whose outcome says nothing about host.
+
+        Args:
+            host (str): Host name.
+        """
+
+        with self._lock:
+            self._trials.discard(host)
+
+    def record_failure(self, host: str) -> None:
+        """Counts a failed request to host, opening its circuit at failure_threshold.
+
+        Args:
+            host (str): Host name.
+        """
+
+        with self._lock:
+            self._failures[host] = self._failures.get(host, 0) + 1
+            self._trials.discard(host)
+
+            if (
+                host in self._opened_at
+                or self._failures[host] >= self.failure_threshold
+            ):
+                self._opened_at[host] = time.monotonic()
+
+
+_default_circuit_breaker = None
+_default_circuit_breaker_lock = threading.Lock()
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """Returns the process wide circuit breaker used by the shared transport, creating it on first use.
+
+    Returns:
+        CircuitBreaker: Shared circuit breaker.
+    """
+
+    global _default_circuit_breaker
+
+    if _default_circuit_breaker is None:
+        with _default_circuit_breaker_lock:
+            if _default_circuit_breaker is None:
+                _default_circuit_breaker = CircuitBreaker()
+
+    return _default_circuit_breaker
+
+
+def set_circuit_breaker(circuit_breaker: CircuitBreaker) -> None:
+    """Replaces the process wide circuit breaker, transports already using the previous one keep it.
+
+    Args:
+        circuit_breaker (CircuitBreaker): Circuit breaker for the shared transport.
+    """
+
+    global _default_circuit_breaker
+
+    with _default_circuit_breaker_lock:
+        _default_circuit_breaker = circuit_breaker
@@ -0,0 +1,385 @@
+import asyncio
+import threading
+import time
+import requests
+
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlsplit
+
+from ufc_data_scraper.transport.response_cache import ResponseCache, normalize_url
+from ufc_data_scraper.transport.rate_limiter import RateLimiter, get_rate_limiter
+from ufc_data_scraper.transport.retry import (
+    CircuitBreaker,
+    RetryPolicy,
+    RETRY_EXCEPTIONS,
+    RETRY_STATUS_CODES,
+    get_circuit_breaker,
+)
+from ufc_data_scraper.transport.url_map import UrlMap
+from ufc_data_scraper.transport.urls import canonical_url
+
+# Default size of worker pools and starting fighter scraping concurrency.
+MAX_WORKERS = 8
+
+# Ceiling of adaptive fighter scraping concurrency, pools keep this many connections warm per host.
+MAX_CONCURRENCY = 16
+
+UFC_PREFIXES = ("http://www.ufc.com/", "https://www.ufc.com/")
+API_PREFIXES = (
+    "http://d29dxerjsp82wz.cloudfront.net/",
+    "https://d29dxerjsp82wz.cloudfront.net/",
+)
+
+# Redirects that are safe to skip on later requests
+PERMANENT_REDIRECTS = (301, 308)
+
+# Seconds each thread has spent waiting on the network
+_network_time = threading.local()
+
+
+def get_network_time() -> float:
+    """Returns seconds the calling thread has spent in requests, rate limit and retry waits excluded.
+
+    Only differences between two readings are meaningful.
+
+    Returns:
+        float: Seconds spent in requests since the thread started.
+    """
+
+    return getattr(_network_time, "seconds", 0.0)
+
+
+def create_session(pool_maxsize: int = MAX_CONCURRENCY) -> requests.Session:
+    """Creates a keep-alive session with separate connection pools for ufc.com and the event API.
+
+    Args:
+        pool_maxsize (int, optional): Connections kept alive per host. Defaults to MAX_CONCURRENCY.
+
+    Returns:
+        requests.Session: Configured session.
+    """
+
+    session = requests.Session()
+
+    ufc_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+    for prefix in UFC_PREFIXES:
+        session.mount(prefix, ufc_adapter)
+
+    api_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+    for prefix in API_PREFIXES:
+        session.mount(prefix, api_adapter)
+
+    return session
+
+
+class Transport:
+    def __init__(
+        self,
+        session: requests.Session = None,
+        pool_maxsize: int = MAX_CONCURRENCY,
+        cache: ResponseCache = None,
+        redirects: UrlMap = None,
+        rate_limiter: RateLimiter = None,
+        retry: RetryPolicy = None,
+        circuit_breaker: CircuitBreaker = None,
+    ) -> None:
+        """Shared HTTP layer used by every scraper, reuses pooled connections between requests.
+
+        Urls are requested at their canonical scheme and host, permanent redirects are remembered in redirects
+        and skipped on later requests.
+
+        Args:
+            session (requests.Session, optional): Preconfigured session to use. Defaults to a pooled session.
+            pool_maxsize (int, optional): Connections kept alive per host, ignored if session is supplied.
+            cache (ResponseCache, optional): On disk response cache, responses are not cached if omitted.
+            redirects (UrlMap, optional): Redirected urls and where they lead. Defaults to in memory only.
+            rate_limiter (RateLimiter, optional): Per host rate limit of requests sent over the network, cache hits
+            are not limited. Requests are not limited if omitted, the shared transport uses get_rate_limiter().
+            retry (RetryPolicy, optional): Retries of transient failures. Requests are sent once if omitted.
+            circuit_breaker (CircuitBreaker, optional): Fails requests to failing hosts fast with CircuitOpen. Hosts
+            are never skipped if omitted, the shared transport uses get_circuit_breaker().
+
+        >>> transport = Transport()
+        >>> response = transport.get("https://www.ufc.com/athlete/jan-blachowicz")
+        """
+
+        self.session = session or create_session(pool_maxsize)
+        self.cache = cache
+        self.redirects = redirects if redirects is not None else UrlMap()
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+
+    def resolve_url(self, url: str) -> str:
+        """Returns url a request for url is sent to, canonical and past any redirect seen before.
+
+        Args:
+            url (str): Requested url.
+
+        Returns:
+            str: Url to send the request to.
+        """
+
+        url = canonical_url(url)
+
+        return self.redirects.get(url) or url
+
+    def _learn_redirects(self, response: requests.Response) -> None:
+        """Remembers where permanently redirected urls lead.
+
+        Args:
+            response (requests.Response): Final response of a request.
+        """
+
+        if not response.history or response.status_code >= 400:
+            return
+
+        redirects = {
+            canonical_url(hop.url): response.url
+            for hop in response.history
+            if hop.status_code in PERMANENT_REDIRECTS
+        }
+        redirects.pop(response.url, None)
+
+        self.redirects.update(redirects)
+
+    def _record_outcome(self, host: str, failed: bool | None) -> None:
+        """Reports outcome of a request to host to the circuit breaker.
+
+        Args:
+            host (str): Requested host.
+            failed (bool | None): Whether the request failed, None if the outcome says nothing about host.
+        """
+
+        if self.circuit_breaker is None:
+            return
+
+        if failed is None:
+            self.circuit_breaker.record_ignored(host)
+        elif failed:
+            self.circuit_breaker.record_failure(host)
+        else:
+            self.circuit_breaker.record_success(host)
+
+    def _send(self, url: str, **kwargs) -> requests.Response:
+        """Sends a GET request over the network, retrying transient failures.
+
+        Args:
+            url (str): Url to request.
+            **kwargs: Extra arguments passed to requests.Session.get.
+
+        Returns:
+            requests.Response: Url response, the last one if every attempt failed.
+        """
+
+        host = urlsplit(url).netloc.lower()
+
+        # Transient failures are retried and count towards opening the circuit
+        if self.retry is not None:
+            attempts = self.retry.attempts
+            failure_exceptions = self.retry.exceptions
+            failure_status_codes = self.retry.status_codes
+        else:
+            attempts = 1
+            failure_exceptions = RETRY_EXCEPTIONS
+            failure_status_codes = RETRY_STATUS_CODES
+
+        for attempt in range(attempts):
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.before_request(host)
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(url)
+
+            can_retry = attempt + 1 < attempts
+
+            try:
+                response = self._timed_get(url, **kwargs)
+            except Exception as error:
+                transient = isinstance(error, failure_exceptions)
+                # Invalid urls and other caller errors say nothing about the host
+                self._record_outcome(host, True if transient else None)
+                if not can_retry or not transient:
+                    raise
+
+                time.sleep(self.retry.get_delay(attempt))
+                continue
+
+            failed = response.status_code in failure_status_codes
+            self._record_outcome(host, failed)
+
+            if can_retry and failed:
+                delay = self.retry.get_delay(attempt, response)
+                response.close()
+                time.sleep(delay)
+                continue
+
+            break
+
+        # Queries are not part of redirect map keys
+        if not kwargs.get("params"):
+            self._learn_redirects(response)
+
+        return response
+
+    def _timed_get(self, url: str, **kwargs) -> requests.Response:
+        """Sends a single GET request, adding its duration to the calling thread's network time.
+
+        Args:
+            url (str): Url to request.
+            **kwargs: Extra arguments passed to requests.Session.get.
+
+        Returns:
+            requests.Response: Url response.
+        """
+
+        start = time.perf_counter()
+
+        try:
+            return self.session.get(url, **kwargs)
+        finally:
+            _network_time.seconds = get_network_time() + time.perf_counter() - start
+
+    def _get_cached(self, url: str, ttl: int, **kwargs) -> requests.Response:
+        """Serves url from the response cache, revalidating or fetching it when stale.
+
+        Args:
+            url (str): Url to request.
+            ttl (int): Seconds a stored response is served without revalidation.
+            **kwargs: Extra arguments passed to requests.Session.get.
+
+        Returns:
+            requests.Response: Url response.
+        """
+
+        key = normalize_url(url, kwargs.get("params"))
+
+        entry = self.cache.load(key)
+        if entry and self.cache.is_fresh(entry, ttl):
+            return self.cache.build_response(entry)
+
+        if entry:
+            validators = self.cache.get_validators(entry)
+            kwargs["headers"] = (kwargs.get("headers") or {}) | validators
+
+        response = self._send(url, **kwargs)
+
+        if response.status_code == 304 and entry:
+            self.cache.touch(key, entry)
+            return self.cache.build_response(entry)
+
+        if response.status_code == 200:
+            self.cache.store(key, response)
+
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Sends a GET request through the pooled session, or the response cache if one is configured.
+
+        Args:
+            url (str): Url to request.
+            **kwargs: Extra arguments passed to requests.Session.get.
+
+        Returns:
+            requests.Response: Url response.
+        """
+
+        url = self.resolve_url(url)
+
+        if self.cache is not None and not kwargs.get("stream"):
+            ttl = self.cache.get_ttl(url)
+            if ttl is not None:
+                return self._get_cached(url, ttl, **kwargs)
+
+        return self._send(url, **kwargs)
+
+    async def get_async(self, url: str, **kwargs) -> requests.Response:
+        """Sends a GET request through the pooled session without blocking the event loop.
+
+        Args:
+            url (str): Url to request.
+            **kwargs: Extra arguments passed to requests.Session.get.
+
+        Returns:
+            requests.Response: Url response.
+        """
+
+        return await asyncio.to_thread(self.get, url, **kwargs)
+
+    def close(self) -> None:
+        """Closes all pooled connections."""
+
+        self.session.close()
+
+    def __enter__(self) -> "Transport":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def create_transport(
+    session: requests.Session = None,
+    redirects: UrlMap = None,
+    cache: ResponseCache = None,
+) -> Transport:
+    """Creates a transport sharing the process wide rate limiter and circuit breaker, retrying transient failures.
+
+    Args:
+        session (requests.Session, optional): Preconfigured session to use. Defaults to a pooled session.
+        redirects (UrlMap, optional): Redirected urls and where they lead. Defaults to in memory only.
+        cache (ResponseCache, optional): On disk response cache. Responses are not cached if omitted.
+
+    Returns:
+        Transport: Configured transport.
+
+    >>> set_transport(create_transport(cache=ResponseCache("~/.cache/ufc_data_scraper")))
+    """
+
+    return Transport(
+        session=session,
+        redirects=redirects,
+        cache=cache,
+        rate_limiter=get_rate_limiter(),
+        retry=RetryPolicy(),
+        circuit_breaker=get_circuit_breaker(),
+    )
+
+
+_default_transport = None
+_default_transport_lock = threading.Lock()
+
+
+def get_transport() -> Transport:
+    """Returns the process wide transport, creating it on first use.
+
+    Returns:
+        Transport: Shared transport.
+    """
+
+    global _default_transport
+
+    if _default_transport is None:
+        with _default_transport_lock:
+            if _default_transport is None:
+                # cache depends on transport, import it once both are loaded
+                from ufc_data_scraper.cache import get_redirect_map
+
+                _default_transport = create_transport(redirects=get_redirect_map())
+
+    return _default_transport
+
+
+def set_transport(transport: Transport | requests.Session) -> None:
+    """Replaces the process wide transport, a plain session will be wrapped with create_transport.
+
+    Args:
+        transport (Transport | requests.Session): Transport or configured session to use for all requests.
+    """
+
+    global _default_transport
+
+    if isinstance(transport, requests.Session):
+        transport = create_transport(transport)
+
+    with _default_transport_lock:
+        _default_transport = transport
@@ -0,0 +1,66 @@
+from pathlib import Path
+
+from ufc_data_scraper.transport.json_store import JsonStore
+
+
+class UrlMap(JsonStore):
+    def __init__(self, path: str | Path = None) -> None:
+        """Persistent map of urls and the url they resolve to.
+
+        Args:
+            path (str | Path, optional): JSON file the map is stored in. Defaults to in memory only.
+
+        >>> fighter_url_map = UrlMap("~/.cache/ufc_data_scraper/fighter_urls.json")
+        >>> fighter = FighterScraper(fighter_url, url_map=fighter_url_map).scrape_fighter()
+        """
+
+        super().__init__(path)
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __contains__(self, url: str) -> bool:
+        return url.strip() in self._load()
+
+    def get(self, url: str) -> str | None:
+        """Returns the url url resolves to.
+
+        Args:
+            url (str): Requested url.
+
+        Returns:
+            str: Resolved url or None if url is not mapped.
+        """
+
+        return self._load().get(url.strip())
+
+    def set(self, url: str, resolved_url: str) -> None:
+        """Maps url to resolved_url and writes the map to disk.
+
+        Args:
+            url (str): Requested url.
+            resolved_url (str): Url it resolves to.
+        """
+
+        self.update({url: resolved_url})
+
+    def update(self, urls: dict[str, str]) -> None:
+        """Maps several urls with a single write, unchanged mappings are not written.
+
+        Args:
+            urls (dict[str, str]): Requested urls with the url they resolve to.
+        """
+
+        with self._lock:
+            mapped = self._load()
+
+            changed = {
+                url.strip(): resolved_url
+                for url, resolved_url in urls.items()
+                if mapped.get(url.strip()) != resolved_url
+            }
+            if not changed:
+                return
+
+            mapped.update(changed)
+            self._save()
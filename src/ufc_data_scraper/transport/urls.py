@@ -0,0 +1,37 @@
+from urllib.parse import urlsplit, urlunsplit
+
+UFC_HOST = "www.ufc.com"
+API_HOST = "d29dxerjsp82wz.cloudfront.net"
+
+UFC_URL = f"https://{UFC_HOST}"
+API_URL = f"https://{API_HOST}"
+
+# Scheme and host every known host is finally served from, anything else is left alone
+CANONICAL_HOSTS = {
+    "ufc.com": ("https", UFC_HOST),
+    UFC_HOST: ("https", UFC_HOST),
+    API_HOST: ("https", API_HOST),
+}
+
+
+def canonical_url(url: str) -> str:
+    """Returns url at the scheme and host it is served from, so requests skip the http to https redirect.
+
+    Args:
+        url (str): Url to normalize.
+
+    Returns:
+        str: Canonical url.
+        >>> "https://www.ufc.com/athlete/jan-blachowicz"
+    """
+
+    url = url.strip()
+    parts = urlsplit(url)
+
+    canonical = CANONICAL_HOSTS.get(parts.netloc.lower())
+    if not canonical:
+        return url
+
+    scheme, host = canonical
+
+    return urlunsplit((scheme, host, parts.path, parts.query, parts.fragment))
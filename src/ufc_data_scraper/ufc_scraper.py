@@ -1,8 +1,25 @@
-from ufc_data_scraper.scraper import get_event_fmid, FighterScraper, EventScraper
+from ufc_data_scraper.client import get_client
+
+from ufc_data_scraper.transport import MAX_WORKERS
 
 from ufc_data_scraper.data_models import Fighter, Event
 
 
+def get_event_fmid(event_url: str) -> int:
+    """Returns FMID of event page.
+
+    Args:
+        event_url (str): UFC Event page.
+
+    >>> event_fmid = get_event_fmid("https://www.ufc.com/event/ufc-282")
+
+    Returns:
+        int: Returns event FMID.
+    """
+
+    return get_client().get_event_fmid(event_url)
+
+
 def scrape_fighter_url(fighter_url: str) -> Fighter:
     """Scrapes fighter page.
 
@@ -15,9 +32,7 @@ def scrape_fighter_url(fighter_url: str) -> Fighter:
         Fighter: Returns Fighter object.
     """
 
-    fighter_scraper = FighterScraper(fighter_url)
-
-    return fighter_scraper.scrape_fighter()
+    return get_client().scrape_fighter(fighter_url)
 
 
 def scrape_event_url(event_url: str) -> Event:
@@ -32,11 +47,7 @@ def scrape_event_url(event_url: str) -> Event:
         Event: Returns Event object.
     """
 
-    event_fmid = get_event_fmid(event_url)
-
-    event_scraper = EventScraper(event_fmid, event_url)
-
-    return event_scraper.scrape_event()
+    return get_client().scrape_event_url(event_url)
 
 
 def scrape_event_fmid(event_fmid: int) -> Event:
@@ -51,6 +62,86 @@ def scrape_event_fmid(event_fmid: int) -> Event:
         Event: Returns Event object.
     """
 
-    event_scraper = EventScraper(event_fmid)
+    return get_client().scrape_event_fmid(event_fmid)
+
+
+def scrape_events(event_fmids: list[int], max_workers: int = None) -> list[Event]:
+    """Scrapes several event fmids at once, fighters booked on more than one event are scraped once.
+
+    Args:
+        event_fmids (list[int]): UFC Event FMIDs.
+        max_workers (int, optional): Size of a dedicated worker pool for this batch. Defaults to the shared client's pool.
+
+    >>> events = scrape_events([1124, 1125, 1126])
+
+    Returns:
+        list[Event]: Returns Event objects in the same order as event_fmids.
+    """
+
+    return get_client().scrape_events(event_fmids, max_workers)
+
+
+async def get_event_fmid_async(event_url: str) -> int:
+    """Returns FMID of event page as a coroutine.
+
+    Args:
+        event_url (str): UFC Event page.
+
+    >>> event_fmid = await get_event_fmid_async("https://www.ufc.com/event/ufc-282")
+
+    Returns:
+        int: Returns event FMID.
+    """
+
+    return await get_client().get_event_fmid_async(event_url)
+
+
+async def scrape_fighter_url_async(fighter_url: str) -> Fighter:
+    """Scrapes fighter page as a coroutine.
+
+    Args:
+        fighter_url (str): UFC Fighter page.
+
+    >>> fighter = await scrape_fighter_url_async("https://www.ufc.com/athlete/jan-blachowicz")
+
+    Returns:
+        Fighter: Returns Fighter object.
+    """
+
+    return await get_client().scrape_fighter_async(fighter_url)
+
+
+async def scrape_event_url_async(
+    event_url: str, concurrency: int = MAX_WORKERS
+) -> Event:
+    """Scrapes event page as a coroutine.
+
+    Args:
+        event_url (str): UFC Event page.
+        concurrency (int, optional): Maximum number of fighters scraped at once. Defaults to MAX_WORKERS.
+
+    >>> event = await scrape_event_url_async("https://www.ufc.com/event/ufc-282")
+
+    Returns:
+        Event: Returns Event object.
+    """
+
+    return await get_client().scrape_event_url_async(event_url, concurrency)
+
+
+async def scrape_event_fmid_async(
+    event_fmid: int, concurrency: int = MAX_WORKERS
+) -> Event:
+    """Scrapes event fmid as a coroutine.
+
+    Args:
+        event_fmid (int): UFC Event FMID.
+        concurrency (int, optional): Maximum number of fighters scraped at once. Defaults to MAX_WORKERS.
+
+    >>> event = await scrape_event_fmid_async(1124)
+
+    Returns:
+        Event: Returns Event object.
+    """
 
-    return event_scraper.scrape_event()
+    return await get_client().scrape_event_fmid_async(event_fmid, concurrency)
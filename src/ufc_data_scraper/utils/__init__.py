@@ -1 +1,27 @@
-from .utils import convert_date, get_incorrect_urls
+from .utils import (
+    convert_date,
+    get_cache_dir,
+    get_incorrect_urls,
+    get_incorrect_names,
+)
+from .parser import (
+    PARSER_BACKENDS,
+    available_parser_backends,
+    create_soup,
+    get_parser_backend,
+    set_parser_backend,
+)
+from .corrections import (
+    CorrectionIndex,
+    compile_correction_index,
+    correct_fighter_name,
+    correct_fighter_url,
+    fighter_url_slug,
+)
+from .metrics import Metrics, get_metrics, set_metrics
+from .concurrency import (
+    ConcurrencyLimiter,
+    get_fighter_limiter,
+    is_overloaded,
+    set_fighter_limiter,
+)
@@ -0,0 +1,196 @@
+import contextlib
+import threading
+import requests
+
+from ufc_data_scraper.exceptions import CircuitOpen
+
+from ufc_data_scraper.transport import MAX_WORKERS, MAX_CONCURRENCY, get_network_time
+
+from ufc_data_scraper.utils.metrics import Metrics, get_metrics
+
+# Seconds a fighter scrape may spend on the network before it counts as a sign of an overloaded host
+LATENCY_TARGET = 2.0
+
+
+def is_overloaded(error: BaseException) -> bool:
+    """Returns whether error means the host is overloaded: a timeout, a dropped connection, an open circuit, a 429 or a 5xx.
+
+    Args:
+        error (BaseException): Error raised while scraping.
+
+    Returns:
+        bool: Whether concurrency should back off.
+    """
+
+    if isinstance(
+        error,
+        (
+            requests.exceptions.Timeout,
+            requests.exceptions.ConnectionError,
+            CircuitOpen,
+        ),
+    ):
+        return True
+
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        status_code = error.response.status_code
+        return status_code == 429 or status_code >= 500
+
+    return False
+
+
+class ConcurrencyLimiter:
+    def __init__(
+        self,
+        initial: int = MAX_WORKERS,
+        minimum: int = 1,
+        maximum: int = MAX_CONCURRENCY,
+        latency_target: float = LATENCY_TARGET,
+        backoff: float = 0.5,
+        name: str = "fighters",
+        metrics: Metrics = None,
+    ) -> None:
+        """Adaptive limit of in flight requests, additive increase and multiplicative decrease.
+
+        Every fast, successful request raises the limit by about one per limit's worth of requests. A request that
+        is slower than latency_target, times out or is answered with a 429 or 5xx multiplies it by backoff.
+        Requests started before the last back off do not back off again, so a burst of failures halves the limit once.
+
+        Args:
+            initial (int, optional): Starting limit. Defaults to MAX_WORKERS.
+            minimum (int, optional): Lowest limit. Defaults to 1.
+            maximum (int, optional): Ceiling of the limit. Defaults to MAX_CONCURRENCY.
+            latency_target (float, optional): Seconds a request may take before it counts as overload. Defaults to LATENCY_TARGET.
+            backoff (float, optional): Factor the limit is multiplied by on overload. Defaults to 0.5.
+            name (str, optional): Metrics prefix, the limit is published as "<name>.concurrency_limit". Defaults to "fighters".
+            metrics (Metrics, optional): Metrics the limit is published to. Defaults to the shared metrics.
+
+        >>> limiter = ConcurrencyLimiter(maximum=32)
+        >>> with limiter.slot():
+        ...     fighter = fighter_scraper.scrape_fighter()
+        """
+
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError("Limits must satisfy 1 <= minimum <= initial <= maximum")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency_target = latency_target
+        self.backoff = backoff
+        self.name = name
+        self._metrics = metrics or get_metrics()
+        self._limit = float(initial)
+        self._in_flight = 0
+        # Incremented on every back off, requests remember the epoch they started in
+        self._epoch = 0
+        self._condition = threading.Condition()
+
+        self._publish()
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests in flight."""
+
+        return self._in_flight
+
+    def _publish(self) -> None:
+        self._metrics.set_gauge(f"{self.name}.concurrency_limit", self.limit)
+
+    def acquire(self) -> int:
+        """Blocks until a request may start and counts it as in flight.
+
+        Returns:
+            int: Epoch the request started in, pass it to release.
+        """
+
+        with self._condition:
+            while self._in_flight >= self.limit:
+                self._condition.wait()
+
+            self._in_flight += 1
+
+            return self._epoch
+
+    def release(self, epoch: int, latency: float, overloaded: bool = False) -> None:
+        """Counts a request as finished and adjusts the limit to its outcome.
+
+        Args:
+            epoch (int): Epoch returned by acquire.
+            latency (float): Seconds the request took.
+            overloaded (bool, optional): Whether the request failed because the host is overloaded. Defaults to False.
+        """
+
+        with self._condition:
+            self._in_flight -= 1
+
+            if overloaded or latency > self.latency_target:
+                if epoch == self._epoch:
+                    self._limit = max(self.minimum, self._limit * self.backoff)
+                    self._epoch += 1
+            else:
+                self._limit = min(self.maximum, self._limit + 1 / self._limit)
+
+            self._publish()
+            self._condition.notify_all()
+
+    @contextlib.contextmanager
+    def slot(self):
+        """Holds a slot for the with block, its errors and the time its requests spent on the network adjust the limit.
+
+        Rate limit and retry backoff waits are not host latency and are left out, so are requests made by
+        other threads.
+        """
+
+        epoch = self.acquire()
+        start = get_network_time()
+        overloaded = False
+
+        try:
+            yield
+        except Exception as error:
+            overloaded = is_overloaded(error)
+            raise
+        finally:
+            self.release(epoch, get_network_time() - start, overloaded)
+
+
+_default_fighter_limiter = None
+_default_fighter_limiter_lock = threading.Lock()
+
+
+def get_fighter_limiter() -> ConcurrencyLimiter:
+    """Returns the process wide fighter scraping limiter, creating it on first use.
+
+    Returns:
+        ConcurrencyLimiter: Shared limiter.
+    """
+
+    global _default_fighter_limiter
+
+    if _default_fighter_limiter is None:
+        with _default_fighter_limiter_lock:
+            if _default_fighter_limiter is None:
+                _default_fighter_limiter = ConcurrencyLimiter()
+
+    return _default_fighter_limiter
+
+
+def set_fighter_limiter(limiter: ConcurrencyLimiter) -> None:
+    """Replaces the process wide fighter scraping limiter.
+
+    Args:
+        limiter (ConcurrencyLimiter): Limiter shared by every EventScraper.
+    """
+
+    global _default_fighter_limiter
+
+    with _default_fighter_limiter_lock:
+        _default_fighter_limiter = limiter
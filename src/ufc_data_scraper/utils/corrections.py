@@ -0,0 +1,301 @@
+import functools
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+
+from unidecode import unidecode
+
+from ufc_data_scraper.transport import canonical_url, UFC_URL
+
+from ufc_data_scraper.utils.utils import get_cache_dir
+
+# Characters ufc.com leaves out of athlete urls
+BANNED_URL_CHARS = ("--", "'", ".")
+
+# Bumped whenever the compiled format changes, stale pickles are rebuilt
+INDEX_FORMAT = 1
+
+# Compiled indexes kept per correction map object
+MAX_COMPILED_MAPS = 16
+
+_compiled = {}
+_compiled_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=8192)
+def fighter_url_slug(fighter_url: str) -> str:
+    """Returns the athlete slug of a fighter url, the key corrections are looked up by.
+
+    Args:
+        fighter_url (str): UFC fighter page url.
+
+    Returns:
+        str: Lower case, ascii slug without banned characters.
+        >>> "jan-blachowicz"
+    """
+
+    url_name = fighter_url.split("/")[-1].lower()
+    for banned_char in BANNED_URL_CHARS:
+        url_name = url_name.replace(banned_char, "")
+
+    return unidecode(url_name)
+
+
+@functools.lru_cache(maxsize=8192)
+def fighter_name_key(name: str) -> str:
+    """Returns the key fighter name corrections are looked up by.
+
+    Args:
+        name (str): Fighter name.
+
+    Returns:
+        str: Name without surrounding whitespace.
+    """
+
+    return name.strip()
+
+
+# Key normalization and target normalization of every kind of correction map
+CORRECTION_KINDS = {
+    "urls": (fighter_url_slug, canonical_url),
+    "names": (fighter_name_key, str.strip),
+}
+
+
+def get_map_version(corrections: dict) -> str:
+    """Returns version of a correction map, changes whenever any correction does.
+
+    Args:
+        corrections (dict): Correction map.
+
+    Returns:
+        str: Content hash.
+    """
+
+    content = json.dumps(corrections, sort_keys=True, ensure_ascii=False)
+
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class CorrectionIndex:
+    def __init__(self, kind: str, version: str, entries: dict[str, str]) -> None:
+        """Compiled correction map, keys are normalized and correction chains point at their final target.
+
+        Use CorrectionIndex.compile or compile_correction_index to build one.
+
+        Args:
+            kind (str): One of CORRECTION_KINDS.
+            version (str): Version of the correction map it was compiled from.
+            entries (dict[str, str]): Normalized keys with their final target.
+
+        >>> index = compile_correction_index(get_incorrect_urls(), "urls")
+        >>> index.get("http://www.ufc.com/athlete/Cristian-Quiñonez")
+        "https://www.ufc.com/athlete/trevin-dzhayls-6"
+        """
+
+        self.kind = kind
+        self.version = version
+        self._entries = entries
+        self._normalize_key = CORRECTION_KINDS[kind][0]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return self._normalize_key(key) in self._entries
+
+    def get(self, key: str) -> str | None:
+        """Returns final correction for key.
+
+        Args:
+            key (str): Url or name to correct.
+
+        Returns:
+            str: Corrected url or name, None if key is not corrected.
+        """
+
+        return self._entries.get(self._normalize_key(key))
+
+    @classmethod
+    def compile(
+        cls, corrections: dict, kind: str, version: str = None
+    ) -> "CorrectionIndex":
+        """Compiles a correction map.
+
+        Args:
+            corrections (dict): Correction map.
+            kind (str): One of CORRECTION_KINDS.
+            version (str, optional): Version of corrections. Defaults to its content hash.
+
+        Returns:
+            CorrectionIndex: Compiled index.
+        """
+
+        if kind not in CORRECTION_KINDS:
+            raise ValueError(
+                f"Unknown correction kind {kind}, use one of {tuple(CORRECTION_KINDS)}"
+            )
+
+        normalize_key, normalize_target = CORRECTION_KINDS[kind]
+        targets = {
+            normalize_key(key): normalize_target(target)
+            for key, target in corrections.items()
+        }
+
+        entries = {}
+        for key, target in targets.items():
+            # Follow the chain, a correction that loops back stops where it started looping
+            seen = {key}
+            while (
+                normalize_key(target) in targets and normalize_key(target) not in seen
+            ):
+                seen.add(normalize_key(target))
+                target = targets[normalize_key(target)]
+
+            entries[key] = target
+
+        return cls(kind, version or get_map_version(corrections), entries)
+
+    def dump(self, path: str | os.PathLike) -> None:
+        """Writes the compiled index to path.
+
+        Args:
+            path (str | os.PathLike): Pickle file.
+        """
+
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+
+        content = {
+            "format": INDEX_FORMAT,
+            "kind": self.kind,
+            "version": self.version,
+            "entries": self._entries,
+        }
+
+        file_handle, temp_path = tempfile.mkstemp(dir=directory)
+        with os.fdopen(file_handle, "wb") as temp_file:
+            pickle.dump(content, temp_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(
+        cls, path: str | os.PathLike, kind: str, version: str
+    ) -> "CorrectionIndex | None":
+        """Loads a compiled index written by dump.
+
+        Args:
+            path (str | os.PathLike): Pickle file.
+            kind (str): One of CORRECTION_KINDS.
+            version (str): Expected correction map version.
+
+        Returns:
+            CorrectionIndex: Compiled index or None if it is missing or stale.
+        """
+
+        try:
+            with open(path, "rb") as index_file:
+                content = pickle.load(index_file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            return None
+
+        if not isinstance(content, dict):
+            return None
+
+        current = (INDEX_FORMAT, kind, version)
+        if (
+            content.get("format"),
+            content.get("kind"),
+            content.get("version"),
+        ) != current:
+            return None
+
+        return cls(kind, version, content["entries"])
+
+
+# Shared by every lookup without corrections, so they neither hash nor touch the disk
+EMPTY_INDEXES = {
+    kind: CorrectionIndex(kind, get_map_version({}), {}) for kind in CORRECTION_KINDS
+}
+
+
+def compile_correction_index(corrections: dict | None, kind: str) -> CorrectionIndex:
+    """Returns compiled index of a correction map, compiled once per map object.
+
+    Maps are treated as immutable: the index is remembered per dict, so corrections added to a dict in place
+    after it was compiled are not seen. Pass a new dict instead. Compiled indexes are stored in the cache
+    directory, a map version seen before loads without compiling.
+
+    Args:
+        corrections (dict | None): Correction map, None is treated as empty.
+        kind (str): One of CORRECTION_KINDS.
+
+    Returns:
+        CorrectionIndex: Compiled index.
+    """
+
+    if isinstance(corrections, CorrectionIndex):
+        return corrections
+
+    if not corrections:
+        return EMPTY_INDEXES[kind]
+
+    memo_key = (kind, id(corrections))
+
+    with _compiled_lock:
+        compiled = _compiled.get(memo_key)
+        # The map is kept alongside its index so its id cannot be reused
+        if compiled and compiled[0] is corrections:
+            return compiled[1]
+
+        version = get_map_version(corrections)
+        path = get_cache_dir() / f"corrections_{kind}.pickle"
+
+        index = CorrectionIndex.load(path, kind, version)
+        if index is None:
+            index = CorrectionIndex.compile(corrections, kind, version)
+            try:
+                index.dump(path)
+            except OSError:
+                pass
+
+        if len(_compiled) >= MAX_COMPILED_MAPS:
+            _compiled.clear()
+        _compiled[memo_key] = (corrections, index)
+
+        return index
+
+
+def correct_fighter_url(
+    fighter_url: str, incorrect_urls: dict | CorrectionIndex
+) -> str:
+    """Returns canonical url of a fighter url, applying url corrections.
+
+    Args:
+        fighter_url (str): UFC fighter page url.
+        incorrect_urls (dict | CorrectionIndex): Incorrect urls with their corrected counterpart.
+
+    Returns:
+        str: Corrected fighter url.
+    """
+
+    correction = compile_correction_index(incorrect_urls, "urls").get(fighter_url)
+
+    return correction or f"{UFC_URL}/athlete/{fighter_url_slug(fighter_url)}"
+
+
+def correct_fighter_name(name: str, incorrect_names: dict | CorrectionIndex) -> str:
+    """Returns fighter name, applying name corrections.
+
+    Args:
+        name (str): Fighter name.
+        incorrect_names (dict | CorrectionIndex): Incorrect names with their corrected counterpart.
+
+    Returns:
+        str: Corrected name.
+    """
+
+    return compile_correction_index(incorrect_names, "names").get(name) or name
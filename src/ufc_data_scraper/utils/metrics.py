@@ -0,0 +1,132 @@
+import contextlib
+import threading
+import time
+
+
+class Metrics:
+    def __init__(self) -> None:
+        """Thread safe store of stage timings and gauges.
+
+        Timings are aggregated per name, gauges keep the last value set.
+
+        >>> metrics = get_metrics()
+        >>> with metrics.time("scrape_event.fighters"):
+        ...     scrape_fighters()
+        >>> metrics.snapshot()["timings"]["scrape_event.fighters"]
+        {"count": 1, "total": 1.84, "last": 1.84, "max": 1.84}
+        """
+
+        self._timings = {}
+        self._gauges = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float) -> None:
+        """Records one timing of name.
+
+        Args:
+            name (str): Timed stage.
+            seconds (float): Duration in seconds.
+        """
+
+        with self._lock:
+            timing = self._timings.setdefault(
+                name, {"count": 0, "total": 0.0, "last": 0.0, "max": 0.0}
+            )
+            timing["count"] += 1
+            timing["total"] += seconds
+            timing["last"] = seconds
+            timing["max"] = max(timing["max"], seconds)
+
+    @contextlib.contextmanager
+    def time(self, name: str):
+        """Records the duration of the with block as a timing of name.
+
+        Args:
+            name (str): Timed stage.
+        """
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """Sets current value of gauge name.
+
+        Args:
+            name (str): Gauge name.
+            value (float): Current value.
+        """
+
+        with self._lock:
+            self._gauges[name] = value
+
+    def get_gauge(self, name: str) -> float | None:
+        """Returns current value of gauge name.
+
+        Args:
+            name (str): Gauge name.
+
+        Returns:
+            float: Current value or None if it was never set.
+        """
+
+        with self._lock:
+            return self._gauges.get(name)
+
+    def snapshot(self) -> dict:
+        """Returns a copy of every timing and gauge.
+
+        Returns:
+            dict: {"timings": {name: {"count", "total", "last", "max"}}, "gauges": {name: value}}
+        """
+
+        with self._lock:
+            return {
+                "timings": {
+                    name: dict(timing) for name, timing in self._timings.items()
+                },
+                "gauges": dict(self._gauges),
+            }
+
+    def reset(self) -> None:
+        """Forgets every timing and gauge."""
+
+        with self._lock:
+            self._timings.clear()
+            self._gauges.clear()
+
+
+_default_metrics = None
+_default_metrics_lock = threading.Lock()
+
+
+def get_metrics() -> Metrics:
+    """Returns metrics shared by every scraper, creating them on first use.
+
+    Returns:
+        Metrics: Shared metrics.
+    """
+
+    global _default_metrics
+
+    if _default_metrics is None:
+        with _default_metrics_lock:
+            if _default_metrics is None:
+                _default_metrics = Metrics()
+
+    return _default_metrics
+
+
+def set_metrics(metrics: Metrics) -> None:
+    """Replaces metrics shared by every scraper.
+
+    Args:
+        metrics (Metrics): Metrics to record to.
+    """
+
+    global _default_metrics
+
+    with _default_metrics_lock:
+        _default_metrics = metrics
@@ -0,0 +1,178 @@
+import re
+import threading
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml
+except ImportError:
+    lxml = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# Fastest first, every backend falls back to the ones after it
+PARSER_BACKENDS = ("selectolax", "lxml", "html.parser")
+
+_parser_backend = None
+_parser_backend_lock = threading.Lock()
+
+
+def available_parser_backends() -> tuple[str, ...]:
+    """Returns parser backends that are installed, fastest first.
+
+    Returns:
+        tuple: Installed parser backends.
+        >>> ("lxml", "html.parser")
+    """
+
+    installed = {
+        "selectolax": LexborHTMLParser is not None,
+        "lxml": lxml is not None,
+        "html.parser": True,
+    }
+
+    return tuple(backend for backend in PARSER_BACKENDS if installed[backend])
+
+
+def get_parser_backend() -> str:
+    """Returns the process wide parser backend, the fastest installed one unless set.
+
+    Returns:
+        str: Parser backend.
+    """
+
+    return _parser_backend or available_parser_backends()[0]
+
+
+def set_parser_backend(backend: str | None) -> None:
+    """Sets the process wide parser backend, None restores the fastest installed one.
+
+    Args:
+        backend (str | None): One of PARSER_BACKENDS.
+    """
+
+    global _parser_backend
+
+    if backend is not None and backend not in PARSER_BACKENDS:
+        raise ValueError(
+            f"Unknown parser backend {backend}, use one of {PARSER_BACKENDS}"
+        )
+
+    with _parser_backend_lock:
+        _parser_backend = backend
+
+
+def resolve_parser_backend(backend: str = None, regions: tuple[str] = None) -> str:
+    """Returns the backend that will parse a page, falling back when backend is not installed.
+
+    selectolax can only feed BeautifulSoup with page regions, without regions it falls back too.
+
+    Args:
+        backend (str, optional): Requested backend. Defaults to the process wide backend.
+        regions (tuple[str], optional): Class name prefixes of the regions the caller reads.
+
+    Returns:
+        str: Installed parser backend.
+    """
+
+    backend = backend or get_parser_backend()
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(
+            f"Unknown parser backend {backend}, use one of {PARSER_BACKENDS}"
+        )
+
+    available = available_parser_backends()
+    for candidate in PARSER_BACKENDS[PARSER_BACKENDS.index(backend) :]:
+        if candidate == "selectolax" and not regions:
+            continue
+        if candidate in available:
+            return candidate
+
+    return "html.parser"
+
+
+def _has_region_class(class_attr: str | None, regions: tuple[str]) -> bool:
+    """Checks if any class in class_attr starts with one of the region prefixes."""
+
+    if not class_attr:
+        return False
+
+    return any(class_name.startswith(regions) for class_name in class_attr.split())
+
+
+def _extract_regions(content: bytes | str, regions: tuple[str]) -> str:
+    """Returns markup of every outermost element with a region class, in page order.
+
+    Args:
+        content (bytes | str): Page content.
+        regions (tuple[str]): Class name prefixes.
+
+    Returns:
+        str: Markup of the regions.
+    """
+
+    tree = LexborHTMLParser(content)
+    selector = ", ".join(f'[class*="{region}"]' for region in regions)
+
+    kept = set()
+    markup = []
+    for node in tree.css(selector):
+        if not _has_region_class(node.attributes.get("class"), regions):
+            continue
+
+        parent = node.parent
+        while parent is not None and parent.mem_id not in kept:
+            parent = parent.parent
+        if parent is not None:
+            continue
+
+        kept.add(node.mem_id)
+        markup.append(node.html)
+
+    return "".join(markup)
+
+
+def _region_strainer(regions: tuple[str]) -> SoupStrainer:
+    """Returns strainer keeping every element with a class starting with one of the region prefixes.
+
+    Args:
+        regions (tuple[str]): Class name prefixes.
+
+    Returns:
+        SoupStrainer: Strainer for the regions.
+    """
+
+    pattern = "|".join(re.escape(region) for region in regions)
+
+    return SoupStrainer(attrs={"class": re.compile(f"^(?:{pattern})")})
+
+
+def create_soup(
+    content: bytes | str, backend: str = None, regions: tuple[str] = None
+) -> BeautifulSoup:
+    """Creates BeautifulSoup object with the configured parser backend.
+
+    When regions are supplied only elements with a class starting with one of them, and everything inside
+    them, make it into the tree. With selectolax the page is parsed by lexbor and only the regions are handed
+    to BeautifulSoup, otherwise the page is parsed with a SoupStrainer.
+
+    Args:
+        content (bytes | str): Page content.
+        backend (str, optional): One of PARSER_BACKENDS. Defaults to the process wide backend.
+        regions (tuple[str], optional): Class name prefixes of the elements the caller reads. Defaults to the whole page.
+
+    Returns:
+        BeautifulSoup: Parsed page.
+    """
+
+    backend = resolve_parser_backend(backend, regions)
+
+    if backend == "selectolax":
+        return BeautifulSoup(_extract_regions(content, regions), "html.parser")
+
+    parse_only = _region_strainer(regions) if regions else None
+
+    return BeautifulSoup(content, backend, parse_only=parse_only)
@@ -1,7 +1,13 @@
+import json
+import os
+import threading
 import pytz
 import requests
 
 from datetime import datetime
+from pathlib import Path
+
+from ufc_data_scraper.transport import Transport, get_transport
 
 
 def convert_date(date: str) -> datetime | None:
@@ -22,35 +28,112 @@ def convert_date(date: str) -> datetime | None:
     return pytz.timezone("GMT").localize(date_obj)
 
 
-def get_incorrect_urls() -> dict | None:
-    """Retrieves the latest incorrect urls from GitHub file.
+def get_cache_dir() -> Path:
+    """Returns directory persistent caches and indexes are stored in.
+
+    Set UFC_DATA_SCRAPER_CACHE_DIR to override it.
 
     Returns:
-        dict: Dictionary of incorrect fighter urls with their correct counterpart.
+        Path: Cache directory, it may not exist yet.
     """
 
-    data_url = "https://raw.githubusercontent.com/HeXeDMinD/ufc-data-scraper/main/src/ufc_data_scraper/data/incorrect_urls.json"
+    cache_dir = os.environ.get("UFC_DATA_SCRAPER_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir).expanduser()
 
-    site_response = requests.get(data_url)
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
 
-    if site_response.status_code != 200:
-        return None
+    return Path(cache_home) / "ufc_data_scraper"
+
+
+CORRECTIONS_URL = "https://raw.githubusercontent.com/HeXeDMinD/ufc-data-scraper/main/src/ufc_data_scraper/data/{}"
 
-    return site_response.json()
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 
+_correction_maps = {}
+_correction_maps_lock = threading.Lock()
 
-def get_incorrect_names() -> dict | None:
-    """Retrieves the latest incorrect names from GitHub file.
+
+def _load_bundled_map(file_name: str) -> dict:
+    """Loads correction map shipped with the package.
+
+    Args:
+        file_name (str): Name of the file in the data directory.
 
     Returns:
-        dict: Dictionary of incorrect fighter names with their correct counterpart.
+        dict: Bundled correction map.
     """
 
-    data_url = "https://raw.githubusercontent.com/HeXeDMinD/ufc-data-scraper/main/src/ufc_data_scraper/data/incorrect_names.json"
+    with open(DATA_DIR / file_name, encoding="utf-8") as data_file:
+        return json.load(data_file)
+
 
-    site_response = requests.get(data_url)
+def _fetch_correction_map(file_name: str, transport: Transport = None) -> dict | None:
+    """Retrieves the latest correction map from GitHub file.
 
-    if site_response.status_code != 200:
+    Args:
+        file_name (str): Name of the file in the data directory.
+        transport (Transport, optional): Transport to request with. Defaults to the shared transport.
+
+    Returns:
+        dict: Correction map or None if it cannot be retrieved.
+    """
+
+    transport = transport or get_transport()
+
+    try:
+        site_response = transport.get(CORRECTIONS_URL.format(file_name))
+        if site_response.status_code != 200:
+            return None
+
+        return site_response.json()
+    except (requests.exceptions.RequestException, ValueError):
         return None
 
-    return site_response.json()
+
+def _get_correction_map(file_name: str, transport: Transport = None) -> dict:
+    """Returns correction map, retrieving it on first use and reusing it for the rest of the process.
+
+    Args:
+        file_name (str): Name of the file in the data directory.
+        transport (Transport, optional): Transport to request with. Defaults to the shared transport.
+
+    Returns:
+        dict: Latest correction map, or the bundled one if GitHub is unreachable.
+    """
+
+    with _correction_maps_lock:
+        if file_name not in _correction_maps:
+            correction_map = _fetch_correction_map(file_name, transport)
+            if correction_map is None:
+                correction_map = _load_bundled_map(file_name)
+
+            _correction_maps[file_name] = correction_map
+
+        return _correction_maps[file_name]
+
+
+def get_incorrect_urls(transport: Transport = None) -> dict:
+    """Retrieves the latest incorrect urls from GitHub file, once per process.
+
+    Args:
+        transport (Transport, optional): Transport to request with. Defaults to the shared transport.
+
+    Returns:
+        dict: Dictionary of incorrect fighter urls with their correct counterpart.
+    """
+
+    return _get_correction_map("incorrect_urls.json", transport)
+
+
+def get_incorrect_names(transport: Transport = None) -> dict:
+    """Retrieves the latest incorrect names from GitHub file, once per process.
+
+    Args:
+        transport (Transport, optional): Transport to request with. Defaults to the shared transport.
+
+    Returns:
+        dict: Dictionary of incorrect fighter names with their correct counterpart.
+    """
+
+    return _get_correction_map("incorrect_names.json", transport)